@@ -0,0 +1,107 @@
+import io
+import os
+import threading
+import unicodedata
+from collections import OrderedDict
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow yoksa küçültme yapılmaz, dosya olduğu gibi sunulur
+    Image = None
+
+# Pilot portreleri ve pist haritaları için görsel önbelleği. Görsel klasörü bir
+# kez taranıp isim -> dosya indeksi çıkarılır (klasörün mtime'ı değişince
+# yeniden taranır). İstenen genişliğe küçültülmüş ve kodlanmış küçük resimler
+# bayt bütçeli bir LRU önbellekte tutulur; dosyanın mtime'ı değişirse kayıt
+# geçersiz sayılır.
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp")
+DEFAULT_CACHE_BYTES = 32 * 1024 * 1024
+
+# Yaygın gösterim genişlikleri (piksel); yüksek DPI ekranlar için 2x
+PORTRAIT_WIDTH = 300
+WIDE_WIDTH = 960
+
+def _key(name):
+    # macOS dosya adları NFD döner; "Ömer", "İstanbul Park" gibi adlar NFC ile eşlenir
+    return unicodedata.normalize("NFC", name)
+
+class AssetManager:
+    def __init__(self, root, max_bytes=DEFAULT_CACHE_BYTES, extensions=IMAGE_EXTENSIONS):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.extensions = extensions
+        self._lock = threading.Lock()
+        self._index = {}
+        self._root_mtime = None
+        self._cache = OrderedDict()
+        self._cache_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    # --- İndeks ---
+    def _refresh(self):
+        try: mtime = os.stat(self.root).st_mtime_ns
+        except OSError: mtime = None
+        if mtime == self._root_mtime: return
+        index = {}
+        if mtime is not None:
+            for entry in os.scandir(self.root):
+                stem, ext = os.path.splitext(entry.name)
+                if ext.lower() in self.extensions and entry.is_file():
+                    index.setdefault(_key(stem), entry.path)
+        self._index = index
+        self._root_mtime = mtime
+
+    def path(self, name):
+        """`name` için görsel dosyasının yolu, yoksa None."""
+        with self._lock:
+            self._refresh()
+            return self._index.get(_key(name))
+
+    def exists(self, name): return self.path(name) is not None
+
+    def names(self):
+        with self._lock:
+            self._refresh()
+            return sorted(self._index)
+
+    # --- Küçük resimler ---
+    def _encode(self, path, width):
+        if Image is None:
+            with open(path, "rb") as f: return f.read()
+        with Image.open(path) as img:
+            img.thumbnail((width, width * 4))
+            out = io.BytesIO()
+            img.save(out, format="PNG" if img.mode in ("RGBA", "LA", "P") else "JPEG", quality=85)
+            return out.getvalue()
+
+    def thumbnail(self, name, width):
+        """`width` pikseli geçmeyecek şekilde küçültülmüş görsel baytları, yoksa None."""
+        path = self.path(name)
+        if path is None: return None
+        try: mtime = os.stat(path).st_mtime_ns
+        except OSError: return None
+        key = (_key(name), width)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == mtime:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached[1]
+        data = self._encode(path, width)
+        with self._lock:
+            self.misses += 1
+            old = self._cache.pop(key, None)
+            if old is not None: self._cache_bytes -= len(old[1])
+            self._cache[key] = (mtime, data)
+            self._cache_bytes += len(data)
+            while self._cache_bytes > self.max_bytes and len(self._cache) > 1:
+                _, (_, evicted) = self._cache.popitem(last=False)
+                self._cache_bytes -= len(evicted)
+        return data
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._cache), "bytes": self._cache_bytes, "hits": self.hits, "misses": self.misses,
+                    "indexed": len(self._index)}
@@ -0,0 +1,129 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from f1_engine import (
+    BASE_DNF_CHANCE, CIRCUIT_DNF_INFLUENCE, CIRCUIT_MASTERY, MASTERY_BOOST, MAX_POWER, POLE_BOOST,
+    POWER_INFLUENCE, QUALY_CHAOS_BASE, QUALY_POWER_MULTIPLIER, RACE_CHAOS_BASE, RACE_POINTS,
+    RAIN_CHANCE, RAIN_MULTIPLIER, SeedStream
+)
+
+# Bu modül `simulate_race_logic` ile aynı modeli R bağımsız yarış için
+# (R, n_pilot) dizileri üzerinde koşturur. Monte Carlo oran hesapları içindir;
+# pilot nesnelerine dokunmaz, sadece sonuç matrisleri döndürür.
+
+# ====================================================================
+# --- I. GRİD DERLEME ---
+# ====================================================================
+
+DEFAULT_CHUNK = 65536
+
+class GridArrays(NamedTuple):
+    qualy_power: np.ndarray
+    dry_power: np.ndarray
+    wet_power: np.ndarray
+    dnf_chance: np.ndarray
+    qualy_chaos: float
+    race_chaos: float
+
+def _column(store, name, rows):
+    return np.frombuffer(getattr(store, name), dtype=np.float64)[rows]
+
+def compile_grid(drivers, circuit):
+    """Pilotların bu pistteki güçlerini skaler yolla birebir aynı formüllerle diziye döker."""
+    store = drivers[0].store if drivers else None
+    if store is not None and all(d.store is store for d in drivers):
+        # Aynı mağazadaki pilotlar için sütunlar doğrudan okunur, nesnelere dokunulmaz
+        rows = np.fromiter((d.row for d in drivers), dtype=np.intp, count=len(drivers)) - store.base
+        boost = np.array([MASTERY_BOOST if circuit.name in CIRCUIT_MASTERY.get(d.name, ()) else 0.0 for d in drivers])
+        speed, handling = _column(store, "speed", rows), _column(store, "handling", rows)
+        braking, intel = _column(store, "braking", rows), _column(store, "intelligence", rows)
+        overall = _column(store, "overall_power", rows)
+        return GridArrays((overall + boost) * QUALY_POWER_MULTIPLIER,
+                          speed + handling + braking + intel + boost,
+                          speed + handling * RAIN_MULTIPLIER + braking + intel * RAIN_MULTIPLIER + boost,
+                          BASE_DNF_CHANCE + ((1 - (overall / MAX_POWER)) * POWER_INFLUENCE) + ((circuit.focus_factor - 1.0) * CIRCUIT_DNF_INFLUENCE),
+                          QUALY_CHAOS_BASE * circuit.focus_factor, RACE_CHAOS_BASE * circuit.focus_factor)
+
+    qualy, dry, wet, dnf = [], [], [], []
+    for d in drivers:
+        has_mastery = d.name in CIRCUIT_MASTERY and circuit.name in CIRCUIT_MASTERY[d.name]
+        boost = MASTERY_BOOST if has_mastery else 0.0
+        dynamic_power = d.overall_power + MASTERY_BOOST if has_mastery else d.overall_power
+        qualy.append(dynamic_power * QUALY_POWER_MULTIPLIER)
+        dry.append(d.speed + d.handling + d.braking + d.intelligence + boost)
+        wet.append(d.speed + d.handling * RAIN_MULTIPLIER + d.braking + d.intelligence * RAIN_MULTIPLIER + boost)
+        dnf.append(BASE_DNF_CHANCE + ((1 - (d.overall_power / MAX_POWER)) * POWER_INFLUENCE) + ((circuit.focus_factor - 1.0) * CIRCUIT_DNF_INFLUENCE))
+    return GridArrays(np.array(qualy), np.array(dry), np.array(wet), np.array(dnf),
+                      QUALY_CHAOS_BASE * circuit.focus_factor, RACE_CHAOS_BASE * circuit.focus_factor)
+
+def as_generator(rng):
+    """None, SeedStream ya da hazır bir numpy Generator kabul eder."""
+    if rng is None: return np.random.default_rng()
+    if isinstance(rng, SeedStream): return rng.numpy()
+    return rng
+
+def points_by_position(n_drivers):
+    """Bitiriş sırasına (0 tabanlı) göre puan vektörü."""
+    return np.array([RACE_POINTS.get(rank, 0) for rank in range(1, n_drivers + 1)], dtype=np.int32)
+
+# ====================================================================
+# --- II. TOPLU YARIŞ MOTORU ---
+# ====================================================================
+
+class BatchResult(NamedTuple):
+    order: np.ndarray        # (R, n) bitiriş sırasına göre pilot indeksleri, DNF'ler en sonda
+    points: np.ndarray       # (R, n) pilot indeksine göre kazanılan puan
+    pole: np.ndarray         # (R,) pole pilotunun indeksi
+    is_rainy: np.ndarray     # (R,) yağmur bayrağı
+    dnf: np.ndarray          # (R, n) DNF maskesi
+    n_finishers: np.ndarray  # (R,) yarışı bitiren pilot sayısı
+
+def _race_chunk(grid, n_races, rng, pts_by_pos):
+    n = grid.qualy_power.shape[0]
+    rows = np.arange(n_races)
+
+    qualy = grid.qualy_power + rng.uniform(-grid.qualy_chaos, grid.qualy_chaos, (n_races, n))
+    pole = qualy.argmax(axis=1)
+
+    is_rainy = rng.random(n_races) < RAIN_CHANCE
+    power = np.where(is_rainy[:, None], grid.wet_power, grid.dry_power)
+    power[rows, pole] += POLE_BOOST
+
+    dnf = rng.random((n_races, n)) < grid.dnf_chance
+    score = power + rng.uniform(-grid.race_chaos, grid.race_chaos, (n_races, n))
+    score[dnf] = -np.inf
+
+    # Kararlı sıralama: eşitlikte ve DNF'lerde skaler yoldaki gibi grid sırası korunur
+    order = np.argsort(-score, axis=1, kind="stable")
+    n_finishers = n - dnf.sum(axis=1)
+    pts_sorted = np.where(np.arange(n) < n_finishers[:, None], pts_by_pos, 0)
+    points = np.empty((n_races, n), dtype=np.int32)
+    np.put_along_axis(points, order, pts_sorted, axis=1)
+    return BatchResult(order, points, pole, is_rainy, dnf, n_finishers)
+
+def simulate_races_batch(drivers, circuit, n_races, rng=None, chunk_size=DEFAULT_CHUNK, grid=None):
+    """Aynı pistte R bağımsız yarışı vektörel olarak simüle eder.
+
+    Pilot nesnelerindeki sayaçlar değişmez; tüm sonuçlar `BatchResult` içinde döner.
+    """
+    rng = as_generator(rng)
+    grid = compile_grid(drivers, circuit) if grid is None else grid
+    pts_by_pos = points_by_position(grid.qualy_power.shape[0])
+    if n_races <= chunk_size:
+        return _race_chunk(grid, n_races, rng, pts_by_pos)
+    parts = [_race_chunk(grid, min(chunk_size, n_races - start), rng, pts_by_pos)
+             for start in range(0, n_races, chunk_size)]
+    return BatchResult(*(np.concatenate(field) for field in zip(*parts)))
+
+def simulate_season_points_batch(drivers, circuits, n_runs, rng=None, start_points=None):
+    """Verilen takvimi R kez baştan sona koşar ve (R, n) sezon sonu puanlarını döndürür."""
+    rng = as_generator(rng)
+    n = len(drivers)
+    totals = np.zeros((n_runs, n), dtype=np.int32)
+    if start_points is not None:
+        totals += np.asarray(start_points, dtype=np.int32)
+    pts_by_pos = points_by_position(n)
+    for circuit in circuits:
+        totals += _race_chunk(compile_grid(drivers, circuit), n_runs, rng, pts_by_pos).points
+    return totals
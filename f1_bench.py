@@ -0,0 +1,216 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+from f1_engine import (
+    SeedStream, all_time_leaderboard, distribute_season_awards, generate_driver_comments,
+    new_league, simulate_race_logic, simulate_season, simulate_seasons, start_new_season_logic
+)
+
+# Sıcak yolların (yarış, ödül, sezon geçişi, yorumlar, tüm zamanlar tablosu)
+# ölçümü. Her ölçümde hazırlık (lig kurma, sezon koşma) süreye dahil değildir;
+# sadece ölçülen çağrı zamanlanır. Çıktı JSON'dur ve bir taban (baseline)
+# dosyasıyla karşılaştırılıp gerilemeler raporlanabilir. Depodaki taban
+# (bench/baseline.json) `--quick` matrisiyle üretilir. Süreler makineye bağlı
+# olduğundan motor hızlandığında ya da başka bir makinede aynı komutla yenilenir:
+#
+#   python f1_bench.py --quick --json bench/baseline.json
+#
+#   python f1_bench.py                          # tüm matris, tabloyu yazar
+#   python f1_bench.py --json out.json          # makinece okunur çıktı
+#   python f1_bench.py --quick --compare        # depodaki tabanla; gerileme varsa çıkış kodu 1
+#   python f1_bench.py --compare base.json      # başka bir tabanla
+#   python f1_bench.py --quick --only race      # küçük matris, tek ölçüm
+
+GRID_SIZES = (10, 100, 1000, 10000)
+SEASON_COUNTS = (1, 10, 100, 500)
+QUICK_GRID_SIZES = (10, 100, 1000)
+QUICK_SEASON_COUNTS = (1, 10, 50)
+
+BENCH_SEED = 2025
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench", "baseline.json")
+
+# ====================================================================
+# --- I. LİG KURULUMU ---
+# ====================================================================
+
+def synthetic_pilots(n_drivers, seed=BENCH_SEED):
+    """Varsayılan gridin özellik aralığında, tekrarlanabilir n pilotluk grid."""
+    rng = random.Random(seed)
+    return [(f"Pilot_{i}", rng.randint(4, 10), rng.randint(4, 10), rng.randint(4, 10), rng.randint(4, 10))
+            for i in range(n_drivers)]
+
+def bench_league(n_drivers=10, seed=BENCH_SEED):
+    """n pilotluk lig; takım başına iki pilot. 10 pilotta varsayılan grid kullanılır."""
+    if n_drivers == 10: return new_league(seed=seed)
+    team_names = [f"Takım_{i}" for i in range((n_drivers + 1) // 2)]
+    return new_league(pilots=synthetic_pilots(n_drivers, seed), team_names=team_names, seed=seed)
+
+def finished_league(n_drivers=10, seasons=1, seed=BENCH_SEED):
+    """`seasons` sezonu koşulmuş ve son sezonu bitmiş (ödül ekranındaki) lig."""
+    return simulate_seasons(bench_league(n_drivers, seed), seasons)
+
+# ====================================================================
+# --- II. ÖLÇÜMLER ---
+# ====================================================================
+
+def _measure(setup, fn, repeat):
+    """Her tekrarda `setup()` taze durum üretir, sadece `fn(durum)` zamanlanır.
+    timeit gibi ölçüm sırasında çöp toplayıcı kapatılır."""
+    times = []
+    for _ in range(repeat):
+        state = setup()
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            fn(state)
+            times.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return times
+
+def _repeat_for(size, base):
+    # Büyük grid / uzun tarihçede tekrar sayısı azaltılır, toplam süre makul kalır
+    return max(1, base // max(1, size // 100))
+
+def bench_race(n_drivers, repeat):
+    league = bench_league(n_drivers)
+    circuit = league.circuits[0]
+    seq = iter(range(1 << 30))
+    return _measure(lambda: SeedStream(BENCH_SEED, ("bench", next(seq))),
+                    lambda rng: simulate_race_logic(league.drivers, circuit, rng=rng), repeat)
+
+def bench_awards(n_drivers, repeat):
+    return _measure(lambda: finished_league(n_drivers), distribute_season_awards, repeat)
+
+def bench_new_season(n_drivers, repeat):
+    return _measure(lambda: finished_league(n_drivers), start_new_season_logic, repeat)
+
+def bench_comments(n_drivers, repeat):
+    league = finished_league(n_drivers)
+    return _measure(lambda: league.stream("bench", "comments").random(),
+                    lambda rng: generate_driver_comments(league.drivers, league.power_rank_map, rng=rng,
+                                                         standings=league.standings), repeat)
+
+def _all_leaderboards(league):
+    for key in ("career_titles", "career_wins", "career_poles", "career_podiums"):
+        all_time_leaderboard(league, key)
+    all_time_leaderboard(league, "career_dnfs")
+
+def bench_leaderboard(n_drivers, repeat):
+    league = finished_league(n_drivers)
+    return _measure(lambda: league, _all_leaderboards, repeat)
+
+def bench_leaderboard_history(seasons, repeat):
+    # Emekli pilotlar sezonlarla birikir; tablo tüm zamanların pilotlarını tarar
+    league = finished_league(seasons=seasons)
+    return _measure(lambda: league, _all_leaderboards, repeat)
+
+def bench_season_loop(seasons, repeat):
+    return _measure(bench_league, lambda league: simulate_seasons(league, seasons), repeat)
+
+def bench_season_races(n_drivers, repeat):
+    return _measure(lambda: bench_league(n_drivers), simulate_season, repeat)
+
+# (ad, parametre adı, fonksiyon, grid mi sezon mu, taban tekrar sayısı)
+BENCHMARKS = (
+    ("race", "drivers", bench_race, "grid", 200),
+    ("season_races", "drivers", bench_season_races, "grid", 10),
+    ("awards", "drivers", bench_awards, "grid", 20),
+    ("new_season", "drivers", bench_new_season, "grid", 20),
+    ("comments", "drivers", bench_comments, "grid", 50),
+    ("leaderboard", "drivers", bench_leaderboard, "grid", 50),
+    ("leaderboard_history", "seasons", bench_leaderboard_history, "seasons", 50),
+    ("season_loop", "seasons", bench_season_loop, "seasons", 3),
+)
+
+def run_suite(only=None, quick=False, grid_sizes=None, season_counts=None, progress=None):
+    grid_sizes = grid_sizes or (QUICK_GRID_SIZES if quick else GRID_SIZES)
+    season_counts = season_counts or (QUICK_SEASON_COUNTS if quick else SEASON_COUNTS)
+    results = []
+    for name, param, fn, axis, base_repeat in BENCHMARKS:
+        if only and name not in only: continue
+        for value in (grid_sizes if axis == "grid" else season_counts):
+            repeat = _repeat_for(value, base_repeat)
+            times = fn(value, repeat)
+            result = {"name": name, "params": {param: value}, "repeat": len(times),
+                      "min": min(times), "median": statistics.median(times), "mean": statistics.fmean(times)}
+            results.append(result)
+            if progress: progress(result)
+    return results
+
+# ====================================================================
+# --- III. ÇIKTI VE KARŞILAŞTIRMA ---
+# ====================================================================
+
+def result_key(result):
+    return result["name"] + "[" + ",".join(f"{k}={v}" for k, v in sorted(result["params"].items())) + "]"
+
+def report(results):
+    return {
+        "meta": {"python": platform.python_version(), "platform": platform.platform(),
+                 "created": time.strftime("%Y-%m-%dT%H:%M:%S"), "seed": BENCH_SEED},
+        "results": results,
+    }
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD, metric="min"):
+    """Tabanla ortak ölçümler için (anahtar, taban, yeni, oran, gerileme mi) listesi.
+    Varsayılan ölçüt, gürültüden en az etkilenen en iyi (min) süredir."""
+    base = {result_key(r): r for r in baseline["results"]}
+    rows = []
+    for r in results:
+        old = base.get(result_key(r))
+        if old is None or old[metric] <= 0: continue
+        ratio = r[metric] / old[metric]
+        rows.append((result_key(r), old[metric], r[metric], ratio, ratio > 1.0 + threshold))
+    return rows
+
+def _fmt_time(seconds):
+    if seconds < 1e-3: return f"{seconds * 1e6:9.1f} µs"
+    if seconds < 1.0: return f"{seconds * 1e3:9.2f} ms"
+    return f"{seconds:9.3f} s "
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="F1 simülatörü sıcak yol ölçümleri")
+    parser.add_argument("--json", metavar="PATH", help="sonuçları JSON olarak yaz ('-' = stdout)")
+    parser.add_argument("--compare", metavar="BASELINE", nargs="?", const=DEFAULT_BASELINE,
+                        help="taban JSON dosyasıyla karşılaştır (dosya verilmezse bench/baseline.json)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="gerileme eşiği (0.10 = %%10)")
+    parser.add_argument("--metric", choices=("min", "median", "mean"), default="min", help="karşılaştırma ölçütü")
+    parser.add_argument("--only", nargs="+", choices=[b[0] for b in BENCHMARKS], help="sadece bu ölçümler")
+    parser.add_argument("--quick", action="store_true", help="küçük matris (grid ≤ 1000, sezon ≤ 50)")
+    parser.add_argument("--grid-sizes", type=int, nargs="+", help="grid boyutlarını geçersiz kıl")
+    parser.add_argument("--seasons", type=int, nargs="+", help="sezon sayılarını geçersiz kıl")
+    args = parser.parse_args(argv)
+
+    log = sys.stderr if args.json == "-" else sys.stdout
+    progress = lambda r: print(f"{result_key(r):<40} {_fmt_time(r['median'])}  (min {_fmt_time(r['min']).strip()}, n={r['repeat']})", file=log)
+    results = run_suite(only=args.only, quick=args.quick, grid_sizes=args.grid_sizes,
+                        season_counts=args.seasons, progress=progress)
+
+    if args.json == "-":
+        json.dump(report(results), sys.stdout, indent=2)
+    elif args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report(results), f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows = compare(results, baseline, args.threshold, args.metric)
+        print(f"\n{'ölçüm':<40} {'taban':>12} {'yeni':>12} {'oran':>7}", file=log)
+        for key, old, new, ratio, regressed in rows:
+            print(f"{key:<40} {_fmt_time(old)} {_fmt_time(new)} {ratio:6.2f}x{'  ⚠️ GERİLEME' if regressed else ''}", file=log)
+        if any(row[4] for row in rows): return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+from f1_engine import CareerLeaderboards, SeedStream, run_next_race, start_new_season_logic
+
+# "Ya şöyle olsaydı?" dalları. Ana zaman çizgisinin her yarıştan önceki hali
+# bir kontrol noktası (checkpoint) olarak saklanır; bir dal, bu noktalardan
+# birinden (ya da ana çizginin şu anından) `League.fork` ile açılır ve kendi
+# tohumuyla ilerler. Çatallar geçmişi paylaştığı için yüzlerce dal bellekte
+# tutulabilir. Bir dal istenirse ana zaman çizgisi yapılır (`promote`).
+#
+#   manager = BranchManager(league)
+#   manager.checkpoint()                  # her yarıştan önce
+#   manager.fork("Monaco tekrar", at=(2031, 6))
+#   manager.advance("Monaco tekrar", 14)  # sezon sonuna kadar
+#   manager.compare()
+
+MAIN = "Ana"
+
+class Branch:
+    __slots__ = ("name", "league", "origin")
+    def __init__(self, name, league, origin):
+        self.name = name
+        self.league = league
+        self.origin = origin  # (yıl, yarış): dalın ayrıldığı an
+
+def branch_seed(league, name):
+    """Dalın tohumu; aynı noktadan aynı isimle açılan dal aynı geleceği yazar."""
+    return SeedStream(league.seed, ("branch", league.current_year, league.current_race_idx, name)).seed_int() & 0xFFFFFFFF
+
+class BranchManager:
+    """Ana zaman çizgisi, güncel sezonun kontrol noktaları ve dallar."""
+    def __init__(self, main):
+        self.main = main
+        self.branches = {}
+        self._checkpoints = {}
+
+    # --- Kontrol noktaları ---
+    def checkpoint(self):
+        """Ana çizginin şimdiki halini (sıradaki yarıştan önce) saklar. Sadece
+        güncel sezonun noktaları tutulur; sezon değişince eskiler bırakılır."""
+        key = (self.main.current_year, self.main.current_race_idx)
+        if any(year != key[0] for year, _ in self._checkpoints): self._checkpoints.clear()
+        if key not in self._checkpoints: self._checkpoints[key] = self.main.fork()
+        return key
+
+    def checkpoints(self):
+        """[(yıl, yarış, pist adı)], yarış sırasıyla."""
+        return [(year, race, snap.circuits[race].name if race < len(snap.circuits) else None)
+                for (year, race), snap in sorted(self._checkpoints.items())]
+
+    # --- Dallar ---
+    def fork(self, name, at=None, seed=None):
+        """`at=(yıl, yarış)` kontrol noktasından (verilmezse ana çizginin şimdiki
+        halinden) yeni dal. Tohum verilmezse isimden türetilir."""
+        if name == MAIN or name in self.branches: raise ValueError(f"Bu isimde bir dal zaten var: {name}")
+        source = self.main if at is None else self._checkpoints[tuple(at)]
+        league = source.fork(seed=branch_seed(source, name) if seed is None else seed)
+        branch = self.branches[name] = Branch(name, league, (source.current_year, source.current_race_idx))
+        return branch
+
+    def advance(self, name, n_races):
+        """Dalda `n_races` yarış koşar; sezon bitince yeni sezona geçer."""
+        league = self.branches[name].league
+        for _ in range(n_races):
+            if league.season_finished: start_new_season_logic(league)
+            run_next_race(league)
+        return league
+
+    def drop(self, name): del self.branches[name]
+
+    def promote(self, name, keep_main_as=None):
+        """Dalı ana zaman çizgisi yapar. Kontrol noktaları eski çizgiye ait olduğu
+        için bırakılır; `keep_main_as` verilirse eski ana çizgi o isimle dal olur."""
+        branch = self.branches.pop(name)
+        if keep_main_as is not None:
+            self.branches[keep_main_as] = Branch(keep_main_as, self.main, branch.origin)
+        self.main = branch.league
+        self._checkpoints.clear()
+        return self.main
+
+    def timelines(self):
+        """[(isim, lig, ayrılış)]: önce ana çizgi, sonra dallar açılış sırasıyla."""
+        return [(MAIN, self.main, None)] + [(b.name, b.league, b.origin) for b in self.branches.values()]
+
+    # --- Karşılaştırma ---
+    def compare(self):
+        """Zaman çizgisi başına özet satırları (lider, şampiyonlar)."""
+        rows = []
+        for name, league, origin in self.timelines():
+            leader = league.standings.leader() if len(league.standings) else None
+            hall = league.hall_of_fame
+            # Dalın ayrıldığı sezondan sonraki şampiyonlar (ana çizgi için son 5)
+            since = origin[0] if origin is not None else league.current_year - 5
+            champions = [f"{h['Yıl']}: {h['Şampiyon']}" for h in hall[max(0, len(hall) - (league.current_year - since)):]]
+            rows.append({"Dal": name, "Ayrılış": "-" if origin is None else f"{origin[0]} / {origin[1] + 1}. yarış",
+                         "Sezon": league.current_year, "Yarış": f"{league.current_race_idx}/{len(league.circuits)}",
+                         "Lider": leader.name if leader else "-", "Lider Puanı": leader.season_points if leader else 0,
+                         "Şampiyonlar": ", ".join(champions) or "-"})
+        return rows
+
+    def compare_drivers(self, metric="career_titles", k=10):
+        """Tüm zamanlar `metric` tablosunun ilk k pilotu, zaman çizgisi başına değerleriyle.
+        Pilotlar satır numarasıyla eşlenir (ayrılıştan önceki pilotlar tüm dallarda ortaktır)."""
+        if metric not in CareerLeaderboards.METRICS + ("career_dnfs",): raise ValueError(metric)
+        table = {}
+        for name, league, _ in self.timelines():
+            for entry in league.leaderboards.top(metric, k):
+                table.setdefault((entry.row, entry.name), {})[name] = entry.value
+        names = [name for name, _, _ in self.timelines()]
+        rows = [dict({"Pilot": pilot}, **{n: values.get(n) for n in names}) for (_, pilot), values in table.items()]
+        # Herhangi bir çizgideki en iyi değere göre (DNF'de en az)
+        best = lambda r: [v for n, v in r.items() if n != "Pilot" and v is not None]
+        if metric == "career_dnfs": return sorted(rows, key=lambda r: min(best(r)))
+        return sorted(rows, key=lambda r: max(best(r)), reverse=True)
@@ -0,0 +1,253 @@
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import NamedTuple
+
+import numpy as np
+
+from f1_engine import (
+    INITIAL_ROOKIE_POOL, PILOT_VERILERI, TEAM_NAMES, SeedStream, new_league, simulate_seasons, start_new_season_logic
+)
+
+# Hanedan (dynasty) simülatörü: varsayılan grid, pist listesi ve çaylak
+# havuzuyla başlayan binlerce bağımsız evreni çok sezon boyunca paralel koşar.
+# Her evren tam motorla (`simulate_seasons`) oynanır; işçiler sonuçları
+# ortak bellekteki (shared_memory) dizilere kendi satırlarına yazar, sürece
+# nesne grafı taşınmaz. Evren i'nin tohumu kök tohumdan türetilir, yani sonuç
+# işçi sayısından bağımsızdır ve ilginç bir evren arayüzde aynı tohumla
+# yeniden açılabilir.
+#
+#   python f1_dynasty.py --universes 2000 --seasons 30
+#   python f1_dynasty.py --universes 500 --seasons 50 --json sonuc.json
+
+DEFAULT_UNIVERSES = 1000
+DEFAULT_SEASONS = 30
+JOBS_PER_WORKER = 8
+
+# Takip edilen pilotlar: başlangıç gridi ve çaylak havuzu. Havuz bitince gelen
+# "Genç_xxx" pilotları tek bir "Diğer" sütununda toplanır.
+TRACKED_NAMES = tuple(dict.fromkeys([p[0] for p in PILOT_VERILERI] + [p[0] for p in INITIAL_ROOKIE_POOL]))
+OTHER = "Diğer"
+NOT_RETIRED = -1
+
+# (alan, dtype, ikinci boyut) — ikinci boyut: pilot (+ Diğer), pilot veya takım sayısı
+FIELDS = (
+    ("titles", np.int16, "drivers"),
+    ("wins", np.int32, "drivers"),
+    ("retire_age", np.int16, "tracked"),
+    ("team_titles", np.int16, "teams"),
+    ("leader", np.int16, None),
+)
+
+class DynastyResults(NamedTuple):
+    """Evren başına sonuçlar; satır i, `seeds[i]` tohumlu evrendir.
+
+    titles / wins: (evren, pilot + Diğer) kariyer şampiyonluk ve galibiyetleri (aynı isimli kayıtlar toplanır)
+    retire_age: (evren, pilot) emekli olduğu sezon sayısı, emekli olmadıysa -1 (kovulma emeklilik değildir)
+    team_titles: (evren, takım) şampiyonluklar
+    leader: (evren,) tüm zamanlar şampiyonluk liderinin `names` indeksi
+    """
+    names: tuple
+    teams: tuple
+    seasons: int
+    seeds: np.ndarray
+    titles: np.ndarray
+    wins: np.ndarray
+    retire_age: np.ndarray
+    team_titles: np.ndarray
+    leader: np.ndarray
+
+    @property
+    def n_universes(self): return len(self.seeds)
+
+# ====================================================================
+# --- I. TEK EVREN ---
+# ====================================================================
+
+def universe_seed(seed, index):
+    """Evren `index`in lig tohumu (arayüzdeki 32 bitlik tohum alanına sığar)."""
+    return SeedStream(seed, ("dynasty", index)).seed_int() & 0xFFFFFFFF
+
+def run_universe(league_seed, n_seasons, title_only=False):
+    """`n_seasons` sezonu ödülleri ve transferleriyle birlikte tamamlanmış lig.
+
+    `title_only=True` ise sadece son sezon şampiyonluk kesinleşince kesilir (bkz.
+    `simulate_season`). Ara sezonlar tam koşulur: kesilen sezonun puanları
+    kovulmaları, galibiyetleri de kadro gelişimini değiştirir ve sonraki
+    şampiyonları saptırırdı. Son sezonun galibiyetleri o zaman yaklaşıktır."""
+    league = new_league(seed=league_seed)
+    simulate_seasons(league, max(0, n_seasons - 1))
+    simulate_seasons(league, min(1, n_seasons), until_clinched=title_only)
+    # Son sezonun şampiyonluğu ve emeklilikleri sezon geçişinde işlenir
+    start_new_season_logic(league)
+    return league
+
+def record_outcome(league, out, i):
+    """Ligin sonuçlarını `out` dizilerinin i. satırına yazar."""
+    name_idx = {name: k for k, name in enumerate(TRACKED_NAMES)}
+    other = len(TRACKED_NAMES)
+    titles, wins, retire_age = out["titles"][i], out["wins"][i], out["retire_age"][i]
+    titles[:] = 0
+    wins[:] = 0
+    retire_age[:] = NOT_RETIRED
+    for d in league.all_drivers():
+        k = name_idx.get(d.name, other)
+        titles[k] += d.career_titles
+        wins[k] += d.career_wins
+    for r in league.retired_drivers:
+        k = name_idx.get(r.name)
+        # Emeklilik kovulmadan önce kontrol edildiği için süresi dolmuş kayıt emeklidir
+        if k is not None and retire_age[k] == NOT_RETIRED and r.seasons_raced >= r.retirement_deadline:
+            retire_age[k] = r.seasons_raced
+    team_titles = out["team_titles"][i]
+    team_titles[:] = 0
+    team_idx = {name: j for j, name in enumerate(TEAM_NAMES)}
+    for entry in league.hall_of_fame:
+        team_titles[team_idx[entry["Takım"]]] += 1
+    leader = league.leaderboards.top("career_titles", 1)
+    out["leader"][i] = name_idx.get(leader[0].name, other) if leader else other
+
+# ====================================================================
+# --- II. ORTAK BELLEK VE İŞÇİLER ---
+# ====================================================================
+
+def _shape(kind, n_universes):
+    width = {"drivers": len(TRACKED_NAMES) + 1, "tracked": len(TRACKED_NAMES), "teams": len(TEAM_NAMES)}.get(kind)
+    return (n_universes,) if width is None else (n_universes, width)
+
+def _views(blocks, n_universes):
+    return {field: np.ndarray(_shape(kind, n_universes), dtype=dtype, buffer=blocks[field].buf)
+            for field, dtype, kind in FIELDS}
+
+def _run_chunk(block_names, n_universes, start, seeds, n_seasons, title_only=False):
+    """İşçi: `start`tan itibaren `seeds` evrenlerini koşar, sonuçları ortak belleğe yazar."""
+    # spawn ile başlayan işçiler ana sürecin kaynak izleyicisini paylaşır; bloğu
+    # silme (unlink) işi ana sürece aittir, işçi sadece bağlanıp kapatır
+    blocks = {field: shared_memory.SharedMemory(name=name) for field, name in block_names.items()}
+    try:
+        out = _views(blocks, n_universes)
+        for offset, league_seed in enumerate(seeds):
+            record_outcome(run_universe(int(league_seed), n_seasons, title_only), out, start + offset)
+        del out
+    finally:
+        for shm in blocks.values(): shm.close()
+    return len(seeds)
+
+def default_workers(): return max(1, os.cpu_count() or 1)
+
+def simulate_dynasties(n_universes=DEFAULT_UNIVERSES, n_seasons=DEFAULT_SEASONS, seed=0, workers=None, progress=None,
+                       title_only=False):
+    """`n_universes` bağımsız evreni `n_seasons` sezon koşar. `progress(biten, toplam)`
+    her iş parçası bittiğinde çağrılır."""
+    workers = default_workers() if workers is None else workers
+    seeds = np.array([universe_seed(seed, i) for i in range(n_universes)], dtype=np.uint32)
+    n_jobs = min(n_universes, max(1, workers * JOBS_PER_WORKER))
+    bounds = [n_universes * j // n_jobs for j in range(n_jobs + 1)]
+
+    blocks = {}
+    try:
+        for field, dtype, kind in FIELDS:
+            size = max(1, int(np.prod(_shape(kind, n_universes))) * np.dtype(dtype).itemsize)
+            blocks[field] = shared_memory.SharedMemory(create=True, size=size)
+        block_names = {field: shm.name for field, shm in blocks.items()}
+        jobs = [(block_names, n_universes, lo, seeds[lo:hi], n_seasons, title_only) for lo, hi in zip(bounds, bounds[1:])]
+
+        done = 0
+        if workers <= 1 or n_jobs == 1:
+            for job in jobs:
+                done += _run_chunk(*job)
+                if progress: progress(done, n_universes)
+        else:
+            # Streamlit sunucusu çok iş parçacıklı olduğu için fork yerine spawn
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+                for future in as_completed([pool.submit(_run_chunk, *job) for job in jobs]):
+                    done += future.result()
+                    if progress: progress(done, n_universes)
+        out = {field: view.copy() for field, view in _views(blocks, n_universes).items()}
+    finally:
+        for shm in blocks.values():
+            shm.close()
+            shm.unlink()
+    return DynastyResults(TRACKED_NAMES + (OTHER,), tuple(TEAM_NAMES), n_seasons, seeds, **out)
+
+# ====================================================================
+# --- III. ÖZETLER ---
+# ====================================================================
+
+def driver_summary(results):
+    """Pilot başına: ortalama şampiyonluk, tüm zamanlar lideri olma oranı,
+    ortalama galibiyet ve medyan emeklilik sezonu; lider olma oranına göre sıralı."""
+    n = results.n_universes
+    leader_share = np.bincount(results.leader, minlength=len(results.names)) / max(1, n)
+    rows = []
+    for k, name in enumerate(results.names):
+        ages = results.retire_age[:, k] if k < results.retire_age.shape[1] else np.empty(0)
+        ages = ages[ages != NOT_RETIRED]
+        rows.append({"Pilot": name,
+                     "Ort. Şampiyonluk": float(results.titles[:, k].mean()) if n else 0.0,
+                     "Lider %": float(leader_share[k] * 100),
+                     "Ort. Galibiyet": float(results.wins[:, k].mean()) if n else 0.0,
+                     "Medyan Emeklilik": float(np.median(ages)) if len(ages) else None})
+    return sorted(rows, key=lambda r: (r["Lider %"], r["Ort. Şampiyonluk"]), reverse=True)
+
+def team_summary(results):
+    """Takım başına: şampiyonluk payı ve evrenin en çok şampiyonluk kazanan takımı olma oranı."""
+    n = results.n_universes
+    total = results.team_titles.sum()
+    # Eşitlikte listedeki ilk takım (argmax) sayılır
+    dominant = np.bincount(results.team_titles.argmax(axis=1), minlength=len(results.teams)) if n else np.zeros(len(results.teams))
+    rows = [{"Takım": team, "Şampiyonluk Payı %": float(results.team_titles[:, j].sum() / max(1, total) * 100),
+             "En Baskın %": float(dominant[j] / max(1, n) * 100)} for j, team in enumerate(results.teams)]
+    return sorted(rows, key=lambda r: r["Şampiyonluk Payı %"], reverse=True)
+
+def _fmt(value):
+    if value is None: return "-"
+    return f"{value:.2f}" if isinstance(value, float) else str(value)
+
+def _print_table(rows, file):
+    headers = list(rows[0])
+    widths = [max(len(h), *(len(_fmt(r[h])) for r in rows)) for h in headers]
+    print("  ".join(h.ljust(w) for h, w in zip(headers, widths)), file=file)
+    for r in rows:
+        print("  ".join(_fmt(r[h]).ljust(w) for h, w in zip(headers, widths)), file=file)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Paralel hanedan (çok sezonluk evren) simülasyonu")
+    parser.add_argument("--universes", type=int, default=DEFAULT_UNIVERSES, help="evren sayısı")
+    parser.add_argument("--seasons", type=int, default=DEFAULT_SEASONS, help="evren başına sezon sayısı")
+    parser.add_argument("--seed", type=int, default=0, help="kök tohum")
+    parser.add_argument("--workers", type=int, default=None, help="işçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument("--json", metavar="PATH", help="özetleri JSON olarak yaz ('-' = stdout)")
+    parser.add_argument("--title-only", action="store_true", help="şampiyonluk kesinleşince son sezonun kalanını atla (son sezonun galibiyetleri yaklaşık olur)")
+    args = parser.parse_args(argv)
+
+    log = sys.stderr if args.json == "-" else sys.stdout
+    start = time.perf_counter()
+    progress = lambda done, total: print(f"\r{done}/{total} evren", end="", file=sys.stderr)
+    results = simulate_dynasties(args.universes, args.seasons, seed=args.seed, workers=args.workers, progress=progress,
+                                 title_only=args.title_only)
+    elapsed = time.perf_counter() - start
+    print(file=sys.stderr)
+
+    drivers, teams = driver_summary(results), team_summary(results)
+    print(f"{results.n_universes} evren x {results.seasons} sezon, {elapsed:.1f} sn\n", file=log)
+    _print_table(drivers, log)
+    print(file=log)
+    _print_table(teams, log)
+
+    if args.json:
+        report = {"universes": results.n_universes, "seasons": results.seasons, "seed": args.seed,
+                  "drivers": drivers, "teams": teams}
+        if args.json == "-": json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+        else:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1573 @@
+import bisect
+import hashlib
+import heapq
+import json
+import random
+import sqlite3
+import struct
+import zlib
+from array import array
+from collections import ChainMap, deque, namedtuple
+from itertools import chain, islice
+
+from f1_profiling import count, phase
+
+# Bu modül simülasyonun UI'dan bağımsız çekirdeğidir. Streamlit, pandas veya
+# plotly içe aktarılmaz; toplu işler ve testler yalnızca bu dosyayı kullanır.
+
+# ====================================================================
+# --- I. SINIF TANIMLARI ---
+# ====================================================================
+
+VETERANS_LIST = ["Kayra", "Ahmet", "Yağız", "Kaan"]
+
+# TARİHİ PİSTLER VE LAKAPLARI
+HISTORIC_TRACK_TITLES = {
+    "Spa-Francorchamps": "🌧️ Yağmurlu Düzlüklerin Kralı",
+    "Silverstone": "🇬🇧 Tarihi Pistin Sahibi",
+    "Interlagos": "🇧🇷 Son Yağmur Bükücü",
+    "Monaco": "💎 Sürüş Dehası",
+    "Monza": "🚀 Hız Tapınağının Ustası"
+}
+
+# TRANSFER HAVUZU
+INITIAL_ROOKIE_POOL = [
+    ("Yavuz", 6, 5, 6, 5), ("Furkan", 5, 5, 5, 5), ("Enes", 6, 4, 5, 5),
+    ("Deniz", 4, 5, 4, 6), ("Eren", 5, 5, 4, 6), ("Ayberk", 6, 6, 6, 7),
+    ("Kerem", 4, 4, 5, 3)
+]
+
+class DriverStore:
+    """Pilot verilerini sütun bazlı tipli dizilerde tutar (struct-of-arrays).
+
+    Her pilot bir satırdır; `Driver` nesneleri bu satırlara bakan ince görünümlerdir.
+    Satır numarası pilot kimliğidir ve değişmez. Emekli pilotların nesne
+    sütunları ve görünümü `release` ile bırakılır, özetleri `RetiredDriver`dadır;
+    baştaki emekli satırlar `compact` ile tamamen silinir. Mağaza `base`
+    satırından başlar: sütunlardaki i. eleman `base + i` numaralı pilottur.
+    """
+    FLOAT_COLUMNS = ("speed", "handling", "braking", "intelligence", "overall_power")
+    INT_COLUMNS = ("seasons_raced", "bad_seasons_streak", "retirement_deadline",
+                   "season_points", "wins", "poles", "podiums", "dnfs",
+                   "career_races", "career_wins", "career_poles", "career_podiums", "career_dnfs", "career_titles")
+    OBJECT_COLUMNS = ("name", "team", "category", "achievement_codes", "specific_race_wins")
+
+    def __init__(self, base=0):
+        for col in self.FLOAT_COLUMNS: setattr(self, col, array("d"))
+        for col in self.INT_COLUMNS: setattr(self, col, array("q"))
+        for col in self.OBJECT_COLUMNS: setattr(self, col, [])
+        self.views = []
+        self.by_name = {}
+        self.standings = None
+        self.leaderboards = None
+        # Özellikler her değiştiğinde artar (bkz. `Driver.update_overall`); oran önbellekleri için
+        self.version = 0
+        # Özellikleri değişen satırlar; güç tablosu bir sonraki okumada bunları yeniler
+        self.dirty = set()
+        self.power_table = None
+        self.base = base
+
+    def __len__(self): return len(self.views)
+
+    def allocate(self, view):
+        for col in self.FLOAT_COLUMNS: getattr(self, col).append(0.0)
+        for col in self.INT_COLUMNS: getattr(self, col).append(0)
+        for col in self.OBJECT_COLUMNS: getattr(self, col).append(None)
+        self.views.append(view)
+        return len(self.views) - 1
+
+    def find(self, name):
+        """İsme göre en son eklenen aktif pilot (aynı isimle geri dönen pilotlar için güncel kayıt)."""
+        row = self.by_name.get(name)
+        return None if row is None else self.views[row]
+
+    def powers(self):
+        """Bu mağazanın pilot × pist güç tablosu (bkz. `PowerTable`)."""
+        if self.power_table is None: self.power_table = PowerTable(self)
+        return self.power_table
+
+    def release(self, row):
+        """Emekli satırın ödül/pist sütunlarını ve görünümünü bırakır."""
+        i = row - self.base
+        self.achievement_codes[i] = None
+        self.specific_race_wins[i] = None
+        self.views[i] = None
+        name = self.name[i]
+        if self.by_name.get(name) == i: del self.by_name[name]
+
+    def compact(self):
+        """En eski aktif satırdan önceki (hepsi emekli) satırları siler ve `base`i ilerletir.
+
+        Bu satırların tek sahibi artık `RetiredDriver` kayıtlarıdır; mağaza
+        geçmişin uzunluğuyla değil gridin kariyer süresiyle sınırlı kalır.
+        Bırakılmış görünümler (`release`) silinen satırlara bakmaya devam
+        edeceği için çağrıdan sonra kullanılmamalıdır."""
+        start = next((i for i, view in enumerate(self.views) if view is not None), len(self.views))
+        if not start: return 0
+        for col in self.FLOAT_COLUMNS + self.INT_COLUMNS + self.OBJECT_COLUMNS:
+            del getattr(self, col)[:start]
+        del self.views[:start]
+        for view in self.views:
+            if view is not None: view._idx -= start
+        self.by_name = {name: i - start for name, i in self.by_name.items() if i >= start}
+        self.dirty = {i - start for i in self.dirty if i >= start}
+        # Güç tablosu yerel satırlarla anahtarlıdır; bir sonraki okumada yeniden kurulur
+        self.power_table = None
+        self.base += start
+        return start
+
+    def fork(self, drivers):
+        """`drivers` (aktif grid) için bağımsız bir mağaza.
+
+        Sadece en eski aktif pilotun satırından itibaren olan pencere kopyalanır;
+        daha eski satırların hepsi emeklidir ve `RetiredDriver` kayıtlarında
+        donmuştur. Pencere gridin kariyer süresiyle sınırlıdır, geçmişin
+        uzunluğundan bağımsızdır. Ödül listeleri ve pist sözlükleri sadece aktif
+        satırlar için kopyalanır (diğerleri `release` ile bırakılmıştır)."""
+        start = min((d.row for d in drivers), default=self.base + len(self)) - self.base
+        store = DriverStore(self.base + start)
+        for col in self.FLOAT_COLUMNS + self.INT_COLUMNS + ("name", "team", "category"):
+            setattr(store, col, getattr(self, col)[start:])
+        store.achievement_codes = [None if c is None else list(c) for c in self.achievement_codes[start:]]
+        store.specific_race_wins = [None if w is None else dict(w) for w in self.specific_race_wins[start:]]
+        store.views = [None] * (len(self.views) - start)
+        for d in drivers:
+            view = object.__new__(Driver)
+            view._store, view._idx = store, d.row - store.base
+            store.views[view._idx] = view
+        store.by_name = {name: i - start for name, i in self.by_name.items() if i >= start}
+        store.version = self.version
+        return store
+
+class _Column:
+    """`Driver` özniteliğini mağazadaki ilgili sütunun satırına yönlendirir."""
+    __slots__ = ("name",)
+    def __set_name__(self, owner, name): self.name = name
+    def __get__(self, obj, owner=None):
+        if obj is None: return self
+        return getattr(obj._store, self.name)[obj._idx]
+    def __set__(self, obj, value): getattr(obj._store, self.name)[obj._idx] = value
+
+class _CareerColumn(_Column):
+    """Kariyer sayacı: değiştiğinde tüm zamanlar liderlik indeksine haber verir."""
+    __slots__ = ()
+    def __set__(self, obj, value):
+        store = obj._store
+        getattr(store, self.name)[obj._idx] = value
+        if store.leaderboards is not None: store.leaderboards.on_change(obj._idx + store.base, self.name, value)
+
+class Driver:
+    __slots__ = ("_store", "_idx")
+
+    name = _Column(); team = _Column(); category = _Column()
+    speed = _Column(); handling = _Column(); braking = _Column(); intelligence = _Column(); overall_power = _Column()
+    seasons_raced = _Column(); bad_seasons_streak = _Column(); retirement_deadline = _Column()
+    season_points = _Column(); wins = _Column(); poles = _Column(); podiums = _Column(); dnfs = _Column()
+    career_races = _CareerColumn(); career_wins = _CareerColumn(); career_poles = _CareerColumn()
+    career_podiums = _CareerColumn(); career_dnfs = _CareerColumn(); career_titles = _CareerColumn()
+
+    def __init__(self, name, team, speed, handling, braking, intelligence, rng=None, store=None):
+        rng = random if rng is None else rng
+        self._store = DriverStore() if store is None else store
+        self._idx = self._store.allocate(self)
+        self._store.by_name[name] = self._idx
+        self.name = name
+        self.team = team
+
+        self.speed = float(speed)
+        self.handling = float(handling)
+        self.braking = float(braking)
+        self.intelligence = float(intelligence)
+
+        self.category = "Veteran" if name in VETERANS_LIST else "Rookie"
+        self.update_overall()
+
+        # --- KARİYER SAYAÇLARI ---
+        self.seasons_raced = 0
+        self.bad_seasons_streak = 0
+
+        # Emeklilik Zamanı
+        if self.name == "Barış":
+            self.retirement_deadline = 7 # Barış Kuralı
+        elif self.category == "Veteran":
+            self.retirement_deadline = rng.randint(5, 8)
+        else:
+            self.retirement_deadline = rng.randint(9, 11)
+
+        # --- SEZONLUK İSTATİSTİKLER ---
+        self.season_points = 0
+        self.wins = 0
+        self.poles = 0
+        self.podiums = 0
+        self.dnfs = 0
+
+        # --- KARİYER İSTATİSTİKLERİ ---
+        self.career_races = 0
+        self.career_wins = 0
+        self.career_poles = 0
+        self.career_podiums = 0
+        self.career_dnfs = 0
+        self.career_titles = 0
+        # Ödüller ve tarihi pist kazanımları ilk kullanımda oluşturulur (bkz. özellikler)
+
+    @property
+    def store(self): return self._store
+
+    @property
+    def row(self): return self._idx + self._store.base
+
+    @property
+    def achievement_codes(self):
+        """Ödüller paketlenmiş kodlar olarak (bkz. `pack_achievement`); metin gösterimde üretilir."""
+        column = self._store.achievement_codes
+        if column[self._idx] is None: column[self._idx] = []
+        return column[self._idx]
+
+    @property
+    def achievements(self): return [achievement_text(c) for c in self._store.achievement_codes[self._idx] or ()]
+
+    @property
+    def specific_race_wins(self):
+        column = self._store.specific_race_wins
+        if column[self._idx] is None: column[self._idx] = {}
+        return column[self._idx]
+
+    def update_overall(self):
+        self.overall_power = self.speed + self.handling + self.braking + self.intelligence
+        self._store.version += 1
+        self._store.dirty.add(self._idx)
+
+    def __repr__(self): return self.name
+    def add_points(self, points):
+        self.season_points += points
+        standings = self._store.standings
+        if standings is not None: standings.on_points(self)
+
+    def reset_stats_for_new_season(self):
+        self.season_points = 0
+        self.wins = 0
+        self.poles = 0
+        self.podiums = 0
+        self.dnfs = 0
+        self.seasons_raced += 1
+
+    def apply_season_development(self, rng=None):
+        """Gelişim ve Yaşlanma Mantığı"""
+        rng = random if rng is None else rng
+        changes = []
+        attributes = ["speed", "handling", "braking", "intelligence"]
+        attr_names = {"speed": "Hız", "handling": "Kontrol", "braking": "Fren", "intelligence": "Zeka"}
+
+        if self.category == "Rookie":
+            targets = rng.sample(attributes, 2)
+            for attr in targets:
+                boost = rng.uniform(0.3, 0.8)
+                current_val = getattr(self, attr)
+                if current_val + boost > 10.5: boost = 10.5 - current_val
+                setattr(self, attr, current_val + boost)
+                changes.append(f"{attr_names[attr]} +{boost:.1f}")
+        else:
+            roll = rng.random()
+            target = rng.choice(attributes)
+            current_val = getattr(self, target)
+
+            if roll < 0.35: # Düşüş
+                drop = rng.uniform(0.1, 0.3)
+                if current_val - drop < 4.0: drop = 0
+                setattr(self, target, current_val - drop)
+                changes.append(f"{attr_names[target]} -{drop:.1f}")
+            elif roll > 0.85: # Tecrübe Artışı
+                boost = rng.uniform(0.1, 0.2)
+                if current_val + boost > 10.5: boost = 0
+                setattr(self, target, current_val + boost)
+                changes.append(f"{attr_names[target]} +{boost:.1f}")
+            else:
+                changes.append("Değişim Yok")
+
+        self.update_overall()
+        return ", ".join(changes)
+
+class _Field:
+    """`RetiredDriver` paketinden tek bir sayısal alanı okur."""
+    __slots__ = ("unpack", "offset")
+    def __init__(self, fmt, offset):
+        self.unpack = struct.Struct(fmt).unpack_from
+        self.offset = offset
+    def __get__(self, obj, owner=None):
+        if obj is None: return self
+        return self.unpack(obj._packed, self.offset)[0]
+
+class RetiredDriver:
+    """Emekli veya kovulan pilotun değişmez özeti.
+
+    Sayısal sütunlar tek bir `bytes` paketinde, ödüller paketlenmiş kodlar
+    (`array("q")` baytları) olarak, pist galibiyetleri (pist, sayı) çiftleri
+    olarak tutulur. `Driver` ile aynı okuma arayüzünü sunar.
+    """
+    __slots__ = ("row", "name", "team", "category", "_packed", "_codes", "_track_wins")
+    FIELDS = DriverStore.FLOAT_COLUMNS + DriverStore.INT_COLUMNS
+    PACK = struct.Struct("<" + "d" * len(DriverStore.FLOAT_COLUMNS) + "i" * len(DriverStore.INT_COLUMNS))
+
+    def __init__(self, row, name, team, category, packed, codes, track_wins):
+        for slot, value in zip(self.__slots__, (row, name, team, category, packed, codes, track_wins)):
+            object.__setattr__(self, slot, value)
+
+    def __setattr__(self, name, value): raise AttributeError("RetiredDriver değiştirilemez")
+
+    @classmethod
+    def freeze(cls, driver):
+        store, i = driver.store, driver._idx
+        codes = store.achievement_codes[i] or ()
+        # Çözülemeyen eski metin ödüller (kod olmayanlar) olduğu gibi saklanır
+        codes = array("q", codes).tobytes() if all(isinstance(c, int) for c in codes) else tuple(codes)
+        return cls(driver.row, driver.name, driver.team, driver.category,
+                   cls.PACK.pack(*(getattr(store, c)[i] for c in cls.FIELDS)),
+                   codes, tuple((store.specific_race_wins[i] or {}).items()))
+
+    def state(self):
+        """`RetiredDriver(*state)` ile geri kurulabilen düz değerler."""
+        return (self.row, self.name, self.team, self.category, self._packed, self._codes, self._track_wins)
+
+    @property
+    def achievement_codes(self):
+        if isinstance(self._codes, tuple): return list(self._codes)
+        codes = array("q")
+        codes.frombytes(self._codes)
+        return codes.tolist()
+
+    @property
+    def achievements(self): return [achievement_text(c) for c in self.achievement_codes]
+
+    @property
+    def specific_race_wins(self): return dict(self._track_wins)
+
+    def __repr__(self): return self.name
+
+_offset = 0
+for _col in RetiredDriver.FIELDS:
+    _fmt = "<d" if _col in DriverStore.FLOAT_COLUMNS else "<i"
+    setattr(RetiredDriver, _col, _Field(_fmt, _offset))
+    _offset += struct.calcsize(_fmt)
+del _offset, _col, _fmt
+
+class Team:
+    def __init__(self, name):
+        self.name = name
+        self.drivers = []
+        self.season_points = 0
+
+    def add_driver(self, driver): self.drivers.append(driver)
+
+    def fork(self, views):
+        """Çatal lig için kopya; `views` satır numarasından çatal mağazadaki görünüme."""
+        team = Team(self.name)
+        team.drivers = [views[d.row] for d in self.drivers]
+        team.season_points = self.season_points
+        return team
+
+    def remove_driver(self, driver_name):
+        self.drivers = [d for d in self.drivers if d.name != driver_name]
+
+    def calculate_team_points(self):
+        self.season_points = sum(d.season_points for d in self.drivers)
+
+    def reset_stats(self): self.season_points = 0
+
+class Circuit:
+    def __init__(self, name, focus_factor=1.0):
+        self.name = name
+        self.focus_factor = focus_factor
+
+# ====================================================================
+# --- II. SABİT DEĞERLER ---
+# ====================================================================
+
+RACE_POINTS = { 1: 15, 2: 12, 3: 10, 4: 8, 5: 6, 6: 4, 7: 3, 8: 2, 9: 1, 10: 0 }
+RAIN_CHANCE = 0.20
+RAIN_MULTIPLIER = 1.25
+MAX_POWER = 42.0
+BASE_DNF_CHANCE = 0.01
+POWER_INFLUENCE = 0.30
+CIRCUIT_DNF_INFLUENCE = 0.20
+MASTERY_BOOST = 3.0
+POLE_BOOST = 5.0
+QUALY_POWER_MULTIPLIER = 0.9
+QUALY_CHAOS_BASE = 5.0
+RACE_CHAOS_BASE = 12.0
+
+CIRCUIT_MASTERY = {
+    "Ahmet": ["Spa-Francorchamps", "Singapore", "Suzuka"],
+    "Kayra": ["Silverstone", "İstanbul Park", "Interlagos"],
+    "Barış": ["Australia"],
+    "Kaan": ["Azerbaijan"],
+    "Yağız": ["Miami"]
+}
+
+# BAŞLANGIÇ GRİDİ
+PILOT_VERILERI = [("Kayra", 10, 9, 9, 9), ("Ahmet", 10, 8, 9, 9), ("Yağız", 10, 8, 8, 8),
+                  ("Barış", 9, 7, 8, 9), ("Kaan", 8, 7, 8, 8), ("Burak", 6, 6, 7, 7),
+                  ("Ömer", 6, 6, 6, 5), ("Yusuf", 6, 4, 5, 4), ("Asil", 5, 5, 5, 4), ("Elif", 4, 4, 4, 5)]
+
+TEAM_NAMES = ["Red", "Blue", "Yellow", "Green", "Purple"]
+
+CIRCUIT_DATA = [("Spa-Francorchamps", 1.2), ("Interlagos", 1.1), ("Miami", 1.0),
+                ("Silverstone", 0.9), ("İstanbul Park", 1.3), ("Monza", 0.8),
+                ("Abu Dhabi", 0.8), ("Monaco", 1.4), ("Suzuka", 1.1),
+                ("Australia", 1.0), ("Azerbaijan", 1.3), ("Bahrain", 0.9),
+                ("Canada", 1.1), ("China", 1.0), ("Singapore", 1.4),
+                ("Spain", 0.9), ("COTA", 1.0), ("Jeddah", 1.2),
+                ("Sochi", 0.8), ("Austria", 0.9)]
+
+START_YEAR = 2025
+
+# ÖDÜL KODLARI (metin sadece gösterimde üretilir)
+AWARD_TITLE, AWARD_MOST_WINS, AWARD_POLE_KING, AWARD_PODIUMS, AWARD_SAFE_DRIVER, AWARD_RISER = range(1, 7)
+ACHIEVEMENT_FORMATS = {
+    AWARD_TITLE: "🏆 {year} Dünya Şampiyonu",
+    AWARD_MOST_WINS: "🏁 {year} En Çok Galibiyet ({value})",
+    AWARD_POLE_KING: "⚡ {year} Pole Kralı ({value})",
+    AWARD_PODIUMS: "🍾 {year} Podyum Canavarı ({value})",
+    AWARD_SAFE_DRIVER: "🛡️ {year} Safe Driver (En Az Kaza)",
+    AWARD_RISER: "🚀 {year} Yılın Yükseleni (+{value} Sıra)",
+}
+
+def format_achievement(code, year, value=0): return ACHIEVEMENT_FORMATS[code].format(year=year, value=value)
+
+# Ödül tek bir tamsayıda paketlenir: yıl << 32 | değer << 8 | kod
+def pack_achievement(code, year, value=0): return (year << 32) | (value << 8) | code
+
+def unpack_achievement(packed): return packed & 0xFF, packed >> 32, (packed >> 8) & 0xFFFFFF
+
+def achievement_text(achievement):
+    """Paketlenmiş ödülün metni."""
+    code, year, value = unpack_achievement(achievement)
+    return format_achievement(code, year, value)
+
+# ====================================================================
+# --- III. SIRALAMA İNDEKSİ ---
+# ====================================================================
+
+class RankIndex:
+    """Negatif olmayan tamsayı değerlere göre sıralı indeks.
+
+    Büyük değer öndedir; eşit değerlerde `seq`i küçük olan önde kalır (kararlı
+    `sorted(..., reverse=True)` ile aynı sıra). Değer başına sayım bir Fenwick
+    ağacında tutulur; sıra sorgusu ve güncelleme O(log P) + kova içi bisect'tir.
+    """
+    __slots__ = ("_size", "_tree", "_count", "_buckets", "_entries")
+
+    def __init__(self, capacity=64):
+        self._size = capacity
+        self._tree = [0] * (capacity + 1)
+        self._count = 0
+        self._buckets = {}
+        self._entries = {}
+
+    def __len__(self): return self._count
+    def __contains__(self, key): return key in self._entries
+
+    def value(self, key): return self._entries[key][0]
+
+    def _add(self, value, delta):
+        i = value + 1
+        while i <= self._size:
+            self._tree[i] += delta
+            i += i & -i
+
+    def _count_le(self, value):
+        i = min(value, self._size - 1) + 1
+        total = 0
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def _grow(self, value):
+        while self._size <= value: self._size *= 2
+        self._tree = [0] * (self._size + 1)
+        for v, bucket in self._buckets.items(): self._add(v, len(bucket))
+
+    def _kth_smallest_value(self, k):
+        pos = 0
+        bit = 1 << (self._size.bit_length() - 1)
+        while bit:
+            nxt = pos + bit
+            if nxt <= self._size and self._tree[nxt] < k:
+                pos = nxt
+                k -= self._tree[nxt]
+            bit >>= 1
+        return pos
+
+    def insert(self, key, value, seq):
+        if value >= self._size: self._grow(value)
+        self._entries[key] = (value, seq)
+        bisect.insort(self._buckets.setdefault(value, []), (seq, key))
+        self._add(value, 1)
+        self._count += 1
+
+    def remove(self, key):
+        value, seq = self._entries.pop(key)
+        bucket = self._buckets[value]
+        del bucket[bisect.bisect_left(bucket, (seq,))]
+        if not bucket: del self._buckets[value]
+        self._add(value, -1)
+        self._count -= 1
+
+    def update(self, key, value):
+        old_value, seq = self._entries[key]
+        if value == old_value: return
+        self.remove(key)
+        self.insert(key, value, seq)
+
+    def rank(self, key):
+        """1 tabanlı sıra."""
+        value, seq = self._entries[key]
+        ahead = self._count - self._count_le(value)
+        return ahead + bisect.bisect_left(self._buckets[value], (seq,)) + 1
+
+    def _iter_from(self, rank, k):
+        out = []
+        while len(out) < k and rank <= self._count:
+            value = self._kth_smallest_value(self._count - rank + 1)
+            ahead = self._count - self._count_le(value)
+            start = rank - ahead - 1
+            chunk = self._buckets[value][start:start + k - len(out)]
+            out.extend(key for _, key in chunk)
+            rank += len(chunk)
+        return out
+
+    def at(self, rank): return self._iter_from(rank, 1)[0]
+    def top(self, k): return self._iter_from(1, k)
+    def bottom(self, k): return self._iter_from(max(1, self._count - k + 1), k)
+
+class StandingsIndex:
+    """Sezon puan durumu. `Driver.add_points` her çağrıldığında artımlı güncellenir,
+    böylece lider, sıra ve ilk/son k sorguları tüm gridi yeniden sıralamaz."""
+    def __init__(self, drivers):
+        self._index = RankIndex()
+        self._views = {}
+        for seq, d in enumerate(drivers):
+            self._index.insert(d.row, d.season_points, seq)
+            self._views[d.row] = d
+
+    def __len__(self): return len(self._index)
+
+    def on_points(self, driver):
+        if driver.row in self._index: self._index.update(driver.row, driver.season_points)
+
+    def rank(self, driver): return self._index.rank(driver.row)
+    def at(self, rank): return self._views[self._index.at(rank)]
+    def leader(self): return self.at(1)
+    def top(self, k): return [self._views[r] for r in self._index.top(k)]
+    def bottom(self, k): return [self._views[r] for r in self._index.bottom(k)]
+    def ordered(self): return self.top(len(self))
+
+LeaderboardEntry = namedtuple("LeaderboardEntry", ["row", "name", "team", "value"])
+
+class CareerLeaderboards:
+    """Tüm zamanlar tabloları: aktif pilotlar için kariyer sayacı başına sıralı
+    indeks, emekliler için sayaç başına ilk `RETIRED_DEPTH` kaydın sınırlı listesi.
+
+    Sıra, `all_drivers()` sırasının kararlı sıralamasıyla aynıdır: eşitlikte
+    önce aktif pilotlar (gride katılma sırasıyla), sonra emekliler (ayrılma
+    sırasıyla) gelir. DNF tablosu azdan çoğadır ve sadece en az
+    `MIN_RACES_FOR_DNF` yarış yapmış pilotları içerir. Emeklilerin sayaçları
+    değişmediği için onlardan sadece tablo derinliği kadarı tutulur; ilk k
+    sorgusu (k ≤ `RETIRED_DEPTH`) toplam pilot sayısından bağımsızdır.
+    """
+    METRICS = ("career_titles", "career_wins", "career_poles", "career_podiums")
+    MIN_RACES_FOR_DNF = 20
+    RETIRED_DEPTH = 50
+
+    def __init__(self, league, parent=None):
+        self._views = {}
+        self._seq = {}
+        self._indexes = {m: RankIndex() for m in self.METRICS}
+        # Azdan çoğa sıra için ters `seq` ile tutulur ve sondan okunur
+        self._dnfs = RankIndex()
+        # Sayaç başına (anahtar, LeaderboardEntry) listesi, anahtara göre sıralı
+        self._retired_top = {m: [] for m in self.METRICS + ("career_dnfs",)}
+        self._joined = 0
+        self._retired = 0
+        for d in league.drivers: self.join(d)
+        if parent is None:
+            for d in league.retired_drivers: self._archive(d)
+        else:
+            # Çatal: emekli listeleri sınırlı ve değişmez kayıtlardır, kopyalamak yeterli
+            self._retired_top = {m: list(entries) for m, entries in parent._retired_top.items()}
+            self._retired = parent._retired
+
+    def __len__(self): return len(self._views) + self._retired
+
+    def fork(self, league):
+        """Çatal lig için tablolar; aktif pilotlar aynı sırayla yeniden eklenir."""
+        return CareerLeaderboards(league, parent=self)
+
+    def join(self, driver):
+        """Gride yeni katılan pilot."""
+        row = driver.row
+        self._views[row] = driver
+        seq = self._seq[row] = (0, self._joined)
+        self._joined += 1
+        for metric, index in self._indexes.items():
+            index.insert(row, getattr(driver, metric), seq)
+        if driver.career_races >= self.MIN_RACES_FOR_DNF:
+            self._dnfs.insert(row, driver.career_dnfs, (-seq[0], -seq[1]))
+
+    def retire(self, record):
+        """Emekli/kovulan pilot (`RetiredDriver`), eşitliklerde tüm aktif pilotların arkasına geçer."""
+        row = record.row
+        for index in self._indexes.values(): index.remove(row)
+        if row in self._dnfs: self._dnfs.remove(row)
+        del self._views[row], self._seq[row]
+        self._archive(record)
+
+    def _archive(self, record):
+        seq = (1, self._retired)
+        self._retired += 1
+        for metric, entries in self._retired_top.items():
+            value = getattr(record, metric)
+            if metric == "career_dnfs":
+                if record.career_races < self.MIN_RACES_FOR_DNF: continue
+                key = (value, seq)
+            else: key = (-value, seq)
+            if len(entries) >= self.RETIRED_DEPTH and key > entries[-1][0]: continue
+            bisect.insort(entries, (key, LeaderboardEntry(record.row, record.name, record.team, value)))
+            del entries[self.RETIRED_DEPTH:]
+
+    def on_change(self, row, column, value):
+        index = self._indexes.get(column)
+        if index is not None:
+            if row in index: index.update(row, value)
+        elif column == "career_dnfs":
+            if row in self._dnfs: self._dnfs.update(row, value)
+        elif column == "career_races":
+            if value >= self.MIN_RACES_FOR_DNF and row in self._seq and row not in self._dnfs:
+                seq = self._seq[row]
+                self._dnfs.insert(row, self._views[row].career_dnfs, (-seq[0], -seq[1]))
+
+    def top(self, metric, k=10):
+        """İlk k satır (`LeaderboardEntry`), aktif ve emekli adaylar birleştirilerek."""
+        if metric == "career_dnfs":
+            active = [self._views[r] for r in reversed(self._dnfs.bottom(k))]
+            key = lambda d: (d.career_dnfs, self._seq[d.row])
+        else:
+            active = [self._views[r] for r in self._indexes[metric].top(k)]
+            key = lambda d: (-getattr(d, metric), self._seq[d.row])
+        candidates = [(key(d), LeaderboardEntry(d.row, d.name, d.team, getattr(d, metric))) for d in active]
+        merged = heapq.merge(candidates, self._retired_top[metric][:k])
+        return [entry for _, entry in islice(merged, k)]
+
+# ====================================================================
+# --- IV. RASTGELELİK AKIŞLARI ---
+# ====================================================================
+
+class SeedStream:
+    """numpy.random.SeedSequence benzeri bölünebilir tohum.
+
+    Her akış kök tohum + anahtar yolundan (ör. ("race", 2031, 4, "dnf")) türetilir;
+    böylece bir kararın sonucu diğer kararların kaç kez ya da hangi süreçte
+    çekildiğinden bağımsızdır.
+    """
+    __slots__ = ("entropy", "key")
+
+    def __init__(self, entropy, key=()):
+        self.entropy = entropy
+        self.key = tuple(key)
+
+    def __repr__(self): return f"SeedStream({self.entropy}, {self.key})"
+
+    def spawn(self, *key): return SeedStream(self.entropy, self.key + key)
+
+    def seed_int(self):
+        path = "/".join(str(k) for k in (self.entropy,) + self.key)
+        return int.from_bytes(hashlib.blake2b(path.encode("utf-8"), digest_size=16).digest(), "little")
+
+    def random(self): return random.Random(self.seed_int())
+
+    def numpy(self):
+        import numpy as np
+        return np.random.default_rng(np.random.SeedSequence(self.seed_int()))
+
+def new_seed(): return random.SystemRandom().getrandbits(32)
+
+def _substreams(rng, *names):
+    """`rng` bir SeedStream ise her alt sistem için ayrı akış, değilse aynı üreteci döndürür."""
+    if rng is None: return (random,) * len(names)
+    if isinstance(rng, SeedStream): return tuple(rng.spawn(n).random() for n in names)
+    return (rng,) * len(names)
+
+# ====================================================================
+# --- V. LİG DURUMU ---
+# ====================================================================
+
+# Çatallarda (bkz. `League.fork`) geçmiş kopyalanmaz, paylaşılır. Listeler
+# `HistoryLog`, sözlükler katmanlı `ChainMap` olarak tutulur.
+LAYER_LIMIT = 32
+
+def fork_layers(layers):
+    """Bir ChainMap'i kopyalamadan çatallar. Dolu ön katman dondurulur; kaynak da
+    çatal da yeni boş bir ön katmana yazar. Katman sayısı `LAYER_LIMIT`i aşarsa
+    kaynak önce tek katmana düzleştirilir (eski katmanlar çatallarda kalır)."""
+    if len(layers.maps) > LAYER_LIMIT: layers.maps[:] = [dict(layers)]
+    if layers.maps[0]: layers.maps.insert(0, {})
+    return ChainMap({}, *layers.maps[1:])
+
+class HistoryLog:
+    """Sadece eklenen kayıt listesi (ör. Şöhretler Müzesi).
+
+    `fork` öneki kopyalamaz: çatal kaynağın o anki uzunluğunu hatırlar ve kendi
+    eklemelerini ayrı tutar. Kaynak eklemeye devam edebilir; paylaşılan önek
+    hiçbir zaman değişmez."""
+    __slots__ = ("_base", "_base_len", "_items")
+
+    def __init__(self, items=()):
+        self._base, self._base_len, self._items = None, 0, list(items)
+
+    def __len__(self): return self._base_len + len(self._items)
+
+    def __iter__(self):
+        if self._base is not None: yield from islice(self._base, self._base_len)
+        yield from self._items
+
+    def __getitem__(self, i):
+        if isinstance(i, slice): return [self[k] for k in range(*i.indices(len(self)))]
+        n = len(self)
+        if i < 0: i += n
+        if not 0 <= i < n: raise IndexError("HistoryLog index out of range")
+        return self._base[i] if i < self._base_len else self._items[i - self._base_len]
+
+    def __repr__(self): return f"HistoryLog({list(self)!r})"
+
+    def append(self, item): self._items.append(item)
+
+    def fork(self):
+        log = HistoryLog()
+        log._base, log._base_len = self, len(self)
+        return log
+
+class SeasonPoints:
+    """Bir sezonun puan gelişimi: (yarış + 1, pilot) boyutlu, önceden ayrılmış tek
+    bir tipli dizi (satır sıralı). 0. satır sezon başıdır; her yarıştan sonra bir
+    satır dolar. Grafik `data` tamponunu kopyalamadan okuyabilir."""
+    __slots__ = ("year", "names", "rows", "n_races", "filled", "data")
+
+    def __init__(self, year, drivers, n_races, data=None, filled=1):
+        self.year = year
+        self.names = [d.name for d in drivers]
+        self.rows = array("q", (d.row for d in drivers))
+        self.n_races = n_races
+        self.data = array("i", bytes(4 * (n_races + 1) * len(self.names))) if data is None else data
+        self.filled = filled
+
+    @property
+    def shape(self): return (self.filled, len(self.names))
+
+    def record(self, store):
+        n = len(self.names)
+        base = self.filled * n
+        points, offset = store.season_points, store.base
+        for i, row in enumerate(self.rows):
+            self.data[base + i] = points[row - offset]
+        self.filled += 1
+
+    def copy(self):
+        table = SeasonPoints.__new__(SeasonPoints)
+        table.year, table.names, table.rows, table.n_races, table.filled = self.year, self.names, self.rows, self.n_races, self.filled
+        table.data = array("i", self.data)
+        return table
+
+    def column(self, i):
+        n = len(self.names)
+        return self.data[i:self.filled * n:n]
+
+    def final(self):
+        n = len(self.names)
+        return self.data[(self.filled - 1) * n:self.filled * n]
+
+    def as_dict(self):
+        """Eski `{isim: [puanlar]}` biçimi."""
+        return {name: self.column(i).tolist() for i, name in enumerate(self.names)}
+
+    # --- Arşiv biçimi: yarış başı kazanımlar, sıkıştırılmış ---
+    def pack(self):
+        n = len(self.names)
+        used = self.data[:self.filled * n]
+        gains = array("i", (used[k] - used[k - n] for k in range(n, len(used))))
+        typecode = "B" if all(0 <= g < 256 for g in gains) else "i"
+        return typecode, zlib.compress(array(typecode, gains).tobytes())
+
+    @classmethod
+    def unpack(cls, year, names, rows, n_races, filled, typecode, blob):
+        table = cls.__new__(cls)
+        table.year, table.names, table.rows, table.n_races, table.filled = year, list(names), array("q", rows), n_races, filled
+        n = len(table.names)
+        gains = array(typecode)
+        gains.frombytes(zlib.decompress(blob))
+        data = array("i", bytes(4 * (n_races + 1) * n))
+        for k, g in enumerate(gains, n):
+            data[k] = data[k - n] + g
+        table.data = data
+        return table
+
+class PointsArchive:
+    """Geçmiş sezonların puan gelişimi. Her sezon sıkıştırılmış yarış başı
+    kazanımlar olarak saklanır; sezon sonu toplamları çok sezonluk grafikler
+    için ayrıca açık tutulur."""
+    def __init__(self):
+        self.seasons = ChainMap()
+        self.finals = ChainMap()
+
+    def __len__(self): return len(self.seasons)
+
+    def fork(self):
+        archive = PointsArchive.__new__(PointsArchive)
+        archive.seasons, archive.finals = fork_layers(self.seasons), fork_layers(self.finals)
+        return archive
+
+    def years(self): return sorted(self.seasons)
+
+    def add(self, table):
+        typecode, blob = table.pack()
+        self.seasons[table.year] = (table.names, table.rows.tolist(), table.n_races, table.filled, typecode, blob)
+        self.finals[table.year] = dict(zip(table.names, table.final().tolist()))
+
+    def season(self, year):
+        return SeasonPoints.unpack(year, *self.seasons[year])
+
+    def driver_finals(self, name):
+        """Bir pilotun yarıştığı her sezonun sonundaki puanı: [(yıl, puan), ...]."""
+        return [(year, finals[name]) for year, finals in sorted(self.finals.items()) if name in finals]
+
+RETIRED_SCHEMA = """
+CREATE TABLE retired (
+    pos INTEGER PRIMARY KEY, row INTEGER NOT NULL, name TEXT NOT NULL, team TEXT NOT NULL, category TEXT NOT NULL,
+    packed BLOB NOT NULL, codes NOT NULL, track_wins TEXT NOT NULL
+);
+CREATE INDEX retired_by_name ON retired (name, row);
+"""
+
+class RetiredArchive:
+    """Emekli/kovulan pilotların `RetiredDriver` kayıtları, ayrılma sırasıyla.
+
+    `enable_spill` ile bir SQLite dosyası verilirse bellekteki kayıtlar
+    `spill_at` sayısına ulaştığında diske taşınır. Yineleme ve isim sıralı
+    sayfalar (`page`) diski ve belleği birlikte dolaşır; bellekte en fazla
+    `spill_at` kayıt kalır.
+
+    `fork` ile açılan arşiv kaynağın o anki kayıtlarını (önek) kopyalamadan
+    okur ve sadece kendi eklediklerini tutar. Diske taşıma kayıtların sırasını
+    değiştirmediği için kaynak sonradan taşınsa da önek geçerli kalır."""
+    SPILL_AT = 256
+
+    def __init__(self, records=()):
+        self._base = None
+        self._base_len = 0
+        self._memory = []
+        self._spilled = 0
+        self._conn = None
+        self.path = None
+        self.spill_at = self.SPILL_AT
+        for record in records: self.append(record)
+
+    def __len__(self): return self._base_len + self._spilled + len(self._memory)
+
+    def fork(self):
+        archive = RetiredArchive()
+        archive._base, archive._base_len = self, len(self)
+        return archive
+
+    def __iter__(self): return self.iter_from(0)
+
+    @property
+    def in_memory(self): return len(self._memory)
+
+    def append(self, record):
+        self._memory.append(record)
+        if self._conn is not None and len(self._memory) >= self.spill_at: self._spill()
+
+    def iter_from(self, start):
+        """`start` sırasından itibaren kayıtlar (depolamaya artımlı yazım için)."""
+        if start < self._base_len:
+            yield from islice(self._base.iter_from(start), self._base_len - start)
+        start = max(0, start - self._base_len)
+        if self._conn is not None and start < self._spilled:
+            for values in self._conn.execute("SELECT row, name, team, category, packed, codes, track_wins FROM retired "
+                                             "WHERE pos >= ? ORDER BY pos", (start,)):
+                yield self._record(values)
+        yield from self._memory[max(0, start - self._spilled):]
+
+    def page(self, offset, limit, end=None):
+        """İsim sırasıyla (eşitlikte satır) `offset`ten başlayan en fazla `limit` kayıt.
+        `end` verilirse sadece ayrılma sırasındaki ilk `end` kayıt aranır (çatal önekleri için)."""
+        key = lambda r: (r.name, r.row)
+        own_end = len(self) - self._base_len if end is None else end - self._base_len
+        memory = sorted(self._memory[:max(0, own_end - self._spilled)], key=key)
+        sources = [memory]
+        if self._conn is not None and own_end > 0:
+            sources.append(self._record(v) for v in self._conn.execute(
+                "SELECT row, name, team, category, packed, codes, track_wins FROM retired WHERE pos < ? "
+                "ORDER BY name, row LIMIT ?", (own_end, offset + limit)))
+        if self._base is not None:
+            sources.append(self._base.page(0, offset + limit, min(self._base_len, len(self) if end is None else end)))
+        if len(sources) == 1: return memory[offset:offset + limit]
+        return list(islice(heapq.merge(*sources, key=key), offset, offset + limit))
+
+    # --- Diske taşıma ---
+    def enable_spill(self, path, spill_at=None):
+        """Kayıtları `path` dosyasına taşımaya başlar; dosyadaki eski kayıtlar silinir."""
+        if spill_at is not None: self.spill_at = spill_at
+        if path == self.path: return self
+        records = list(self)
+        self._close()
+        conn = sqlite3.connect(path, check_same_thread=False)
+        with conn:
+            conn.execute("DROP TABLE IF EXISTS retired")
+            conn.executescript(RETIRED_SCHEMA)
+        self._conn, self.path = conn, path
+        self._base, self._base_len = None, 0
+        self._memory, self._spilled = records, 0
+        if len(records) >= self.spill_at: self._spill()
+        return self
+
+    def disable_spill(self):
+        """Diskteki kayıtları belleğe geri alır ve dosyayı bırakır."""
+        records = list(self)
+        self._close()
+        self._base, self._base_len = None, 0
+        self._memory, self._spilled = records, 0
+        return self
+
+    def _close(self):
+        if self._conn is not None: self._conn.close()
+        self._conn, self.path = None, None
+
+    def _spill(self):
+        rows = []
+        for pos, record in enumerate(self._memory, self._spilled):
+            row, name, team, category, packed, codes, track_wins = record.state()
+            if isinstance(codes, tuple): codes = json.dumps(codes, ensure_ascii=False)
+            rows.append((pos, row, name, team, category, packed, codes, json.dumps(track_wins, ensure_ascii=False)))
+        with self._conn:
+            self._conn.executemany("INSERT INTO retired VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        self._spilled += len(self._memory)
+        self._memory = []
+
+    @staticmethod
+    def _record(values):
+        row, name, team, category, packed, codes, track_wins = values
+        if isinstance(codes, str): codes = tuple(json.loads(codes))
+        return RetiredDriver(row, name, team, category, packed, codes, tuple(tuple(p) for p in json.loads(track_wins)))
+
+class League:
+    """Bir F1 evreninin tüm durumu: pilotlar, takımlar, takvim ve tarihçe."""
+    def __init__(self, drivers, teams, circuits, current_year=START_YEAR, rookie_pool=None, seed=None, store=None):
+        self.seed = new_seed() if seed is None else seed
+        self.store = store if store is not None else (drivers[0].store if drivers else DriverStore())
+        self.drivers = drivers
+        self.retired_drivers = RetiredArchive()
+        self.teams = teams
+        self.circuits = circuits
+        self.power_rank_map = build_power_rank_map(drivers)
+        self.current_year = current_year
+        self.hall_of_fame = HistoryLog()
+        self.development_history = []
+        self.transfer_log = []
+        # Serbest pilotlar (başlangıç havuzu ve kovulanlar); baştan alınır, sona eklenir
+        self.rookie_pool = deque(INITIAL_ROOKIE_POOL if rookie_pool is None else rookie_pool)
+        self.current_race_idx = 0
+        self.race_history = []
+        self.all_winners = []
+        self.all_poles = []
+        self.points_table = SeasonPoints(current_year, drivers, len(circuits))
+        self.points_archive = PointsArchive()
+        # Pist bazlı kazananları tutmak için
+        self.track_winners = {}
+        # İsteğe bağlı olay günlüğü (bkz. f1_events.EventLog.attach)
+        self.events = None
+        # İsteğe bağlı transfer piyasası (bkz. f1_market.TransferMarket.attach)
+        self.market = None
+        # İsteğe bağlı tur tur yarış modu (bkz. f1_laps.LapModel.attach); yoksa tek skorlu yarış
+        self.lap_model = None
+        # Son koşulan yarışın yapısal sonucu (`RaceOutcome`); dışa aktarım bunu okur
+        self.last_outcome = None
+        self.rebuild_standings()
+        self.rebuild_leaderboards()
+
+    def rebuild_standings(self):
+        """Grid değiştiğinde (sezon geçişi, yükleme) puan durumu indeksini baştan kurar."""
+        self.standings = StandingsIndex(self.drivers)
+        self.store.standings = self.standings
+        return self.standings
+
+    def rebuild_leaderboards(self):
+        """Emekliler arşivi dışarıdan değiştirildiğinde (ör. yükleme) tüm zamanlar indeksini kurar."""
+        self.leaderboards = CareerLeaderboards(self)
+        self.store.leaderboards = self.leaderboards
+        return self.leaderboards
+
+    def stream(self, *key): return SeedStream(self.seed, key)
+
+    def fork(self, seed=None):
+        """Evrenin yazma-üzerine-kopya (copy-on-write) çatalı.
+
+        Sadece değişebilen durum kopyalanır: aktif pilot satırları, takımlar,
+        takvim ve sezon içi kayıtlar. Emekliler, Şöhretler Müzesi, puan arşivi ve
+        olay günlüğü paylaşılır; iki evren sonrasında birbirini etkilemeden
+        ilerler. Aynı tohumla çatal kaynağın birebir kopyasıdır; `seed` verilirse
+        çatalın geleceği başka bir rastgelelik akışıyla yazılır."""
+        store = self.store.fork(self.drivers)
+        views = {d.row: store.views[d.row - store.base] for d in self.drivers}
+        league = League([views[d.row] for d in self.drivers], [t.fork(views) for t in self.teams], list(self.circuits),
+                        current_year=self.current_year, rookie_pool=self.rookie_pool,
+                        seed=self.seed if seed is None else seed, store=store)
+        league.retired_drivers = self.retired_drivers.fork()
+        league.leaderboards = store.leaderboards = self.leaderboards.fork(league)
+        league.power_rank_map = dict(self.power_rank_map)
+        league.hall_of_fame = self.hall_of_fame.fork()
+        league.development_history = list(self.development_history)
+        league.transfer_log = list(self.transfer_log)
+        league.current_race_idx = self.current_race_idx
+        league.race_history = list(self.race_history)
+        league.all_winners = list(self.all_winners)
+        league.all_poles = list(self.all_poles)
+        league.points_table = self.points_table.copy()
+        league.points_archive = self.points_archive.fork()
+        league.track_winners = dict(self.track_winners)
+        league.events = None if self.events is None else self.events.fork()
+        league.market = None if self.market is None else self.market.fork()
+        league.lap_model = None if self.lap_model is None else self.lap_model.fork()
+        return league
+
+    def all_drivers(self):
+        """Önce aktif pilotlar (grid sırasıyla), sonra emekliler (ayrılma sırasıyla)."""
+        return chain(self.drivers, self.retired_drivers)
+
+    def retire_driver(self, driver):
+        """Pilotu değişmez bir kayda dondurup emekliler arşivine taşır."""
+        record = RetiredDriver.freeze(driver)
+        self.retired_drivers.append(record)
+        self.leaderboards.retire(record)
+        self.store.release(driver.row)
+        return record
+
+    @property
+    def points_history(self):
+        """Güncel sezonun `{isim: [puanlar]}` görünümü (her çağrıda yeniden üretilir)."""
+        return self.points_table.as_dict()
+
+    def find_driver(self, name): return self.store.find(name)
+
+    @property
+    def total_races(self): return len(self.circuits)
+
+    @property
+    def season_finished(self): return self.current_race_idx >= len(self.circuits)
+
+    def current_circuit(self):
+        return None if self.season_finished else self.circuits[self.current_race_idx]
+
+def build_power_rank_map(drivers):
+    power_sorted = sorted(drivers, key=lambda d: d.overall_power, reverse=True)
+    return {d.name: i+1 for i, d in enumerate(power_sorted)}
+
+def new_league(pilots=None, team_names=None, circuit_data=None, current_year=START_YEAR, seed=None):
+    """Varsayılan (veya verilen) grid ile yeni bir lig kurar; aynı tohum aynı evreni verir."""
+    seed = new_seed() if seed is None else seed
+    setup = SeedStream(seed, ("setup",))
+    pilots = PILOT_VERILERI if pilots is None else pilots
+    team_names = TEAM_NAMES if team_names is None else team_names
+    circuit_data = CIRCUIT_DATA if circuit_data is None else circuit_data
+
+    store = DriverStore()
+    drivers = [Driver(n, "", s, h, b, i, rng=setup.spawn("driver", n).random(), store=store) for n, s, h, b, i in pilots]
+    teams = [Team(n) for n in team_names]
+
+    setup.spawn("teams").random().shuffle(drivers)
+    for i, d in enumerate(drivers):
+        t = teams[i // 2]
+        d.team = t.name
+        t.add_driver(d)
+
+    circuits = [Circuit(n, f) for n, f in circuit_data]
+    setup.spawn("calendar").random().shuffle(circuits)
+    return League(drivers, teams, circuits, current_year=current_year, seed=seed, store=store)
+
+# ====================================================================
+# --- VI. YARDIMCI FONKSİYONLAR ---
+# ====================================================================
+
+def generate_driver_comments(drivers, power_rank_map, rng=None, standings=None):
+    rng = random if rng is None else rng
+    if standings is not None: current_standings = standings.ordered()
+    else: current_standings = sorted(drivers, key=lambda d: d.season_points, reverse=True)
+    comments = []
+    for i, driver in enumerate(current_standings, 1):
+        current_rank = i
+        initial_power_rank = power_rank_map.get(driver.name, 5)
+        if current_rank < initial_power_rank:
+            diff = initial_power_rank - current_rank
+            positive_comments = [
+                f"🔥 Harika bir sezon geçiriyorum! {diff} sıra yukarıdayım.",
+                "🚀 Takım harikalar yaratıyor, şampiyonluk bizim!",
+                "🌪️ Performansımdan çok memnunum.",
+                "✨ Herkesi şaşırttık, daha yeni başlıyoruz!",
+                "📈 Beklentilerin üzerindeyiz.",
+                "⭐ Pistte her şey lehimize işliyor.",
+                "💪 Baskı yok, sadece gazlıyoruz.",
+                "🎯 Podyumlar gelmeye devam edecek."
+            ]
+            msg = rng.choice(positive_comments)
+            comments.append((driver.name, msg, "positive"))
+        elif current_rank > initial_power_rank:
+            diff = current_rank - initial_power_rank
+            negative_comments = [
+                f"🥶 Hayal kırıklığı. {diff} sıra gerideyiz.",
+                "🔧 Arabada sorunlar var.",
+                "⛈️ Şanssızlık peşimi bırakmıyor.",
+                "🐢 Daha çok çalışmalıyız.",
+                "💥 DNF'ler bizi bitirdi.",
+                "📉 İstikrar yakalayamadık.",
+                "🚧 Strateji hataları yaptık.",
+                "🤕 Araca güvenemiyorum.",
+                "❓ Kafam karışık, toparlanmam lazım."
+            ]
+            msg = rng.choice(negative_comments)
+            comments.append((driver.name, msg, "negative"))
+        else:
+            neutral_comments = [
+                "👍 Tam beklenen sıradayız.",
+                "⚖️ Güç dengesi normal.",
+                "🎯 Puan topluyoruz.",
+                "😴 Hata yapmamaya çalışıyoruz.",
+                "☯️ Dengeli bir sezon."
+            ]
+            msg = rng.choice(neutral_comments)
+            comments.append((driver.name, msg, "neutral"))
+    return comments
+
+def all_time_leaderboard(league, key, limit=10):
+    """Aktif ve emekli tüm pilotlar arasında `key` kariyer sayacına göre ilk `limit` satır.
+    `career_dnfs` azdan çoğadır ve en az 20 yarış yapmış pilotlarla sınırlıdır."""
+    top = league.leaderboards.top(key, limit)
+    return [{"Sıra": i+1, "Pilot": e.name, "Takım": e.team, "Değer": e.value} for i, e in enumerate(top)]
+
+MAX_RACE_POINTS = max(RACE_POINTS.values())
+
+def races_remaining(league): return len(league.circuits) - league.current_race_idx
+
+def clinched_champion(league):
+    """Kalan yarışlarda yakalanamayacak pilot lider, yoksa None.
+
+    Kesinleşme: liderin ikinciye farkı > 15 × kalan yarış. Fark tam eşitse eşitlik
+    grid sırasıyla bozulacağı için kesinleşmiş sayılmaz; sezon bittiyse lider döner.
+    """
+    standings = league.standings
+    if not len(standings): return None
+    leader = standings.leader()
+    remaining = races_remaining(league)
+    if remaining <= 0 or len(standings) == 1: return leader
+    if leader.season_points - standings.at(2).season_points > MAX_RACE_POINTS * remaining: return leader
+    return None
+
+def clinched_team(league):
+    """Takımlar şampiyonluğu için aynı kontrol; bir takım yarış başına en fazla
+    pilot sayısı kadar en yüksek puanı (15 + 12 + ...) toplayabilir."""
+    teams = sorted(league.teams, key=lambda t: t.season_points, reverse=True)
+    if not teams: return None
+    remaining = races_remaining(league)
+    if remaining <= 0 or len(teams) == 1: return teams[0]
+    seats = max(len(t.drivers) for t in teams)
+    max_gain = sum(sorted(RACE_POINTS.values(), reverse=True)[:seats])
+    if teams[0].season_points - teams[1].season_points > max_gain * remaining: return teams[0]
+    return None
+
+# ====================================================================
+# --- VII. TRANSFER, ÖDÜLLER VE SEZON MANTIĞI ---
+# ====================================================================
+
+NAME_SUFFIXES = ("II", "III", "IV", "V", "VI", "VII", "VIII", "IX", "X")
+
+class NameRegistry:
+    """Transfer dönemindeki isim kontrolü. Puan durumu haritası, gelişim akışları
+    ve arşivler isimle anahtarlandığı için aktif gridde isimler benzersizdir;
+    ilk kez gelen pilotlar emeklilerin isimlerini de alamaz (sona "II", "III"...
+    eklenir). Kovulup serbest havuzdan geri dönen pilot kendi ismini korur."""
+    def __init__(self, league):
+        self.active = {d.name for d in league.drivers}
+        self.used = self.active | {r.name for r in league.retired_drivers}
+
+    def claim(self, name, returning=False):
+        taken = self.active if returning else self.used
+        candidate, n = name, 0
+        while candidate in taken:
+            candidate = f"{name} {NAME_SUFFIXES[n]}" if n < len(NAME_SUFFIXES) else f"{name} {n + 2}"
+            n += 1
+        self.active.add(candidate)
+        self.used.add(candidate)
+        return candidate
+
+def process_rookie_entry(league, target_team_name, rng=None, names=None):
+    rng = random if rng is None else rng
+    names = NameRegistry(league) if names is None else names
+    if league.rookie_pool:
+        new_data = league.rookie_pool.popleft()
+        r_name, r_s, r_h, r_b, r_i = new_data
+        return Driver(names.claim(r_name, returning=True), target_team_name, r_s, r_h, r_b, r_i, rng=rng, store=league.store)
+    else:
+        rand_name = names.claim(f"Genç_{rng.randint(100,999)}")
+        return Driver(rand_name, target_team_name, 5, 5, 5, 5, rng=rng, store=league.store)
+
+def sign_replacements(league, team_names, rng=None):
+    """Boşalan koltuklar için yeni pilotlar (`team_names` sırasıyla). Lige transfer
+    piyasası bağlıysa tüm koltuklar piyasadan tek geçişte doldurulur; yoksa
+    çaylak havuzundan sırayla alınır. İsimler `NameRegistry` ile benzersiz tutulur."""
+    names = NameRegistry(league)
+    if league.market is not None: return league.market.fill(league, team_names, rng=rng, names=names)
+    return [process_rookie_entry(league, team_name, rng=rng, names=names) for team_name in team_names]
+
+def _grant_award(league, driver, code, value=0):
+    driver.achievement_codes.append(pack_achievement(code, league.current_year, value))
+    if league.events is not None: league.events.record_award(league.current_year, driver, code, value)
+
+def distribute_season_awards(league):
+    drivers = league.drivers
+    if not drivers: return league
+    standings = league.standings
+    champion = standings.leader()
+    _grant_award(league, champion, AWARD_TITLE)
+    champion.career_titles += 1
+    max_wins = max(d.wins for d in drivers)
+    for d in drivers:
+        if d.wins == max_wins and max_wins > 0:
+            _grant_award(league, d, AWARD_MOST_WINS, max_wins)
+    max_poles = max(d.poles for d in drivers)
+    for d in drivers:
+        if d.poles == max_poles and max_poles > 0:
+            _grant_award(league, d, AWARD_POLE_KING, max_poles)
+    max_podiums = max(d.podiums for d in drivers)
+    for d in drivers:
+        if d.podiums == max_podiums and max_podiums > 0:
+            _grant_award(league, d, AWARD_PODIUMS, max_podiums)
+    min_dnfs = min(d.dnfs for d in drivers)
+    for d in drivers:
+        if d.dnfs == min_dnfs:
+            _grant_award(league, d, AWARD_SAFE_DRIVER)
+    best_gain = -99
+    risers = []
+    for d in drivers:
+        current_rank = standings.rank(d)
+        gain = league.power_rank_map.get(d.name, 5) - current_rank
+        if gain > best_gain:
+            best_gain = gain
+            risers = [d]
+        elif gain == best_gain:
+            risers.append(d)
+    if best_gain > 0:
+        for d in risers:
+            _grant_award(league, d, AWARD_RISER, best_gain)
+    return league
+
+def start_new_season_logic(league):
+    with phase("awards"):
+        distribute_season_awards(league)
+    standings = league.standings
+    champion = standings.leader()
+    league.hall_of_fame.append({
+        "Yıl": league.current_year,
+        "Şampiyon": champion.name,
+        "Takım": champion.team,
+        "Puan": champion.season_points
+    })
+
+    season_year = league.current_year
+    events = league.events
+    season = league.stream("season", season_year)
+    dev_log = []
+    with phase("development"):
+        for d in league.drivers:
+            before = (d.speed, d.handling, d.braking, d.intelligence)
+            change_str = d.apply_season_development(rng=season.spawn("development", d.name).random())
+            if events is not None: events.record_development(season_year, d, before)
+            dev_log.append({"Pilot": d.name, "Kategori": d.category, "Gelişim": change_str, "Yeni Güç": f"{d.overall_power:.1f}"})
+    league.development_history = dev_log
+
+    with phase("transfers"):
+        transfer_news = []
+        drivers_to_remove = []
+
+        for d in league.drivers:
+            if d.seasons_raced >= d.retirement_deadline:
+                transfer_news.append(f"👋 **EMEKLİLİK:** {d.seasons_raced} sezonun ardından **{d.name}** ({d.team}) emekliye ayrıldı.")
+                drivers_to_remove.append((d, "retired"))
+
+        bottom_3 = standings.bottom(3)
+        for i, d in enumerate(bottom_3):
+            if any(rem[0].name == d.name for rem in drivers_to_remove): continue
+            should_fire = False
+            reason = ""
+            my_idx = standings.rank(d) - 1
+            if my_idx > 0:
+                driver_ahead = standings.at(my_idx)
+                gap = driver_ahead.season_points - d.season_points
+                if gap >= 25:
+                    d.bad_seasons_streak += 1
+                    reason = f"Puan farkı çok açıldı ({gap} puan)."
+            initial_rank = league.power_rank_map.get(d.name, 5)
+            current_rank = my_idx + 1
+            if current_rank >= initial_rank + 3:
+                 d.bad_seasons_streak += 1
+                 reason = f"Beklenti {initial_rank}, Gerçekleşen {current_rank}."
+            if d.season_points == 0 and current_rank == 10: d.bad_seasons_streak += 2
+
+            if d.bad_seasons_streak >= 2: should_fire = True
+
+            if should_fire:
+                transfer_news.append(f"📢 **KOVULMA:** **{d.name}** ({d.team}), başarısız performans nedeniyle gönderildi. ({reason})")
+                drivers_to_remove.append((d, "fired"))
+                league.rookie_pool.append((d.name, d.speed, d.handling, d.braking, d.intelligence))
+
+        transfer_rng = season.spawn("transfers").random()
+        for old_driver, status in drivers_to_remove:
+            if events is not None: events.record_exit(season_year, old_driver, status)
+            league.retire_driver(old_driver)
+        # Transfer dönemi: önce tüm koltuklar tek geçişte boşaltılır, sonra hepsi birlikte doldurulur
+        leaving = {old_driver.row for old_driver, _ in drivers_to_remove}
+        league.drivers[:] = [d for d in league.drivers if d.row not in leaving]
+        teams = {t.name: t for t in league.teams}
+        seats = [(old_driver.team, status) for old_driver, status in drivers_to_remove if old_driver.team in teams]
+        for team_name in {team_name for team_name, _ in seats}:
+            teams[team_name].drivers = [d for d in teams[team_name].drivers if d.row not in leaving]
+        new_drivers = sign_replacements(league, [team_name for team_name, _ in seats], rng=transfer_rng)
+        for (target_team_name, status), new_driver in zip(seats, new_drivers):
+            teams[target_team_name].add_driver(new_driver)
+            league.drivers.append(new_driver)
+            league.leaderboards.join(new_driver)
+            if events is not None: events.record_signing(season_year, new_driver)
+            if status == "retired":
+                transfer_news.append(f"🆕 **İMZA:** {target_team_name}, **{new_driver.name}** ile sözleşme imzaladı.")
+            else:
+                transfer_news.append(f"🔄 **TRANSFER:** {target_team_name}, **{new_driver.name}**'i getirdi.")
+
+    league.transfer_log = transfer_news
+    league.current_year += 1
+    league.current_race_idx = 0
+    league.race_history = []
+    league.all_winners = []
+    league.all_poles = []
+
+    league.points_archive.add(league.points_table)
+    league.points_table = SeasonPoints(league.current_year, league.drivers, len(league.circuits))
+
+    for d in league.drivers:
+        d.reset_stats_for_new_season()
+    for t in league.teams: t.reset_stats()
+    league.rebuild_standings()
+
+    league.power_rank_map = build_power_rank_map(league.drivers)
+    league.stream("season", league.current_year, "calendar").random().shuffle(league.circuits)
+    league.store.compact()
+    league.store.powers().compile(league.drivers, league.circuits)
+    return league
+
+# ====================================================================
+# --- VIII. YARIŞ MANTIĞI ---
+# ====================================================================
+
+# Yarışın yapısal sonucu: listeler sıralıdır, (pilot, skor) çiftleri içerir
+RaceOutcome = namedtuple("RaceOutcome", ["circuit", "qualifying", "pole_sitter", "is_rainy", "finishers", "dnf_drivers", "winner"])
+
+# Pilotun bir pistteki sezon boyu sabit değerleri; gürültü yarışta eklenir
+CircuitPower = namedtuple("CircuitPower", ["qualy", "dry", "wet", "dnf"])
+
+def compile_power(driver, circuit):
+    """Yarış formüllerinin gürültüsüz kısmı; işlem sırası eski hesapla aynıdır (sonuçlar bit bit aynı)."""
+    boost = MASTERY_BOOST if circuit.name in CIRCUIT_MASTERY.get(driver.name, ()) else 0.0
+    speed, handling, braking, intel = driver.speed, driver.handling, driver.braking, driver.intelligence
+    return CircuitPower((driver.overall_power + boost) * QUALY_POWER_MULTIPLIER,
+                        speed + handling + braking + intel + boost,
+                        speed + handling * RAIN_MULTIPLIER + braking + intel * RAIN_MULTIPLIER + boost,
+                        BASE_DNF_CHANCE + ((1 - (driver.overall_power / MAX_POWER)) * POWER_INFLUENCE) + ((circuit.focus_factor - 1.0) * CIRCUIT_DNF_INFLUENCE))
+
+class PowerTable:
+    """Pilot × pist `CircuitPower` tablosu.
+
+    Sezon başında gelişim ve transferlerden sonra tüm grid ve takvim için
+    derlenir (`compile`); sezon içinde yarış adımı bir tablo okuması ve
+    gürültüden ibarettir. `update_overall` ile değişen satırlar (ör. sezon
+    ortasında gride giren pilot) bir sonraki okumada yeniden hesaplanır.
+    Özellikler `update_overall` çağrılmadan değiştirilirse tablo bunu görmez."""
+    __slots__ = ("store", "circuits")
+
+    def __init__(self, store):
+        self.store = store
+        self.circuits = {}
+
+    def compile(self, drivers, circuits):
+        self.store.dirty.clear()
+        self.circuits = {(c.name, c.focus_factor): {d._idx: compile_power(d, c) for d in drivers} for c in circuits}
+        return self
+
+    def lookup(self, drivers, circuit):
+        """`drivers` sırasıyla `CircuitPower` listesi; eksik satırlar derlenip eklenir."""
+        dirty = self.store.dirty
+        if dirty:
+            for entries in self.circuits.values():
+                for i in dirty: entries.pop(i, None)
+            dirty.clear()
+        entries = self.circuits.setdefault((circuit.name, circuit.focus_factor), {})
+        powers = []
+        for d in drivers:
+            power = entries.get(d._idx)
+            if power is None: power = entries[d._idx] = compile_power(d, circuit)
+            powers.append(power)
+        return powers
+
+def circuit_powers(drivers, circuit):
+    """Aynı mağazadaki pilotlar için tablodan, aksi halde doğrudan hesaplanan güçler."""
+    store = drivers[0].store if drivers else None
+    if store is not None and all(d._store is store for d in drivers): return store.powers().lookup(drivers, circuit)
+    return [compile_power(d, circuit) for d in drivers]
+
+def simulate_race_outcome(drivers, circuit, rng=None):
+    """Tek yarış: pilot sayaçlarını günceller ve `RaceOutcome` döndürür.
+
+    `rng` bir SeedStream ise sıralama, hava, DNF ve yarış gürültüsü ayrı akışlardan çekilir.
+    """
+    qualy_rng, weather_rng, dnf_rng, race_rng = _substreams(rng, "qualy", "weather", "dnf", "race")
+    count("races")
+    with phase("qualifying"):
+        powers = circuit_powers(drivers, circuit)
+        chaos_range_qualy = QUALY_CHAOS_BASE * circuit.focus_factor
+        qualifying_performances = []
+        for driver, power in zip(drivers, powers):
+            random_factor = qualy_rng.uniform(-chaos_range_qualy, chaos_range_qualy)
+            qualifying_performances.append((driver, power.qualy + random_factor))
+
+        final_ranking_qualy = sorted(qualifying_performances, key=lambda x: x[1], reverse=True)
+        pole_sitter = final_ranking_qualy[0][0]
+
+    is_rainy = weather_rng.random() < RAIN_CHANCE
+
+    # DNF zarları ve yarış skorları ayrı akışlardan çekildiği için iki ayrı geçişte yapılır
+    with phase("dnf_rolls"):
+        survivors = []
+        dnf_drivers = []
+        for driver, power in zip(drivers, powers):
+            if dnf_rng.random() < power.dnf:
+                dnf_drivers.append(driver)
+            else:
+                survivors.append((driver, power.wet if is_rainy else power.dry))
+        count("dnfs", len(dnf_drivers))
+
+    with phase("race_scoring"):
+        chaos_range_race = RACE_CHAOS_BASE * circuit.focus_factor
+        race_performances = []
+        for driver, power in survivors:
+            if driver == pole_sitter: power += POLE_BOOST
+            score = power + race_rng.uniform(-chaos_range_race, chaos_range_race)
+            race_performances.append((driver, score))
+
+        final_ranking = sorted(race_performances, key=lambda x: x[1], reverse=True)
+    winner = final_ranking[0][0] if final_ranking else None
+    return record_race_outcome(drivers, RaceOutcome(circuit, final_ranking_qualy, pole_sitter, is_rainy, final_ranking, dnf_drivers, winner))
+
+def record_race_outcome(drivers, outcome):
+    """Yarış sonucunu pilot sayaçlarına işler; yarışın nasıl simüle edildiğinden
+    bağımsızdır (bkz. f1_laps). `outcome`u geri döndürür."""
+    circuit, pole_sitter, winner = outcome.circuit, outcome.pole_sitter, outcome.winner
+    pole_sitter.poles += 1
+    pole_sitter.career_poles += 1
+    for driver in drivers: driver.career_races += 1
+    for driver in outcome.dnf_drivers:
+        driver.dnfs += 1
+        driver.career_dnfs += 1
+
+    if winner:
+        winner.career_wins += 1
+        if circuit.name in HISTORIC_TRACK_TITLES:
+            if circuit.name in winner.specific_race_wins:
+                winner.specific_race_wins[circuit.name] += 1
+            else:
+                winner.specific_race_wins[circuit.name] = 1
+
+    for rank, (driver, score) in enumerate(outcome.finishers[:10], 1):
+        if rank == 1: driver.wins += 1
+        if rank <= 3:
+            driver.podiums += 1
+            driver.career_podiums += 1
+        driver.add_points(RACE_POINTS.get(rank, 0))
+    return outcome
+
+def format_race_outcome(outcome):
+    """UI'daki log, sonuç ve sıralama tablolarını üretir."""
+    weather = "Yağmurlu 🌧️" if outcome.is_rainy else "Kuru ☀️"
+    log_messages = [f"Hava: {weather} | Pole: **{outcome.pole_sitter.name}**"]
+    log_messages += [f"❌ **DNF:** {driver.name} kaza yaptı!" for driver in outcome.dnf_drivers]
+
+    race_data = []
+    for rank, (driver, score) in enumerate(outcome.finishers[:10], 1):
+        pts = RACE_POINTS.get(rank, 0)
+        race_data.append({"Sıra": rank, "Pilot": driver.name, "Takım": driver.team, "Puan": f"+{pts}", "Durum": "Tamamladı"})
+    for rank, (driver, score) in enumerate(outcome.finishers[10:], 11):
+        race_data.append({"Sıra": rank, "Pilot": driver.name, "Takım": driver.team, "Puan": "0", "Durum": "Tamamladı"})
+    for driver in outcome.dnf_drivers:
+        race_data.append({"Sıra": "-", "Pilot": driver.name, "Takım": driver.team, "Puan": "0", "Durum": "DNF"})
+
+    qual_data_simple = [{"Sıra": i+1, "Pilot": d.name, "Skor": f"{s:.1f}"} for i, (d, s) in enumerate(outcome.qualifying)]
+    return log_messages, race_data, qual_data_simple
+
+def simulate_race_logic(drivers, circuit, rng=None):
+    outcome = simulate_race_outcome(drivers, circuit, rng=rng)
+    log_messages, race_data, qual_data_simple = format_race_outcome(outcome)
+    return log_messages, race_data, qual_data_simple, outcome.winner, outcome.pole_sitter
+
+def run_next_race(league):
+    """Takvimdeki sıradaki yarışı koşar ve tüm sezon kayıtlarını günceller."""
+    circuit = league.circuits[league.current_race_idx]
+    race_rng = league.stream("race", league.current_year, league.current_race_idx)
+    if league.lap_model is None: outcome = simulate_race_outcome(league.drivers, circuit, rng=race_rng)
+    else: outcome = league.lap_model.run(league.drivers, circuit, rng=race_rng)
+    logs, race_res, qual_res = format_race_outcome(outcome)
+    if league.events is not None: league.events.record_race(league.current_year, league.current_race_idx, outcome)
+    league.last_outcome = outcome
+    winner, pole = outcome.winner, outcome.pole_sitter
+    if winner:
+        league.all_winners.append((circuit.name, winner.name))
+        league.track_winners[circuit.name] = winner.name
+    league.all_poles.append((circuit.name, pole.name))
+    league.points_table.record(league.store)
+    winner_name = winner.name if winner else None
+    league.race_history.append({"circuit": circuit, "logs": logs, "race_data": race_res, "qual_data": qual_res, "winner_name": winner_name})
+    for t in league.teams: t.calculate_team_points()
+    league.current_race_idx += 1
+    return league
+
+def simulate_season(league, recorder=None, until_clinched=False):
+    """Sezonun kalan tüm yarışlarını koşar (sezon geçişi yapmaz).
+
+    `recorder` verilirse (ör. bir depolama) her yarıştan sonra `record_race(league)` çağrılır.
+    `until_clinched=True` ise pilotlar şampiyonluğu kesinleşince kalan yarışlar atlanır:
+    şampiyon aynıdır, ama diğer ödüller ve transferler kısalmış sezona göre belirlenir.
+    """
+    while not league.season_finished:
+        if until_clinched and clinched_champion(league) is not None:
+            count("skipped_races", races_remaining(league))
+            league.current_race_idx = len(league.circuits)
+            break
+        run_next_race(league)
+        if recorder is not None: recorder.record_race(league)
+    return league
+
+def simulate_seasons(league, n_seasons, progress=None, recorder=None, until_clinched=False):
+    """N sezonu ara ekran olmadan art arda koşar; son sezonun bitişinde (ödül ekranında) durur.
+
+    Yarım kalmış sezon ilk sezon sayılır. `progress(tamamlanan, toplam)` her sezon sonunda çağrılır.
+    """
+    for done in range(n_seasons):
+        if league.season_finished:
+            start_new_season_logic(league)
+            if recorder is not None: recorder.record_season(league)
+        simulate_season(league, recorder=recorder, until_clinched=until_clinched)
+        if progress: progress(done + 1, n_seasons)
+    return league
@@ -0,0 +1,283 @@
+from array import array
+from collections import ChainMap, namedtuple
+
+from f1_engine import HISTORIC_TRACK_TITLES, RACE_POINTS, AWARD_TITLE, HistoryLog, fork_layers
+
+# Sadece eklenebilen (append-only) olay günlüğü ve tekrar oynatma motoru.
+# Her olay sabit alanlı kompakt bir kayıttır: (tür, yıl, yarış, pilot, a, b).
+# Olaylar sabit boyutlu parçalarda (chunk) tipli dizilerde tutulur; metinler
+# (pilot/pist/takım adları) bir sembol tablosunda tek kez saklanır. Çatallar
+# (bkz. `EventLog.fork`) parçaları ve sembol tablosunu kaynakla paylaşır.
+
+# ====================================================================
+# --- I. OLAY TÜRLERİ ---
+# ====================================================================
+
+EV_DRIVER = 0         # pilot kaydı: a = isim sembolü
+EV_RACE = 1           # yarış başlığı: a = pist sembolü, b = yağmur (0/1)
+EV_QUALIFYING = 2     # a = sıralama pozisyonu
+EV_FINISH = 3         # a = bitiriş pozisyonu
+EV_DNF = 4
+EV_AWARD = 5          # a = ödül kodu (AWARD_*), b = değer
+EV_DEVELOPMENT = 6    # a = özellik indeksi, b = değişim
+EV_RETIRE = 7
+EV_FIRE = 8
+EV_SIGN = 9           # a = takım sembolü
+EV_BASELINE = 10      # günlük sonradan bağlandığında: a = kariyer sayacı indeksi, b = değer
+EV_BASELINE_TRACK = 11  # a = pist sembolü, b = galibiyet
+
+EVENT_NAMES = {EV_DRIVER: "driver", EV_RACE: "race", EV_QUALIFYING: "qualifying", EV_FINISH: "finish",
+               EV_DNF: "dnf", EV_AWARD: "award", EV_DEVELOPMENT: "development", EV_RETIRE: "retire",
+               EV_FIRE: "fire", EV_SIGN: "sign", EV_BASELINE: "baseline", EV_BASELINE_TRACK: "baseline_track"}
+
+# Sezon sonu olaylarının yarış alanı; o yılın tüm yarışlarından sonra sıralanır
+SEASON_END = 32767
+NO_DRIVER = -1
+
+ATTRIBUTES = ("speed", "handling", "braking", "intelligence")
+CAREER_COUNTERS = ("career_races", "career_wins", "career_poles", "career_podiums", "career_dnfs", "career_titles")
+
+CHUNK_SIZE = 4096
+
+Event = namedtuple("Event", ["kind", "year", "race", "driver", "a", "b"])
+
+class _Chunk:
+    __slots__ = ("kind", "year", "race", "driver", "a", "b")
+    def __init__(self):
+        self.kind = array("B")
+        self.year = array("H")
+        self.race = array("h")
+        self.driver = array("i")
+        self.a = array("i")
+        self.b = array("d")
+
+    def __len__(self): return len(self.kind)
+
+    def columns(self): return self.kind, self.year, self.race, self.driver, self.a, self.b
+
+class _ChunkPrefix:
+    """Kaynağın yazılmaya devam eden parçasının çatal anındaki ilk `n` olayı.
+    Kaynak parçayı kopyalamadan gösterir; sütunlar sadece okunurken kesilir."""
+    __slots__ = ("chunk", "n")
+    def __init__(self, chunk, n):
+        self.chunk = chunk
+        self.n = n
+
+    def __len__(self): return self.n
+
+    def columns(self): return tuple(col[:self.n] for col in self.chunk.columns())
+
+# ====================================================================
+# --- II. GÜNLÜK ---
+# ====================================================================
+
+class EventLog:
+    def __init__(self):
+        self.chunks = [_Chunk()]
+        self.symbols = HistoryLog()
+        self._symbol_ids = ChainMap()
+        self._count = 0
+
+    def fork(self):
+        """Kopyalamadan çatallar; kaynak değişmez. Kaynağın yarım kalan son parçası
+        çatalda o anki uzunluğuyla (`_ChunkPrefix`) görünür ve çatal yeni bir
+        parçaya yazar. Kaynak aynı parçayı doldurmaya devam eder; ana çizginin
+        parçaları, her yarış öncesi kontrol noktası alınsa da bölünmez."""
+        last = self.chunks[-1]
+        log = EventLog.__new__(EventLog)
+        log.chunks = self.chunks[:-1] + ([_ChunkPrefix(last, len(last))] if len(last) else []) + [_Chunk()]
+        log.symbols = self.symbols.fork()
+        log._symbol_ids = fork_layers(self._symbol_ids)
+        log._count = self._count
+        return log
+
+    def __len__(self): return self._count
+
+    @classmethod
+    def restore(cls, symbols, rows):
+        """Depolamadan okunan sembol tablosu ve (tür, yıl, yarış, pilot, a, b) satırlarından günlüğü kurar."""
+        log = cls()
+        for text in symbols: log.symbol(text)
+        for row in rows: log.append(*row)
+        return log
+
+    def symbol(self, text):
+        sid = self._symbol_ids.get(text)
+        if sid is None:
+            sid = self._symbol_ids[text] = len(self.symbols)
+            self.symbols.append(text)
+        return sid
+
+    def append(self, kind, year, race, driver=NO_DRIVER, a=0, b=0.0):
+        chunk = self.chunks[-1]
+        if len(chunk) >= CHUNK_SIZE:
+            chunk = _Chunk()
+            self.chunks.append(chunk)
+        chunk.kind.append(kind)
+        chunk.year.append(year)
+        chunk.race.append(race)
+        chunk.driver.append(driver)
+        chunk.a.append(a)
+        chunk.b.append(b)
+        self._count += 1
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            for values in zip(*chunk.columns()):
+                yield Event(*values)
+
+    def events_from(self, start):
+        """`start` indeksinden itibaren olaylar (depolamaya artımlı yazım için)."""
+        offset = start
+        for chunk in self.chunks:
+            if offset >= len(chunk):
+                offset -= len(chunk)
+                continue
+            for values in zip(*(col[offset:] for col in chunk.columns())):
+                yield Event(*values)
+            offset = 0
+
+    # --- Motor kancaları (League.events) ---
+    def attach(self, league):
+        """Günlüğü lige bağlar ve mevcut pilotları kaydeder. Kariyeri başlamış
+        pilotlar için sayaçlar taban (baseline) olayı olarak yazılır."""
+        year, race = league.current_year, league.current_race_idx
+        for d in league.all_drivers():
+            self.register_driver(year, race, d)
+            for i, counter in enumerate(CAREER_COUNTERS):
+                value = getattr(d, counter)
+                if value: self.append(EV_BASELINE, year, race, d.row, i, value)
+            for track, wins in d.specific_race_wins.items():
+                self.append(EV_BASELINE_TRACK, year, race, d.row, self.symbol(track), wins)
+        for d in league.retired_drivers:
+            self.append(EV_RETIRE, year, race, d.row)
+        league.events = self
+        return self
+
+    def register_driver(self, year, race, driver):
+        self.append(EV_DRIVER, year, race, driver.row, self.symbol(driver.name))
+        self.append(EV_SIGN, year, race, driver.row, self.symbol(driver.team))
+
+    def record_race(self, year, race_idx, outcome):
+        self.append(EV_RACE, year, race_idx, NO_DRIVER, self.symbol(outcome.circuit.name), 1.0 if outcome.is_rainy else 0.0)
+        for pos, (d, _) in enumerate(outcome.qualifying, 1):
+            self.append(EV_QUALIFYING, year, race_idx, d.row, pos)
+        for pos, (d, _) in enumerate(outcome.finishers, 1):
+            self.append(EV_FINISH, year, race_idx, d.row, pos)
+        for d in outcome.dnf_drivers:
+            self.append(EV_DNF, year, race_idx, d.row)
+
+    def record_award(self, year, driver, code, value):
+        self.append(EV_AWARD, year, SEASON_END, driver.row, code, value)
+
+    def record_development(self, year, driver, before):
+        for i, attr in enumerate(ATTRIBUTES):
+            delta = getattr(driver, attr) - before[i]
+            if delta: self.append(EV_DEVELOPMENT, year, SEASON_END, driver.row, i, delta)
+
+    def record_exit(self, year, driver, status):
+        self.append(EV_RETIRE if status == "retired" else EV_FIRE, year, SEASON_END, driver.row)
+
+    def record_signing(self, year, driver):
+        self.register_driver(year, SEASON_END, driver)
+
+# ====================================================================
+# --- III. TEKRAR OYNATMA ---
+# ====================================================================
+
+class ReplayState:
+    """Olaylardan yeniden kurulan türetilmiş görünümler."""
+    def __init__(self):
+        self.names = {}
+        self.teams = {}
+        self.active = []
+        self.year = None
+        self.race_idx = 0
+        self.season_points = {}
+        self.career = {}
+        self.track_wins = {}
+        self.track_winners = {}
+        self.attribute_changes = {}
+
+    def standings(self):
+        """(isim, puan) listesi; eşitlikte grid sırası korunur."""
+        order = sorted(self.active, key=lambda r: self.season_points.get(r, 0), reverse=True)
+        return [(self.names[r], self.season_points.get(r, 0)) for r in order]
+
+    def career_stats(self, row):
+        return dict(zip(CAREER_COUNTERS, self.career.get(row, [0] * len(CAREER_COUNTERS))))
+
+    def track_kings(self):
+        """Her tarihi pist için (krallar, galibiyet) — Tarihi Pistler sekmesiyle aynı kural."""
+        kings = {}
+        for track in HISTORIC_TRACK_TITLES:
+            wins = self.track_wins.get(track, {})
+            best = max(wins.values(), default=0)
+            kings[track] = ([self.names[r] for r, w in wins.items() if w == best] if best > 0 else [], best)
+        return kings
+
+def replay(log, until=None):
+    """Günlüğü baştan oynatır. `until=(yıl, yarış)` verilirse o yarış başlamadan
+    önceki durum (yani `League.current_race_idx == yarış` anı) döner."""
+    state = ReplayState()
+    symbols = list(log.symbols)
+    names, teams, career, season_points = state.names, state.teams, state.career, state.season_points
+    active = state.active
+    n_counters = len(CAREER_COUNTERS)
+    current_track = None
+    stop_year, stop_race = until if until is not None else (float("inf"), 0)
+
+    for chunk in log.chunks:
+        for kind, year, race, driver, a, b in zip(*chunk.columns()):
+            if year > stop_year or (year == stop_year and race >= stop_race):
+                return _finish(state, until)
+            if year != state.year:
+                state.year = year
+                state.race_idx = 0
+                season_points.clear()
+            if kind == EV_FINISH:
+                stats = career[driver]
+                stats[0] += 1
+                if a == 1:
+                    stats[1] += 1
+                    if current_track in HISTORIC_TRACK_TITLES:
+                        per_track = state.track_wins.setdefault(current_track, {})
+                        per_track[driver] = per_track.get(driver, 0) + 1
+                    state.track_winners[current_track] = names[driver]
+                if a <= 3: stats[3] += 1
+                season_points[driver] = season_points.get(driver, 0) + RACE_POINTS.get(a, 0)
+            elif kind == EV_QUALIFYING:
+                if a == 1: career[driver][2] += 1
+            elif kind == EV_DNF:
+                stats = career[driver]
+                stats[0] += 1
+                stats[4] += 1
+            elif kind == EV_RACE:
+                current_track = symbols[a]
+                state.race_idx = race + 1
+            elif kind == EV_AWARD:
+                if a == AWARD_TITLE: career[driver][5] += 1
+            elif kind == EV_DRIVER:
+                names[driver] = symbols[a]
+                career.setdefault(driver, [0] * n_counters)
+                active.append(driver)
+            elif kind == EV_SIGN:
+                teams[driver] = symbols[a]
+            elif kind == EV_RETIRE or kind == EV_FIRE:
+                active.remove(driver)
+            elif kind == EV_DEVELOPMENT:
+                changes = state.attribute_changes.setdefault(driver, [0.0] * len(ATTRIBUTES))
+                changes[a] += b
+            elif kind == EV_BASELINE:
+                career[driver][a] += int(b)
+            elif kind == EV_BASELINE_TRACK:
+                per_track = state.track_wins.setdefault(symbols[a], {})
+                per_track[driver] = per_track.get(driver, 0) + int(b)
+    return _finish(state, until)
+
+def _finish(state, until):
+    # Henüz yarışı koşulmamış bir sezona ulaşıldıysa sezon puanları sıfırdır
+    if until is not None and state.year is not None and until[0] > state.year:
+        state.season_points.clear()
+        state.year, state.race_idx = until[0], 0
+    return state
@@ -0,0 +1,135 @@
+import argparse
+import gzip
+import json
+import sys
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow yoksa sadece JSONL çıktısı kullanılabilir
+    pa = pq = None
+
+from f1_engine import RACE_POINTS, new_league, run_next_race, start_new_season_logic
+
+# Toplu analiz için akan (streaming) dışa aktarım. Simülasyon bir üreteç
+# (generator) içinde koşar ve her yarış bittiği anda o yarışın satırları
+# üretilir: pilot başına bir satır (sıralama, hava, bitiriş/DNF, puan).
+# Satırlar diske yazılırken bellekte sadece bir Parquet parçası kadar veri
+# tutulur; sezon sayısı ne olursa olsun bellek kullanımı sabit kalır.
+#
+#   python f1_export.py --seasons 200 --seed 7 --jsonl yarislar.jsonl.gz
+#   python f1_export.py --seasons 1000 --parquet yarislar.parquet
+
+PARQUET_CHUNK_ROWS = 65536
+
+# Satır şeması: (alan, pyarrow tip takma adı); position DNF için boştur
+COLUMNS = (
+    ("year", "int16"), ("race", "int16"), ("circuit", "string"), ("rainy", "bool"),
+    ("driver", "string"), ("team", "string"), ("grid", "int16"), ("qualy_score", "float64"),
+    ("position", "int16"), ("dnf", "bool"), ("points", "int16"),
+)
+
+# ====================================================================
+# --- I. SATIR ÜRETİMİ ---
+# ====================================================================
+
+def outcome_rows(year, race_idx, outcome):
+    """Bir `RaceOutcome`un pilot başına satırları: önce bitirenler, sonra DNF'ler."""
+    circuit, rainy = outcome.circuit.name, outcome.is_rainy
+    grid = {d.row: (pos, score) for pos, (d, score) in enumerate(outcome.qualifying, 1)}
+    for pos, (d, _) in enumerate(outcome.finishers, 1):
+        g, qs = grid[d.row]
+        yield {"year": year, "race": race_idx, "circuit": circuit, "rainy": rainy, "driver": d.name, "team": d.team,
+               "grid": g, "qualy_score": qs, "position": pos, "dnf": False, "points": RACE_POINTS.get(pos, 0)}
+    for d in outcome.dnf_drivers:
+        g, qs = grid[d.row]
+        yield {"year": year, "race": race_idx, "circuit": circuit, "rainy": rainy, "driver": d.name, "team": d.team,
+               "grid": g, "qualy_score": qs, "position": None, "dnf": True, "points": 0}
+
+def race_rows(league, n_seasons):
+    """`n_seasons` sezonu koşarken her yarışın satırlarını üretir (bkz. `simulate_seasons`).
+    Üreteç yarıda bırakılırsa lig son tamamlanan yarışta kalır."""
+    for _ in range(n_seasons):
+        if league.season_finished: start_new_season_logic(league)
+        while not league.season_finished:
+            year, race_idx = league.current_year, league.current_race_idx
+            run_next_race(league)
+            yield from outcome_rows(year, race_idx, league.last_outcome)
+
+# ====================================================================
+# --- II. YAZICILAR ---
+# ====================================================================
+
+class JsonlSink:
+    """Satır başına bir JSON nesnesi; `.gz` uzantısında gzip ile sıkıştırılır."""
+    def __init__(self, path):
+        self.path = path
+        self.rows = 0
+        self._file = gzip.open(path, "wt", encoding="utf-8") if path.endswith(".gz") else open(path, "w", encoding="utf-8")
+
+    def write(self, row):
+        self._file.write(json.dumps(row, ensure_ascii=False))
+        self._file.write("\n")
+        self.rows += 1
+
+    def close(self): self._file.close()
+
+class ParquetSink:
+    """Satırları sütunlarda biriktirip her `chunk_rows` satırda bir satır grubu (row group) yazar."""
+    def __init__(self, path, chunk_rows=PARQUET_CHUNK_ROWS):
+        if pq is None: raise ImportError("Parquet çıktısı için pyarrow gerekli")
+        self.path = path
+        self.chunk_rows = chunk_rows
+        self.rows = 0
+        self.schema = pa.schema([(name, pa.type_for_alias(kind)) for name, kind in COLUMNS])
+        self._writer = pq.ParquetWriter(path, self.schema, compression="zstd")
+        self._buffer = {name: [] for name, _ in COLUMNS}
+        self._buffered = 0
+
+    def write(self, row):
+        for name, values in self._buffer.items(): values.append(row[name])
+        self._buffered += 1
+        self.rows += 1
+        if self._buffered >= self.chunk_rows: self.flush()
+
+    def flush(self):
+        if not self._buffered: return
+        self._writer.write_table(pa.table(self._buffer, schema=self.schema))
+        for values in self._buffer.values(): values.clear()
+        self._buffered = 0
+
+    def close(self):
+        self.flush()
+        self._writer.close()
+
+def export(rows, sinks):
+    """Satır akışını tüm yazıcılara dağıtır; bitince (veya hata olursa) yazıcılar kapatılır."""
+    count = 0
+    try:
+        for row in rows:
+            for sink in sinks: sink.write(row)
+            count += 1
+    finally:
+        for sink in sinks: sink.close()
+    return count
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simüle edilen yarışları JSONL/Parquet olarak dışa aktar")
+    parser.add_argument("--seasons", type=int, default=10, help="koşulacak sezon sayısı")
+    parser.add_argument("--seed", type=int, default=None, help="evren tohumu (varsayılan: rastgele)")
+    parser.add_argument("--jsonl", metavar="PATH", help="JSONL çıktısı ('.gz' ile sıkıştırılır)")
+    parser.add_argument("--parquet", metavar="PATH", help="Parquet çıktısı")
+    parser.add_argument("--chunk-rows", type=int, default=PARQUET_CHUNK_ROWS, help="Parquet satır grubu boyutu")
+    args = parser.parse_args(argv)
+    if not (args.jsonl or args.parquet): parser.error("en az bir çıktı gerekli (--jsonl / --parquet)")
+
+    league = new_league(seed=args.seed)
+    sinks = []
+    if args.jsonl: sinks.append(JsonlSink(args.jsonl))
+    if args.parquet: sinks.append(ParquetSink(args.parquet, args.chunk_rows))
+    n = export(race_rows(league, args.seasons), sinks)
+    print(f"{n} satır yazıldı (tohum {league.seed}, {args.seasons} sezon)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
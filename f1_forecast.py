@@ -0,0 +1,110 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+from f1_batch import _race_chunk, compile_grid, points_by_position
+from f1_engine import MAX_RACE_POINTS
+from f1_laps import compile_lap_grid, lap_race_chunk
+
+# Şampiyonluk tahmini: takvimin kalanını binlerce kez simüle edip her pilotun
+# şampiyonluk, ilk 3 ve beklenen puan oranlarını çıkarır. İş, sabit sayıda
+# parçaya bölünür; her parça kendi SeedSequence akışını kullandığı için sonuç
+# işçi (worker) sayısından bağımsızdır.
+
+FORECAST_SIMS = 4000
+FORECAST_CHUNKS = 8
+MAX_WORKERS = 4
+
+class DriverOdds(NamedTuple):
+    name: str
+    p_champion: float
+    expected_points: float
+    p_top3: float
+
+_POOL = None
+_POOL_WORKERS = 0
+
+def _get_pool(workers):
+    global _POOL, _POOL_WORKERS
+    if _POOL is None or _POOL_WORKERS != workers:
+        if _POOL is not None:
+            _POOL.shutdown(wait=False)
+        # Streamlit sunucusu çok iş parçacıklı olduğu için fork yerine spawn
+        _POOL = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        _POOL_WORKERS = workers
+    return _POOL
+
+def default_workers():
+    return max(1, min(MAX_WORKERS, os.cpu_count() or 1))
+
+def _margins(totals):
+    # Koşu başına liderin ikinciye puan farkı
+    if totals.shape[1] < 2: return np.full(totals.shape[0], np.iinfo(np.int32).max)
+    top2 = -np.partition(-totals, 1, axis=1)[:, :2]
+    return top2[:, 0] - top2[:, 1]
+
+def _forecast_chunk(grids, start_points, n_runs, seed_seq, title_only=False, laps=None):
+    """Tek bir parça: (şampiyonluk sayısı, puan toplamı, ilk 3 sayısı) döndürür.
+
+    `title_only=True` ise şampiyonluğu kesinleşen koşular sonraki yarışlarda
+    simüle edilmez; puan toplamları ve ilk 3 o andaki değerlerle hesaplanır.
+    `laps` verilirse yarışlar tur tur koşulur (`grids` o zaman `LapGrid` listesidir)."""
+    rng = np.random.default_rng(seed_seq)
+    n = start_points.shape[0]
+    totals = np.broadcast_to(start_points, (n_runs, n)).astype(np.int32)
+    pts_by_pos = points_by_position(n)
+    # Fark yarış başına en fazla 15 açılabilir; bu sınır aşılamadan kontrol yapılmaz
+    start_margin = int(_margins(start_points[None, :])[0])
+    active = None  # None: tüm koşular sürüyor
+    if laps is None: race = lambda grid, k: _race_chunk(grid, k, rng, pts_by_pos).points
+    else: race = lambda grid, k: lap_race_chunk(grid, k, rng, pts_by_pos, laps)[0].points
+    for i, grid in enumerate(grids):
+        races_left = len(grids) - i
+        if title_only and start_margin + MAX_RACE_POINTS * i > MAX_RACE_POINTS * races_left:
+            runs = np.arange(n_runs) if active is None else active
+            active = runs[_margins(totals[runs]) <= MAX_RACE_POINTS * races_left]
+            if not len(active): break
+        if active is None: totals += race(grid, n_runs)
+        else: totals[active] += race(grid, len(active))
+
+    # Eşit puanda listedeki ilk pilot önde (sorted(..., reverse=True) ile aynı)
+    standings = np.argsort(-totals, axis=1, kind="stable")
+    champions = np.bincount(standings[:, 0], minlength=n)
+    top3 = np.bincount(standings[:, :3].ravel(), minlength=n)
+    return champions, totals.sum(axis=0, dtype=np.int64), top3
+
+def forecast_championship(drivers, remaining_circuits, n_sims=FORECAST_SIMS, seed=0, workers=None, title_only=False, laps=None):
+    """Kalan takvimden şampiyonluk oranlarını hesaplar; P(şampiyon)'a göre sıralı liste döner.
+    `title_only=True` iken sadece `p_champion` kesindir (bkz. `_forecast_chunk`); `laps`
+    verilirse yarışlar tur tur modelle (bkz. f1_laps) simüle edilir."""
+    workers = default_workers() if workers is None else workers
+    compile_fn = compile_grid if laps is None else compile_lap_grid
+    grids = [compile_fn(drivers, c) for c in remaining_circuits]
+    start_points = np.array([d.season_points for d in drivers], dtype=np.int32)
+
+    n_chunks = min(FORECAST_CHUNKS, n_sims)
+    sizes = [n_sims // n_chunks + (1 if i < n_sims % n_chunks else 0) for i in range(n_chunks)]
+    seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+    jobs = [(grids, start_points, size, s, title_only, laps) for size, s in zip(sizes, seeds)]
+
+    if workers <= 1 or len(jobs) == 1:
+        parts = [_forecast_chunk(*job) for job in jobs]
+    else:
+        parts = list(_get_pool(workers).map(_forecast_chunk, *zip(*jobs)))
+
+    champions = sum(p[0] for p in parts)
+    point_sums = sum(p[1] for p in parts)
+    top3 = sum(p[2] for p in parts)
+    odds = [DriverOdds(d.name, float(champions[i] / n_sims), float(point_sums[i] / n_sims), float(top3[i] / n_sims))
+            for i, d in enumerate(drivers)]
+    return sorted(odds, key=lambda o: (o.p_champion, o.expected_points), reverse=True)
+
+def forecast_league(league, n_sims=FORECAST_SIMS, workers=None, title_only=False):
+    """Ligin tohumundan (yıl, yarış) akışıyla üretilen, tekrarlanabilir tahmin."""
+    seed = league.stream("forecast", league.current_year, league.current_race_idx).seed_int()
+    laps = None if league.lap_model is None else league.lap_model.laps
+    return forecast_championship(league.drivers, league.circuits[league.current_race_idx:], n_sims=n_sims,
+                                 seed=seed, workers=workers, title_only=title_only, laps=laps)
@@ -0,0 +1,303 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from f1_batch import BatchResult, as_generator, compile_grid, points_by_position
+from f1_engine import RAIN_CHANCE, RaceOutcome, record_race_outcome
+
+# Tur tur yarış modu. Tek skorlu yarış yerine her tur, tüm grid (ve Monte
+# Carlo'da R yarış) için (R, n) dizileri üzerinde bir adımda ilerletilir:
+# tur süresi, lastik aşınması, pit stoplar, DNF'lerin çıkardığı güvenlik
+# aracı ve yarış ortasında başlayan yağmur. Tur hızı sıralama/yarış gücünden
+# (hız, kontrol, fren, zeka ve pist ustalığı) gelir; aşınmayı kontrol ve fren,
+# pit kararlarını zeka belirler. Pist odağı (`focus_factor`) gürültüyü ve
+# aşınmayı ölçekler. Yarış başı DNF olasılığı skor modeliyle aynıdır, tur
+# başına tehlikeye bölünür.
+#
+#   LapModel().attach(league)     # run_next_race artık tur tur koşar
+#   simulate_lap_races_batch(league.drivers, circuit, 10_000)
+
+DEFAULT_LAPS = 60
+
+BASE_LAP_TIME = 90.0       # s
+PACE_PER_POWER = 0.05      # s/tur, güç puanı başına
+LAP_NOISE = 0.3            # s, pist odağıyla ölçeklenir
+GRID_GAP = 0.25            # s, başlangıçta grid sırası başına
+FORM_CHAOS = 12.0          # güç puanı; yarış günü formu (skor modelindeki yarış kaosu)
+
+WEAR_RATE = 0.02           # tur başına aşınma (odak 1.0, kontrol + fren = 10)
+TYRE_PENALTY = 3.5         # s/tur, tamamen aşınmış lastikte (aşınma²)
+PIT_LOSS = 21.0            # s
+PIT_LOSS_SC = 11.0         # s, güvenlik aracı altında
+PIT_WEAR = 0.8             # zeka 5 pilotun pite girdiği aşınma
+SC_PIT_WEAR = 0.35         # güvenlik aracı altında fırsat pitinin alt sınırı
+
+SC_LAPS = (3, 6)           # [alt, üst) tur
+SC_LAP_TIME = 120.0        # s
+SC_GAP = 0.5               # s, güvenlik aracı arkasında araç arası
+SC_WEAR = 0.3              # güvenlik aracı altında aşınma çarpanı
+
+MID_RACE_RAIN_CHANCE = 0.15
+WRONG_TYRE_PENALTY = 6.0   # s/tur, yağmurda kuru lastik
+
+# Tur rastgeleliği (tur, R, n) dizileri olarak çekildiği için toplu koşular bu boyutta parçalanır
+LAP_CHUNK = 2048
+
+class LapGrid(NamedTuple):
+    """`GridArrays` ve tur modunun pilot başına ek parametreleri."""
+    grid: object               # f1_batch.GridArrays
+    wear_rate: np.ndarray      # tur başına aşınma
+    pit_wear: np.ndarray       # planlı pit eşiği
+    rain_delay: np.ndarray     # yağmur başladıktan kaç tur sonra yağmur lastiğine geçer
+    sc_pit_chance: np.ndarray  # güvenlik aracı fırsatını değerlendirme olasılığı
+    focus: float
+
+class LapTrace(NamedTuple):
+    """Tek yarışın tur tur kaydı (canlı oynatma ve grafikler için)."""
+    total_time: np.ndarray     # (tur, n) tur sonunda toplam süre; DNF sonrası inf
+    lap_time: np.ndarray       # (tur, n)
+    pits: np.ndarray           # (tur, n) pit maskesi
+    safety_car: np.ndarray     # (tur,) güvenlik aracı maskesi
+    rain_lap: int              # yağmurun başladığı tur (0: yarış başından, -1: yağmur yok)
+    dnf_lap: np.ndarray        # (n,) DNF turu, bitirenler için -1
+    grid_order: np.ndarray     # (n,) başlangıç sırası (pilot indeksleri)
+
+# ====================================================================
+# --- I. GRİD DERLEME ---
+# ====================================================================
+
+def compile_lap_grid(drivers, circuit):
+    grid = compile_grid(drivers, circuit)
+    handling = np.array([d.handling for d in drivers])
+    braking = np.array([d.braking for d in drivers])
+    intel = np.array([d.intelligence for d in drivers])
+    # Yumuşak sürüş (kontrol + fren) lastiği korur; zeki pilot pit zamanlamasını iyi seçer
+    wear_rate = WEAR_RATE * circuit.focus_factor * (2.0 - (handling + braking) / 10.0)
+    pit_wear = PIT_WEAR - 0.02 * (intel - 5.0)
+    rain_delay = np.ceil(np.clip(10.0 - intel, 0.0, None) / 2.5).astype(np.int64)
+    return LapGrid(grid, wear_rate, pit_wear, rain_delay, np.clip(intel / 10.0, 0.0, 1.0), circuit.focus_factor)
+
+# ====================================================================
+# --- II. TUR MOTORU ---
+# ====================================================================
+
+def _bunch(total, rows):
+    """Güvenlik aracı: `rows` yarışlarında sıra korunarak araçlar lidere `SC_GAP` arayla dizilir."""
+    sub = total[rows]
+    order = np.argsort(sub, axis=1, kind="stable")
+    rank = np.empty_like(order)
+    np.put_along_axis(rank, order, np.arange(sub.shape[1]), axis=1)
+    leader = sub.min(axis=1, keepdims=True)
+    total[rows] = np.where(np.isfinite(sub), leader + rank * SC_GAP, np.inf)
+
+def lap_race_chunk(lap_grid, n_races, rng, pts_by_pos, laps=DEFAULT_LAPS, trace=False):
+    """R yarışı tur tur koşar: (BatchResult, sıralama skorları (R, n), toplam süreler (R, n), LapTrace|None).
+    `trace=True` sadece R = 1 için anlamlıdır."""
+    grid = lap_grid.grid
+    n = grid.qualy_power.shape[0]
+
+    qualy = grid.qualy_power + rng.uniform(-grid.qualy_chaos, grid.qualy_chaos, (n_races, n))
+    pole = qualy.argmax(axis=1)
+    grid_order = np.argsort(-qualy, axis=1, kind="stable")
+    total = np.empty((n_races, n))
+    np.put_along_axis(total, grid_order, np.arange(n) * GRID_GAP, axis=1)
+
+    # Hava: yarış başından yağmur ya da yarış ortasında başlayan yağmur
+    rain_from_start = rng.random(n_races) < RAIN_CHANCE
+    mid_rain = ~rain_from_start & (rng.random(n_races) < MID_RACE_RAIN_CHANCE)
+    onset = rng.integers(laps // 4, max(laps * 3 // 4, laps // 4 + 1), n_races)
+    rain_lap = np.where(rain_from_start, 0, np.where(mid_rain, onset, -1))
+    is_rainy = rain_lap >= 0
+
+    form = rng.uniform(-1.0, 1.0, (n_races, n)) * FORM_CHAOS * lap_grid.focus
+    dry_pace = BASE_LAP_TIME - PACE_PER_POWER * (grid.dry_power + form)
+    wet_pace = BASE_LAP_TIME - PACE_PER_POWER * (grid.wet_power + form)
+    # Tur başına rastgelelik önceden, tek seferde çekilir. DNF turu geometrik
+    # dağılımdan gelir; tur başı tehlike, yarış başı olasılık skor modeliyle aynı kalacak şekilde seçilir
+    hazard = 1.0 - (1.0 - np.clip(grid.dnf_chance, 0.0, 1.0)) ** (1.0 / laps)
+    crash_lap = rng.geometric(np.maximum(hazard, 1e-12), (n_races, n)) - 1
+    noise = rng.normal(0.0, LAP_NOISE * lap_grid.focus, (laps, n_races, n))
+    sc_roll = rng.random((laps, n_races, n))
+
+    wear = np.zeros((n_races, n))
+    wet_tyres = np.repeat(rain_from_start[:, None], n, axis=1)
+    alive = np.ones((n_races, n), dtype=bool)
+    dnf_lap = np.full((n_races, n), -1)
+    sc_left = np.zeros(n_races, dtype=np.int64)
+    if trace:
+        trace_total = np.empty((laps, n))
+        trace_lap = np.empty((laps, n))
+        trace_pits = np.zeros((laps, n), dtype=bool)
+        trace_sc = np.zeros(laps, dtype=bool)
+
+    for lap in range(laps):
+        # Yağmur, güvenlik aracı ve pitler çoğu turda yoktur; ilgili dizi işlemleri o turlarda atlanır
+        raining = is_rainy & (lap >= rain_lap)
+        sc = sc_left > 0
+        any_rain, any_sc = raining.any(), sc.any()
+
+        # Pit kararları: aşınma eşiği, güvenlik aracı fırsatı, yağmur lastiği
+        pit = wear >= lap_grid.pit_wear
+        if any_sc: pit |= sc[:, None] & (wear >= SC_PIT_WEAR) & (sc_roll[lap] < lap_grid.sc_pit_chance)
+        if any_rain: pit |= raining[:, None] & ~wet_tyres & (lap >= rain_lap[:, None] + lap_grid.rain_delay)
+        pit &= alive
+        any_pit = pit.any()
+        if any_pit:
+            wear[pit] = 0.0
+            wet_tyres = np.where(pit, raining[:, None], wet_tyres)
+
+        lap_time = (np.where(raining[:, None], wet_pace, dry_pace) if any_rain else dry_pace) + TYRE_PENALTY * wear * wear
+        lap_time += noise[lap]
+        if any_rain: lap_time += (raining[:, None] & ~wet_tyres) * WRONG_TYRE_PENALTY
+        if any_sc:
+            lap_time[sc] = SC_LAP_TIME
+            wear += lap_grid.wear_rate * np.where(sc, SC_WEAR, 1.0)[:, None]
+        else: wear += lap_grid.wear_rate
+        if any_pit: lap_time += pit * np.where(sc, PIT_LOSS_SC, PIT_LOSS)[:, None]
+        total += lap_time
+
+        # DNF güvenlik aracını çıkarır; çıktığı turun sonunda araçlar dizilir
+        sc_left[sc] -= 1
+        crashed = alive & (crash_lap == lap)
+        if crashed.any():
+            alive &= ~crashed
+            dnf_lap[crashed] = lap
+            total[~alive] = np.inf
+            deploy = crashed.any(axis=1) & (sc_left == 0) & (lap < laps - 1)
+            if deploy.any():
+                sc_left[deploy] = rng.integers(*SC_LAPS, int(deploy.sum()))
+                _bunch(total, np.flatnonzero(deploy))
+        if trace:
+            trace_total[lap], trace_lap[lap], trace_pits[lap], trace_sc[lap] = total[0], lap_time[0], pit[0], sc[0]
+
+    dnf = ~alive
+    # Kararlı sıralama: DNF'ler (inf) sonda, grid (pilot) sırasıyla
+    order = np.argsort(total, axis=1, kind="stable")
+    n_finishers = n - dnf.sum(axis=1)
+    pts_sorted = np.where(np.arange(n) < n_finishers[:, None], pts_by_pos, 0)
+    points = np.empty((n_races, n), dtype=np.int32)
+    np.put_along_axis(points, order, pts_sorted, axis=1)
+    result = BatchResult(order, points, pole, is_rainy, dnf, n_finishers)
+    lap_trace = LapTrace(trace_total, trace_lap, trace_pits, trace_sc, int(rain_lap[0]), dnf_lap[0], grid_order[0]) if trace else None
+    return result, qualy, total, lap_trace
+
+def simulate_lap_races_batch(drivers, circuit, n_races, rng=None, laps=DEFAULT_LAPS, lap_grid=None, chunk_size=LAP_CHUNK):
+    """Aynı pistte R bağımsız yarışı tur tur simüle eder; sayaçlara dokunmaz (bkz. `simulate_races_batch`)."""
+    rng = as_generator(rng)
+    lap_grid = compile_lap_grid(drivers, circuit) if lap_grid is None else lap_grid
+    pts_by_pos = points_by_position(len(drivers))
+    parts = [lap_race_chunk(lap_grid, min(chunk_size, n_races - start), rng, pts_by_pos, laps)[0]
+             for start in range(0, n_races, chunk_size)]
+    return parts[0] if len(parts) == 1 else BatchResult(*(np.concatenate(field) for field in zip(*parts)))
+
+def lap_positions(trace):
+    """(tur, n) tur sonu sıraları (1'den başlar); pilot yarıştan çekildikten sonra nan."""
+    order = np.argsort(trace.total_time, axis=1, kind="stable")
+    positions = np.empty(order.shape)
+    np.put_along_axis(positions, order, np.arange(1, order.shape[1] + 1, dtype=np.float64), axis=1)
+    positions[~np.isfinite(trace.total_time)] = np.nan
+    return positions
+
+# ====================================================================
+# --- III. LİG MODU ---
+# ====================================================================
+
+class LapModel:
+    """`run_next_race`in tur tur yarış modu (League.lap_model kancası)."""
+    def __init__(self, laps=DEFAULT_LAPS):
+        self.laps = laps
+        # Son koşulan yarışın turları ve sonucu (`last_outcome is league.last_outcome` ise güncel)
+        self.last_trace = None
+        self.last_outcome = None
+
+    def attach(self, league):
+        league.lap_model = self
+        return self
+
+    def fork(self): return LapModel(self.laps)
+
+    def run(self, drivers, circuit, rng=None):
+        """Tek yarış: tur tur koşar, pilot sayaçlarını günceller ve `RaceOutcome` döndürür.
+        Bitirenlerin skorları toplam yarış süresidir (saniye, az olan önde)."""
+        lap_grid = compile_lap_grid(drivers, circuit)
+        result, qualy, total, trace = lap_race_chunk(lap_grid, 1, as_generator(rng), points_by_position(len(drivers)),
+                                                     self.laps, trace=True)
+        qualy, total = qualy[0].tolist(), total[0].tolist()
+        qualifying = [(drivers[i], qualy[i]) for i in trace.grid_order.tolist()]
+        finishers = [(drivers[i], total[i]) for i in result.order[0, :result.n_finishers[0]].tolist()]
+        dnf_drivers = [d for d, out in zip(drivers, result.dnf[0].tolist()) if out]
+        outcome = RaceOutcome(circuit, qualifying, drivers[int(result.pole[0])], bool(result.is_rainy[0]), finishers,
+                              dnf_drivers, finishers[0][0] if finishers else None)
+        self.last_trace, self.last_outcome = trace, outcome
+        return record_race_outcome(drivers, outcome)
+
+# ====================================================================
+# --- IV. CANLI OYNATMA ---
+# ====================================================================
+# Yarış tek adımda (vektörel) koşulur; canlı oynatma `LapTrace`i tur tur
+# akıtır. Arayüz kareleri sabit hızda tüketip sadece zamanlama kulesini çizer.
+
+class LapEvent(NamedTuple):
+    lap: int     # 0'dan başlar
+    kind: str    # "pit", "dnf", "lead", "sc_start", "sc_end", "rain"
+    driver: int  # pilot indeksi; pilota bağlı olmayan olaylarda -1
+
+class LapFrame(NamedTuple):
+    """Canlı oynatmanın tek karesi: tur sonu sıralaması, farklar ve o turun olayları."""
+    lap: int                # 0'dan başlar
+    laps: int               # toplam tur
+    order: np.ndarray       # pilot indeksleri, önde olandan; yarıştan çekilenler sonda
+    gap: np.ndarray         # (n,) lidere fark (s), çekilenler için nan
+    interval: np.ndarray    # (n,) öndeki araca fark (s), lider ve çekilenler için nan
+    moved: np.ndarray       # (n,) bir önceki tura (ilk turda gride) göre kazanılan sıra
+    pit_stops: np.ndarray   # (n,) bu tura kadarki pit sayısı
+    safety_car: bool
+    events: list            # [LapEvent], bu turun olayları
+
+EVENT_FORMATS = {
+    "pit": "🛞 {name} pite girdi",
+    "dnf": "💥 {name} yarıştan çekildi",
+    "lead": "🥇 {name} liderliğe yükseldi",
+    "sc_start": "🚨 Güvenlik aracı pistte",
+    "sc_end": "🟢 Güvenlik aracı pitte, yarış yeniden başladı",
+    "rain": "🌧️ Yağmur başladı",
+}
+
+def format_lap_event(event, names):
+    return f"Tur {event.lap + 1}: " + EVENT_FORMATS[event.kind].format(name=names[event.driver] if event.driver >= 0 else "")
+
+def lap_events(trace):
+    """`LapTrace`ten tur başına bir `LapFrame` üreten üreteç (generator)."""
+    laps, n = trace.total_time.shape
+    # Çekilenler sonda; daha geç çekilen önde
+    retired_rank = -trace.dnf_lap
+    prev_pos = np.empty(n, dtype=np.int64)
+    prev_pos[trace.grid_order] = np.arange(n)
+    pit_stops = np.zeros(n, dtype=np.int64)
+    leader, prev_sc = int(trace.grid_order[0]), False
+    for lap in range(laps):
+        total = trace.total_time[lap]
+        order = np.lexsort((retired_rank, total))
+        running = np.isfinite(total)
+        pos = np.empty(n, dtype=np.int64)
+        pos[order] = np.arange(n)
+        gap = np.where(running, total - total[order[0]], np.nan)
+        # Yarıştakiler sıralamanın başında (çekilenler sonda)
+        in_race = order[:int(running.sum())]
+        interval = np.full(n, np.nan)
+        interval[in_race[1:]] = np.diff(total[in_race])
+        pit_stops += trace.pits[lap]
+
+        events = []
+        sc = bool(trace.safety_car[lap])
+        if lap == trace.rain_lap and lap > 0: events.append(LapEvent(lap, "rain", -1))
+        if sc and not prev_sc: events.append(LapEvent(lap, "sc_start", -1))
+        elif prev_sc and not sc: events.append(LapEvent(lap, "sc_end", -1))
+        events += [LapEvent(lap, "pit", int(i)) for i in np.flatnonzero(trace.pits[lap])]
+        events += [LapEvent(lap, "dnf", int(i)) for i in np.flatnonzero(trace.dnf_lap == lap)]
+        if running[order[0]] and order[0] != leader:
+            leader = int(order[0])
+            events.append(LapEvent(lap, "lead", leader))
+
+        yield LapFrame(lap, laps, order, gap, interval, prev_pos - pos, pit_stops.copy(), sc, events)
+        prev_pos, prev_sc = pos, sc
@@ -0,0 +1,258 @@
+import random
+from collections import ChainMap
+
+import numpy as np
+
+from f1_engine import Driver, NameRegistry, SeedStream, fork_layers, process_rookie_entry
+
+# Transfer piyasası. Ligin tohumundan, parça parça (vektörel) üretilen büyük bir
+# genç pilot havuzu ve serbest pilotlar (başlangıç havuzu, kovulanlar). Adaylar
+# genel güce göre sıralı tutulur; bir takımın bütçesiyle alabileceği en iyi
+# aday ikili aramayla bulunur. Alınan adaylar silinmez, "atla" bağlarıyla
+# (yol sıkıştırmalı) geçilir; böylece sorgu havuzun boyutundan bağımsız kalır.
+# Bir transfer dönemindeki tüm koltuklar tek geçişte, sondan başa (puan
+# durumunda en geride kalan takım ilk seçer) doldurulur.
+#
+#   market = TransferMarket.for_league(league).attach(league)
+#   market.top_by("handling", 20)      # gözlemcilik
+#   market.best(max_value=12.0)        # 12 M€'ya alınabilecek en güçlü aday
+
+MARKET_SIZE = 100_000
+BATCH_SIZE = 16_384
+ATTRIBUTES = ("speed", "handling", "braking", "intelligence")
+ATTR_NAMES = {"speed": "Hız", "handling": "Kontrol", "braking": "Fren", "intelligence": "Zeka", "overall_power": "Güç"}
+
+# Özellikler onda bir hassasiyetle uint8 olarak tutulur (5.3 -> 53)
+ATTR_MEAN, ATTR_STD, ATTR_MIN, ATTR_MAX = 50, 12, 20, 95
+
+# Piyasa değeri (M€): 20 güç 4 M€, her 2 güç puanında iki katı
+BASE_POWER, BASE_VALUE, VALUE_DOUBLING = 20.0, 4.0, 2.0
+# Koltuk bütçesi: son takımdan şampiyon takıma, ±%20 pazarlık payıyla
+BUDGET_RANGE = (6.0, 24.0)
+BUDGET_SPREAD = 0.2
+# Bütçeye sığan en güçlü bu kadar aday arasından takımın ihtiyacına en uygunu seçilir
+FIT_WINDOW = 32
+# Piyasada bekleyen serbest pilot sınırı; aşılırsa en eskiler piyasadan çekilir
+FREE_AGENT_LIMIT = 32
+
+FIRST_NAMES = ("Alp", "Arda", "Aras", "Atlas", "Batu", "Bora", "Can", "Cem", "Çağan", "Doruk", "Ece", "Efe", "Ege",
+               "Emir", "Emre", "Ilgaz", "İpek", "Kuzey", "Lara", "Mert", "Mina", "Nehir", "Onur", "Oğuz", "Rüzgar",
+               "Selin", "Serkan", "Sude", "Tuna", "Tolga", "Umut", "Utku", "Zeynep", "Deren", "Poyraz", "Defne")
+SURNAMES = ("Aksoy", "Arslan", "Aydın", "Başar", "Çelik", "Demir", "Doğan", "Erdem", "Ersoy", "Güneş", "Kaya", "Karaca",
+            "Koç", "Korkmaz", "Kurt", "Özdemir", "Öztürk", "Polat", "Şahin", "Tekin", "Tan", "Uçar", "Ünal", "Yalçın",
+            "Yıldız", "Yılmaz", "Yurt", "Zorlu", "Akın", "Bulut", "Ateş", "Duman")
+
+def player_value(power):
+    """Genel güçten piyasa değeri (M€)."""
+    return BASE_VALUE * 2 ** ((power - BASE_POWER) / VALUE_DOUBLING)
+
+def power_cap(budget):
+    """Bütçeyle alınabilecek en yüksek genel güç (`player_value`nun tersi); diziyle de çalışır."""
+    return BASE_POWER + VALUE_DOUBLING * np.log2(np.divide(budget, BASE_VALUE))
+
+def _cap_tenths(budget):
+    # Güç indeksi onda bir birimdedir; yuvarlama, sınırdaki değerin kayan nokta hatasıyla düşmesini önler
+    return np.floor(np.round(power_cap(budget) * 10, 6))
+
+# ====================================================================
+# --- I. ADAY ÜRETİMİ ---
+# ====================================================================
+
+def generate_prospects(seed, size=MARKET_SIZE, batch_size=BATCH_SIZE):
+    """(özellikler (size, 4) uint8, ad indeksleri (size, 2) uint8). Her parça kendi
+    akışından üretilir; ilk k aday havuzun toplam boyutundan bağımsızdır."""
+    attrs = np.empty((size, len(ATTRIBUTES)), dtype=np.uint8)
+    names = np.empty((size, 2), dtype=np.uint8)
+    for batch, start in enumerate(range(0, size, batch_size)):
+        n = min(batch_size, size - start)
+        rng = SeedStream(seed, ("prospects", batch)).numpy()
+        values = np.rint(rng.normal(ATTR_MEAN, ATTR_STD, size=(n, len(ATTRIBUTES))))
+        attrs[start:start + n] = np.clip(values, ATTR_MIN, ATTR_MAX)
+        names[start:start + n, 0] = rng.integers(len(FIRST_NAMES), size=n)
+        names[start:start + n, 1] = rng.integers(len(SURNAMES), size=n)
+    return attrs, names
+
+# ====================================================================
+# --- II. PİYASA ---
+# ====================================================================
+
+class TransferMarket:
+    """Genç pilot havuzu ve güce göre sıralı indeksi.
+
+    Güç indeksinde i. konum i. en zayıf adaydır. `_skip`, alınmış konumdan
+    altındaki ilk aday olabilecek konuma bağdır (-1: aday yok); sadece alınan
+    konumlar için tutulur ve çatallarda katmanlı paylaşılır (bkz. `fork_layers`).
+    Özellik bazlı gözlemcilik indeksleri ilk kullanımda kurulur."""
+
+    def __init__(self, seed, size=MARKET_SIZE):
+        self.seed = seed
+        self.size = size
+        self.attrs, self.names = generate_prospects(seed, size)
+        power = self.attrs.sum(axis=1, dtype=np.uint16)
+        self.order = np.argsort(power, kind="stable")
+        self.sorted_power = power[self.order]
+        self._position = None
+        self._by_attr = {}
+        self._skip = ChainMap({})
+        # Son transfer döneminin imzaları (UI için)
+        self.last_window = []
+
+    @classmethod
+    def for_league(cls, league, size=MARKET_SIZE):
+        return cls(league.stream("market").seed_int() & 0xFFFFFFFF, size)
+
+    def attach(self, league):
+        league.market = self
+        return self
+
+    def __len__(self): return self.size - len(self._skip)
+
+    def fork(self):
+        """Çatal lig için piyasa; aday dizileri paylaşılır, sadece alınanlar ayrışır."""
+        market = object.__new__(TransferMarket)
+        market.__dict__.update(self.__dict__)
+        market._skip = fork_layers(self._skip)
+        market.last_window = list(self.last_window)
+        return market
+
+    # --- Kalıcılık ---
+    def state(self):
+        return {"seed": self.seed, "size": self.size, "taken": sorted(int(self.order[p]) for p in self._skip),
+                "last_window": self.last_window}
+
+    @classmethod
+    def from_state(cls, state):
+        market = cls(state["seed"], state["size"])
+        for p in market._positions()[state["taken"]].tolist(): market._take(p)
+        market.last_window = state["last_window"]
+        return market
+
+    # --- Güç indeksi ---
+    def _free(self, p):
+        """`p` ya da altındaki ilk alınmamış konum (yoksa -1)."""
+        skip = self._skip
+        path = []
+        while p >= 0 and p in skip:
+            path.append(p)
+            p = skip[p]
+        for q in path[:-1]: skip[q] = p
+        return p
+
+    def _take(self, p): self._skip[p] = p - 1
+
+    def _affordable_end(self, max_value):
+        if max_value is None: return self.size
+        return int(np.searchsorted(self.sorted_power, _cap_tenths(max_value), side="right"))
+
+    def _positions(self):
+        """Aday numarasından güç indeksindeki konuma."""
+        if self._position is None:
+            self._position = np.empty(self.size, dtype=np.int64)
+            self._position[self.order] = np.arange(self.size)
+        return self._position
+
+    def _window(self, end, k):
+        """`end` konumunun altındaki ilk k müsait konum, güçten zayıfa."""
+        out = []
+        p = self._free(end - 1)
+        while p >= 0 and len(out) < k:
+            out.append(p)
+            p = self._free(p - 1)
+        return out
+
+    def candidates(self, max_value=None, k=FIT_WINDOW):
+        """Bütçeye sığan en güçlü k adayın güç indeksindeki konumları."""
+        return self._window(self._affordable_end(max_value), k)
+
+    def best(self, max_value=None):
+        """Bütçeye sığan en güçlü aday (`prospect` satırı) ya da None."""
+        found = self.candidates(max_value, 1)
+        return self.prospect(int(self.order[found[0]])) if found else None
+
+    # --- Gözlemcilik ---
+    def top_by(self, attribute="overall_power", k=20, max_value=None):
+        """Özelliğe (ya da genel güce) göre en iyi k müsait aday."""
+        if attribute == "overall_power":
+            return [self.prospect(int(self.order[p])) for p in self.candidates(max_value, k)]
+        position = self._positions()
+        if attribute not in self._by_attr:
+            self._by_attr[attribute] = np.argsort(-self.attrs[:, ATTRIBUTES.index(attribute)], kind="stable")
+        cap = np.inf if max_value is None else _cap_tenths(max_value)
+        taken = np.fromiter(self._skip, dtype=np.int64, count=len(self._skip))
+        # Sıralı indeks, büyüyen bloklar halinde ve sadece k aday bulunana kadar taranır
+        ranked, found = self._by_attr[attribute], []
+        start, block = 0, max(4 * k, 256)
+        while start < self.size and len(found) < k:
+            ids = ranked[start:start + block]
+            p = position[ids]
+            ok = self.sorted_power[p] <= cap
+            if len(taken): ok &= ~np.isin(p, taken)
+            found.extend(ids[ok][:k - len(found)].tolist())
+            start, block = start + block, block * 2
+        return [self.prospect(i) for i in found]
+
+    def prospect(self, i):
+        first, last = self.names[i]
+        values = self.attrs[i] / 10
+        row = {"id": i, "name": f"{FIRST_NAMES[first]} {SURNAMES[last]}"}
+        row.update(zip(ATTRIBUTES, values.tolist()))
+        row["overall_power"] = round(float(values.sum()), 1)
+        row["value"] = round(player_value(row["overall_power"]), 1)
+        return row
+
+    # --- Transfer dönemi ---
+    def fill(self, league, team_names, rng=None, names=None):
+        """Boşalan koltuklar için yeni pilotlar (`team_names` sırasıyla).
+
+        Bütçeler ve bütçe sınırındaki indeks konumları tüm koltuklar için tek
+        seferde hesaplanır. Takımlar puan durumunda sondan başa seçer; her koltuk,
+        bütçesine sığan en güçlü `FIT_WINDOW` aday ve serbest pilotlar arasından
+        takım arkadaşının en zayıf özelliğinde en iyi olanı alır. Üretilen
+        adayların isimleri çakışabildiği için isimler `names` üzerinden alınır."""
+        rng = random if rng is None else rng
+        names = NameRegistry(league) if names is None else names
+        if not team_names: return []
+        teams = {t.name: t for t in league.teams}
+        ranking = sorted(teams, key=lambda name: teams[name].season_points, reverse=True)
+        place = np.array([ranking.index(name) for name in team_names])
+        lo, hi = BUDGET_RANGE
+        budgets = (hi - (hi - lo) * place / max(len(ranking) - 1, 1)) * \
+            np.array([rng.uniform(1 - BUDGET_SPREAD, 1 + BUDGET_SPREAD) for _ in team_names])
+        ends = np.searchsorted(self.sorted_power, _cap_tenths(budgets), side="right")
+
+        picks = [None] * len(team_names)
+        mates = {name: [[getattr(d, a) for a in ATTRIBUTES] for d in teams[name].drivers] for name in set(team_names)}
+        for seat in sorted(range(len(team_names)), key=lambda s: -place[s]):
+            name, budget = team_names[seat], float(budgets[seat])
+            # İhtiyaç: takım arkadaşlarının ortalamada en zayıf olduğu özellik (yoksa genel güç)
+            need = int(np.argmin(np.mean(mates[name], axis=0))) if mates[name] else None
+            fit = lambda attrs: (sum(attrs) if need is None else attrs[need], sum(attrs))
+            options = [(fit((self.attrs[self.order[p]] / 10).tolist()), "prospect", p)
+                       for p in self._window(int(ends[seat]), FIT_WINDOW)]
+            for j, entry in enumerate(league.rookie_pool):
+                if player_value(sum(entry[1:])) <= budget: options.append((fit(list(entry[1:])), "free", j))
+            if not options:
+                picks[seat] = (budget, None, False)
+                continue
+            _, source, key = max(options, key=lambda o: o[0])
+            if source == "prospect":
+                self._take(key)
+                row = self.prospect(int(self.order[key]))
+                entry = (row["name"],) + tuple(row[a] for a in ATTRIBUTES)
+            else:
+                entry = league.rookie_pool[key]
+                del league.rookie_pool[key]
+            picks[seat] = (budget, entry, source == "free")
+            mates[name].append(list(entry[1:]))
+
+        # Satırlar koltuk sırasıyla açılır; bütçeye uyan kimse yoksa çaylak havuzuna düşülür
+        signed, window = [], []
+        for name, (budget, entry, free) in zip(team_names, picks):
+            if entry is None: driver = process_rookie_entry(league, name, rng=rng, names=names)
+            else: driver = Driver(names.claim(entry[0], returning=free), name, *entry[1:], rng=rng, store=league.store)
+            signed.append(driver)
+            window.append({"Takım": name, "Pilot": driver.name, "Güç": round(driver.overall_power, 1),
+                           "Değer (M€)": round(player_value(driver.overall_power), 1), "Bütçe (M€)": round(budget, 1)})
+        self.last_window = window
+        while len(league.rookie_pool) > FREE_AGENT_LIMIT: league.rookie_pool.popleft()
+        return signed
@@ -0,0 +1,138 @@
+import weakref
+from typing import NamedTuple
+
+import numpy as np
+
+from f1_batch import compile_grid
+from f1_engine import POLE_BOOST, RACE_POINTS, RAIN_CHANCE
+
+# Örneklemesiz (analitik) yarış oranları. Sıralama ve yarış skorları
+# "güç + düzgün (uniform) gürültü" olduğu için her pilotun skor dağılımı
+# parçalı doğrusaldır; "i, x skorunu aldığında önünde kaç pilot var"
+# olasılıkları parçalar arasında x'in polinomudur. İntegraller her parçada
+# Gauss-Legendre ile alınır ve n pilot için ceil(n/2) düğüm bu polinomları
+# tam (yuvarlama hatası dışında kesin) integre eder. Yarış olasılıkları
+# kuru/yağmurlu hava ve pole pilotu üzerinden karışım olarak hesaplanır.
+
+POINTS_POSITIONS = max(RACE_POINTS)
+_POINTS = np.array([RACE_POINTS.get(pos, 0) for pos in range(1, POINTS_POSITIONS + 1)], dtype=np.float64)
+
+class CircuitOdds(NamedTuple):
+    circuit: str
+    names: list
+    pole: np.ndarray             # P(pole)
+    win: np.ndarray              # P(galibiyet)
+    podium: np.ndarray           # P(ilk 3)
+    expected_points: np.ndarray  # E[puan]
+    dnf: np.ndarray              # P(DNF)
+
+    def rows(self):
+        """Tablo satırları, galibiyet olasılığına göre azalan."""
+        order = np.argsort(-self.win, kind="stable")
+        return [{"Pilot": self.names[i], "Pole %": float(self.pole[i] * 100), "Galibiyet %": float(self.win[i] * 100),
+                 "Podyum %": float(self.podium[i] * 100), "Beklenen P": float(self.expected_points[i]),
+                 "DNF %": float(self.dnf[i] * 100)} for i in order]
+
+# ====================================================================
+# --- I. İNTEGRASYON ---
+# ====================================================================
+
+def _nodes(lo, hi, n_points):
+    """Tüm kırılma noktalarıyla ayrılan parçalarda Gauss-Legendre düğümleri ve ağırlıkları."""
+    edges = np.unique(np.concatenate([lo, hi]))
+    t, w = np.polynomial.legendre.leggauss(n_points)
+    a, b = edges[:-1, None], edges[1:, None]
+    x = ((b - a) / 2 * t + (a + b) / 2).ravel()
+    weights = ((b - a) / 2 * w).ravel()
+    return x, weights
+
+def _cdf_density(lo, hi, x):
+    """(n, P) boyutlu F_j(x) ve f_j(x) matrisleri; j'nin skoru [lo_j, hi_j] üzerinde düzgün."""
+    width = (hi - lo)[:, None]
+    cdf = np.clip((x[None, :] - lo[:, None]) / width, 0.0, 1.0)
+    inside = (x[None, :] > lo[:, None]) & (x[None, :] < hi[:, None])
+    return cdf, np.where(inside, 1.0 / width, 0.0)
+
+def pole_probabilities(qualy_power, chaos):
+    """P(i en yüksek sıralama skorunu alır) = ∫ f_i(x) ∏_{j≠i} F_j(x) dx."""
+    n = len(qualy_power)
+    if n == 1: return np.ones(1)
+    lo, hi = qualy_power - chaos, qualy_power + chaos
+    x, w = _nodes(lo, hi, (n + 1) // 2)
+    cdf, density = _cdf_density(lo, hi, x)
+    # i hariç çarpım: önek ve sonek çarpımlarıyla (F_j sıfır olabilir, bölme yapılmaz)
+    ones = np.ones((1, len(x)))
+    prefix = np.cumprod(np.vstack([ones, cdf[:-1]]), axis=0)
+    suffix = np.vstack([np.cumprod(cdf[::-1], axis=0)[-2::-1], ones])
+    return (density * prefix * suffix) @ w
+
+def position_probabilities(power, chaos, dnf_chance, positions=POINTS_POSITIONS):
+    """(n, positions) boyutlu P(i yarışı k. sırada bitirir), tek hava ve sabit güçler için.
+
+    i, x skorunu aldığında önündeki pilot sayısı bağımsız Bernoulli'lerin toplamıdır:
+    r_j(x) = (1 - p_j)(1 - F_j(x)). Dağılımın ilk `positions` terimi tüm i'ler için
+    aynı anda, j üzerinden kesilmiş bir dinamik programla hesaplanır."""
+    n = len(power)
+    lo, hi = power - chaos, power + chaos
+    x, w = _nodes(lo, hi, (n + 1) // 2)
+    cdf, density = _cdf_density(lo, hi, x)
+    ahead = (1.0 - dnf_chance)[:, None] * (1.0 - cdf)
+    state = np.zeros((n, positions, len(x)))
+    state[:, 0, :] = 1.0
+    for j in range(n):
+        r = ahead[j]
+        new = state * (1.0 - r)
+        new[:, 1:, :] += state[:, :-1, :] * r
+        new[j] = state[j]  # pilot kendi önünde sayılmaz
+        state = new
+    finish = (1.0 - dnf_chance)[:, None]
+    return finish * np.einsum("ikp,ip,p->ik", state, density, w)
+
+# ====================================================================
+# --- II. PİST ORANLARI ---
+# ====================================================================
+
+def compute_circuit_odds(drivers, circuit):
+    """Pistte sıradaki yarış için kesin pole, galibiyet, podyum ve beklenen puan olasılıkları."""
+    grid = compile_grid(drivers, circuit)
+    n = len(drivers)
+    dnf = np.clip(grid.dnf_chance, 0.0, 1.0)
+    pole = pole_probabilities(grid.qualy_power, grid.qualy_chaos)
+
+    positions = min(max(POINTS_POSITIONS, 3), n)
+    finish = np.zeros((n, positions))
+    for weather_p, power in ((1.0 - RAIN_CHANCE, grid.dry_power), (RAIN_CHANCE, grid.wet_power)):
+        # Pole pilotu yarışta POLE_BOOST alır: pole sahibi üzerinden karışım
+        for k in range(n):
+            if pole[k] <= 0.0: continue
+            boosted = power.copy()
+            boosted[k] += POLE_BOOST
+            finish += weather_p * pole[k] * position_probabilities(boosted, grid.race_chaos, dnf, positions)
+
+    points = finish[:, :min(positions, len(_POINTS))] @ _POINTS[:min(positions, len(_POINTS))]
+    return CircuitOdds(circuit.name, [d.name for d in drivers], pole, finish[:, 0], finish[:, :3].sum(axis=1), points, dnf)
+
+# Mağaza başına (özellik sürümü, {(satırlar, pist, odak): CircuitOdds}); sürüm
+# `Driver.update_overall` ile artar, yani sezon gelişiminden sonra önbellek boşalır
+_CACHE = weakref.WeakKeyDictionary()
+
+def circuit_odds(drivers, circuit):
+    """`compute_circuit_odds`un önbellekli hali."""
+    store = drivers[0].store
+    version, entries = _CACHE.get(store, (None, None))
+    if version != store.version:
+        entries = {}
+        _CACHE[store] = (store.version, entries)
+    key = (tuple(d.row for d in drivers), circuit.name, circuit.focus_factor)
+    odds = entries.get(key)
+    if odds is None: odds = entries[key] = compute_circuit_odds(drivers, circuit)
+    return odds
+
+def next_race_odds(league):
+    """Takvimdeki sıradaki yarışın oranları; sezon bittiyse None."""
+    circuit = league.current_circuit()
+    return None if circuit is None or not league.drivers else circuit_odds(league.drivers, circuit)
+
+def season_odds(league):
+    """Sezonun kalan tüm pistleri için oranlar (önbelleği sezon başında ısıtmak için)."""
+    return [circuit_odds(league.drivers, c) for c in league.circuits[league.current_race_idx:]]
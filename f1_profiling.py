@@ -0,0 +1,143 @@
+import json
+import sys
+import threading
+import time
+import types
+from array import array
+from collections import deque
+
+# Aşama (phase) bazlı zamanlama ve sayaçlar. Motor ve arayüz, ölçülecek
+# bölgeleri `with phase("ad"):` ile işaretler. Profilleme kapalıyken `phase`
+# paylaşılan boş bir bağlam nesnesi döndürür, yani maliyet bir bayrak kontrolü
+# ve bir fonksiyon çağrısıdır. Açıkken her aşamanın son WINDOW süresi tutulur
+# (p50/p99 için) ve Chrome/Perfetto iz (trace) biçiminde dışa aktarılabilir.
+
+# ====================================================================
+# --- I. AŞAMA ZAMANLAYICI ---
+# ====================================================================
+
+WINDOW = 512
+MAX_TRACE_EVENTS = 100_000
+
+class _NullPhase:
+    __slots__ = ()
+    def __enter__(self): return self
+    def __exit__(self, *exc): return False
+
+_NULL_PHASE = _NullPhase()
+
+class _Phase:
+    __slots__ = ("profiler", "name", "start")
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, time.perf_counter() - self.start, self.start)
+        return False
+
+class Profiler:
+    """Süreç genelinde tek örnek (`PROFILER`) kullanılır; kayıtlar kilitle korunur
+    çünkü Streamlit her oturumu ayrı bir iş parçacığında koşturur."""
+    def __init__(self, window=WINDOW, max_trace_events=MAX_TRACE_EVENTS):
+        self.enabled = False
+        self.window = window
+        self.max_trace_events = max_trace_events
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.samples = {}
+            self.totals = {}
+            self.counters = {}
+            self.trace = deque(maxlen=self.max_trace_events)
+
+    def phase(self, name):
+        if not self.enabled: return _NULL_PHASE
+        return _Phase(self, name)
+
+    def record(self, name, seconds, start=None):
+        with self._lock:
+            samples = self.samples.get(name)
+            if samples is None:
+                samples = self.samples[name] = deque(maxlen=self.window)
+            samples.append(seconds)
+            calls, total = self.totals.get(name, (0, 0.0))
+            self.totals[name] = (calls + 1, total + seconds)
+            if start is not None:
+                self.trace.append((name, start - self._origin, seconds, threading.get_ident()))
+
+    def count(self, name, n=1):
+        if not self.enabled: return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    # --- Raporlama ---
+    def percentiles(self, name, qs=(0.5, 0.99)):
+        with self._lock:
+            values = sorted(self.samples.get(name, ()))
+        if not values: return tuple(0.0 for _ in qs)
+        return tuple(values[min(len(values) - 1, int(q * len(values)))] for q in qs)
+
+    def summary(self):
+        """Aşama başına (ad, çağrı, toplam, p50, p99) satırları; toplam süreye göre azalan."""
+        rows = []
+        for name in list(self.samples):
+            p50, p99 = self.percentiles(name)
+            calls, total = self.totals[name]
+            rows.append({"phase": name, "calls": calls, "total": total, "p50": p50, "p99": p99})
+        return sorted(rows, key=lambda r: r["total"], reverse=True)
+
+    def trace_events(self):
+        """Chrome iz biçimi (chrome://tracing, ui.perfetto.dev): tam süreli "X" olayları."""
+        with self._lock:
+            spans = list(self.trace)
+        return {"traceEvents": [{"name": name, "ph": "X", "ts": start * 1e6, "dur": seconds * 1e6, "pid": 1, "tid": tid}
+                                for name, start, seconds, tid in spans],
+                "otherData": {"counters": dict(self.counters)}}
+
+    def export_trace(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.trace_events(), f)
+        return path
+
+PROFILER = Profiler()
+
+def phase(name): return PROFILER.phase(name)
+
+def count(name, n=1): PROFILER.count(name, n)
+
+# ====================================================================
+# --- II. BELLEK TAHMİNİ ---
+# ====================================================================
+
+def deep_sizeof(obj, _seen=None):
+    """Kaba derin boyut: kapsayıcılar, __dict__/__slots__ ve tipli diziler gezilir;
+    paylaşılan nesneler bir kez sayılır."""
+    seen = set() if _seen is None else _seen
+    stack = [obj]
+    total = 0
+    while stack:
+        o = stack.pop()
+        if id(o) in seen: continue
+        seen.add(id(o))
+        try: total += sys.getsizeof(o)
+        except TypeError: continue
+        if isinstance(o, (str, bytes, bytearray, int, float, bool, array, type(None))): continue
+        if isinstance(o, (types.ModuleType, type, types.FunctionType, types.MethodType)): continue
+        if isinstance(o, dict):
+            stack.extend(o.keys())
+            stack.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset, deque)):
+            stack.extend(o)
+        else:
+            if hasattr(o, "__dict__"): stack.append(o.__dict__)
+            for slot in getattr(type(o), "__slots__", ()):
+                if hasattr(o, slot): stack.append(getattr(o, slot))
+    return total
@@ -0,0 +1,348 @@
+import json
+import os
+import random
+import sqlite3
+
+from f1_engine import (
+    Circuit, Driver, DriverStore, HistoryLog, League, PointsArchive, RetiredArchive, RetiredDriver, SeasonPoints, Team
+)
+from f1_events import EventLog
+from f1_laps import LapModel
+from f1_market import TransferMarket
+
+# Evrenin kalıcı saklanması. `StorageBackend` arayüzü motorun kayıt
+# noktalarını (yarış sonu, sezon geçişi) tanımlar; `SQLiteStorage` WAL kipinde
+# yerel bir dosya kullanan referans uygulamadır. Her kayıt noktası tek bir
+# işlem (transaction) olduğu için çökmede en fazla yarım kalan yarış kaybolur.
+
+# Kayıt biçimi değiştikçe artar; farklı sürümlü dosyalar okunmaz.
+# 1: ilk şema, 2: olay günlüğü, 3: sütunlu puan tablosu, 4: kodlu ödüller,
+# 5: transfer piyasası (meta "market"), 6: tur tur yarış modu (meta "lap_model_laps")
+SCHEMA_VERSION = 6
+
+DRIVER_COLUMNS = DriverStore.FLOAT_COLUMNS + DriverStore.INT_COLUMNS
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS drivers (
+    row INTEGER PRIMARY KEY, name TEXT NOT NULL, team TEXT NOT NULL, category TEXT NOT NULL,
+    {", ".join(f"{c} REAL NOT NULL" for c in DriverStore.FLOAT_COLUMNS)},
+    {", ".join(f"{c} INTEGER NOT NULL" for c in DriverStore.INT_COLUMNS)},
+    achievements TEXT, specific_race_wins TEXT,
+    status TEXT NOT NULL, position INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS teams (name TEXT PRIMARY KEY, position INTEGER NOT NULL, season_points INTEGER NOT NULL, driver_rows TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS circuits (name TEXT PRIMARY KEY, focus_factor REAL NOT NULL);
+CREATE TABLE IF NOT EXISTS hall_of_fame (year INTEGER PRIMARY KEY, champion TEXT NOT NULL, team TEXT NOT NULL, points INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS races (
+    year INTEGER NOT NULL, race_idx INTEGER NOT NULL, circuit TEXT NOT NULL, winner TEXT, logs TEXT NOT NULL,
+    PRIMARY KEY (year, race_idx)
+);
+CREATE TABLE IF NOT EXISTS race_results (
+    year INTEGER NOT NULL, race_idx INTEGER NOT NULL, seq INTEGER NOT NULL, position INTEGER,
+    driver TEXT NOT NULL, team TEXT NOT NULL, points INTEGER NOT NULL, status TEXT NOT NULL,
+    PRIMARY KEY (year, race_idx, seq)
+);
+CREATE TABLE IF NOT EXISTS qualifying (
+    year INTEGER NOT NULL, race_idx INTEGER NOT NULL, position INTEGER NOT NULL, driver TEXT NOT NULL, score TEXT NOT NULL,
+    PRIMARY KEY (year, race_idx, position)
+);
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY, kind INTEGER NOT NULL, year INTEGER NOT NULL, race INTEGER NOT NULL,
+    driver INTEGER NOT NULL, a INTEGER NOT NULL, b REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS points_history (
+    year INTEGER PRIMARY KEY, names TEXT NOT NULL, rows TEXT NOT NULL, n_races INTEGER NOT NULL,
+    filled INTEGER NOT NULL, typecode TEXT NOT NULL, gains BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS event_symbols (id INTEGER PRIMARY KEY, text TEXT NOT NULL);
+"""
+
+class StorageBackend:
+    """Kalıcı depolama arayüzü. Motor, `recorder` olarak verilen her nesnenin
+    `record_race` / `record_season` metotlarını ilgili adımdan sonra çağırır."""
+    def save(self, league): raise NotImplementedError
+    def load(self): raise NotImplementedError
+    def exists(self): raise NotImplementedError
+    def record_race(self, league): raise NotImplementedError
+    def record_season(self, league): raise NotImplementedError
+    def race_history(self, year): raise NotImplementedError
+    def close(self): pass
+
+# ====================================================================
+# --- SATIR DÖNÜŞÜMLERİ ---
+# ====================================================================
+
+def _driver_row(d, status, position):
+    # Aktif `Driver` ve emekli `RetiredDriver` aynı arayüzle okunur; ödüller paketlenmiş kodlardır
+    achievements = d.achievement_codes
+    race_wins = d.specific_race_wins
+    return ((d.row, d.name, d.team, d.category)
+            + tuple(getattr(d, c) for c in DRIVER_COLUMNS)
+            + (json.dumps(achievements, ensure_ascii=False) if achievements else None,
+               json.dumps(race_wins, ensure_ascii=False) if race_wins else None,
+               status, position))
+
+def _race_result_rows(year, race_idx, race_data):
+    rows = []
+    for seq, r in enumerate(race_data):
+        position = r["Sıra"] if r["Sıra"] != "-" else None
+        rows.append((year, race_idx, seq, position, r["Pilot"], r["Takım"], int(r["Puan"].lstrip("+")), r["Durum"]))
+    return rows
+
+def _race_data_from_rows(rows):
+    race_data = []
+    for position, driver, team, points, status in rows:
+        label = f"+{points}" if status != "DNF" and position <= 10 else "0"
+        race_data.append({"Sıra": position if position is not None else "-", "Pilot": driver, "Takım": team, "Puan": label, "Durum": status})
+    return race_data
+
+# ====================================================================
+# --- SQLITE ---
+# ====================================================================
+
+class SQLiteStorage(StorageBackend):
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self): self.conn.close()
+
+    def stored_seed(self):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'seed'").fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def stored_version(self):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def exists(self): return self.stored_seed() is not None
+
+    def _same_universe(self, league):
+        # Artımlı kayıt sadece aynı evrenin, aynı biçimdeki dosyasına yapılır
+        return self.stored_seed() == league.seed and self.stored_version() == SCHEMA_VERSION
+
+    # --- Yazma ---
+    def _write_meta(self, league):
+        values = {
+            "schema_version": SCHEMA_VERSION,
+            "seed": league.seed,
+            "current_year": league.current_year,
+            "current_race_idx": league.current_race_idx,
+            "calendar": [c.name for c in league.circuits],
+            "rookie_pool": list(league.rookie_pool),
+            "power_rank_map": league.power_rank_map,
+            "track_winners": league.track_winners,
+            "transfer_log": league.transfer_log,
+            "development_history": league.development_history,
+            "all_winners": league.all_winners,
+            "all_poles": league.all_poles,
+            "market": None if league.market is None else league.market.state(),
+            "lap_model_laps": None if league.lap_model is None else league.lap_model.laps,
+        }
+        self.conn.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                              [(k, json.dumps(v, ensure_ascii=False)) for k, v in values.items()])
+
+    def _write_drivers(self, drivers, status, start=0):
+        placeholders = ", ".join("?" * (len(DRIVER_COLUMNS) + 8))
+        self.conn.executemany(f"INSERT OR REPLACE INTO drivers VALUES ({placeholders})",
+                              (_driver_row(d, status, i) for i, d in enumerate(drivers, start)))
+
+    def _write_teams(self, league):
+        self.conn.executemany("INSERT OR REPLACE INTO teams VALUES (?, ?, ?, ?)",
+                              [(t.name, i, t.season_points, json.dumps([d.row for d in t.drivers])) for i, t in enumerate(league.teams)])
+
+    def _write_race(self, year, race_idx, entry):
+        self.conn.execute("INSERT OR REPLACE INTO races VALUES (?, ?, ?, ?, ?)",
+                          (year, race_idx, entry["circuit"].name, entry["winner_name"], json.dumps(entry["logs"], ensure_ascii=False)))
+        self.conn.executemany("INSERT OR REPLACE INTO race_results VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                              _race_result_rows(year, race_idx, entry["race_data"]))
+        self.conn.executemany("INSERT OR REPLACE INTO qualifying VALUES (?, ?, ?, ?, ?)",
+                              [(year, race_idx, q["Sıra"], q["Pilot"], q["Skor"]) for q in entry["qual_data"]])
+
+    def _write_points(self, table):
+        typecode, blob = table.pack()
+        self.conn.execute("INSERT OR REPLACE INTO points_history VALUES (?, ?, ?, ?, ?, ?, ?)",
+                          (table.year, json.dumps(table.names, ensure_ascii=False), json.dumps(table.rows.tolist()),
+                           table.n_races, table.filled, typecode, blob))
+
+    def _write_archived_points(self, league, year):
+        names, rows, n_races, filled, typecode, blob = league.points_archive.seasons[year]
+        self.conn.execute("INSERT OR REPLACE INTO points_history VALUES (?, ?, ?, ?, ?, ?, ?)",
+                          (year, json.dumps(names, ensure_ascii=False), json.dumps(rows), n_races, filled, typecode, blob))
+
+    def _write_events(self, league):
+        """Olay günlüğünün henüz yazılmamış kısmını ekler (günlük sadece büyür)."""
+        log = league.events
+        if log is None: return
+        (written,) = self.conn.execute("SELECT COUNT(*) FROM events").fetchone()
+        (known_symbols,) = self.conn.execute("SELECT COUNT(*) FROM event_symbols").fetchone()
+        self.conn.executemany("INSERT INTO event_symbols VALUES (?, ?)",
+                              [(i, text) for i, text in enumerate(log.symbols[known_symbols:], known_symbols)])
+        self.conn.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?)",
+                              [(seq,) + tuple(e) for seq, e in enumerate(log.events_from(written), written)])
+
+    def save(self, league):
+        """Tüm evrenin anlık görüntüsü, tek işlemde. Dosyada başka bir evren varsa silinir.
+
+        Aynı evrende bellekte tam duran her şey (pilotlar, takımlar, Şöhretler
+        Müzesi, puan arşivi, olay günlüğü) baştan yazılır. Geçmiş sezonların
+        yarışları bellekte olmadığı için korunur; güncel sezon ve sonrası silinip
+        yeniden yazılır (dosyada daha uzun ya da farklı bir gelecek kalmasın)."""
+        other_universe = self.exists() and not self._same_universe(league)
+        with self.conn:
+            tables = ("drivers", "teams", "hall_of_fame", "points_history", "events", "event_symbols")
+            if other_universe: tables += ("meta", "circuits", "races", "race_results", "qualifying")
+            for table in tables:
+                self.conn.execute(f"DELETE FROM {table}")
+            if not other_universe:
+                for table in ("races", "race_results", "qualifying"):
+                    self.conn.execute(f"DELETE FROM {table} WHERE year >= ?", (league.current_year,))
+            self._write_meta(league)
+            self._write_drivers(league.drivers, "active")
+            self._write_drivers(league.retired_drivers, "retired")
+            self._write_teams(league)
+            self.conn.executemany("INSERT OR REPLACE INTO circuits VALUES (?, ?)", [(c.name, c.focus_factor) for c in league.circuits])
+            self.conn.executemany("INSERT OR REPLACE INTO hall_of_fame VALUES (?, ?, ?, ?)",
+                                  [(h["Yıl"], h["Şampiyon"], h["Takım"], h["Puan"]) for h in league.hall_of_fame])
+            for race_idx, entry in enumerate(league.race_history):
+                self._write_race(league.current_year, race_idx, entry)
+            for year in league.points_archive.years():
+                self._write_archived_points(league, year)
+            self._write_points(league.points_table)
+            self._write_events(league)
+
+    def record_race(self, league):
+        """Son yarışı ve değişen pilot satırlarını tek işlemde ekler."""
+        if not self._same_universe(league): return self.save(league)
+        with self.conn:
+            self._write_race(league.current_year, league.current_race_idx - 1, league.race_history[-1])
+            self._write_drivers(league.drivers, "active")
+            self._write_teams(league)
+            self._write_meta(league)
+            self._write_points(league.points_table)
+            self._write_events(league)
+
+    def record_season(self, league):
+        """Sezon geçişi: ödüller, gelişim, transferler ve Şöhretler Müzesi tek işlemde."""
+        if not self._same_universe(league): return self.save(league)
+        with self.conn:
+            self._write_drivers(league.drivers, "active")
+            # Emekliler değişmez; sadece bu sezon ayrılanlar yazılır
+            (written,) = self.conn.execute("SELECT COUNT(*) FROM drivers WHERE status = 'retired'").fetchone()
+            self._write_drivers(league.retired_drivers.iter_from(written), "retired", start=written)
+            self._write_teams(league)
+            self._write_meta(league)
+            if league.points_archive.years():
+                self._write_archived_points(league, league.points_archive.years()[-1])
+            self._write_points(league.points_table)
+            self._write_events(league)
+            if league.hall_of_fame:
+                h = league.hall_of_fame[-1]
+                self.conn.execute("INSERT OR REPLACE INTO hall_of_fame VALUES (?, ?, ?, ?)", (h["Yıl"], h["Şampiyon"], h["Takım"], h["Puan"]))
+
+    # --- Okuma ---
+    def race_history(self, year, circuits_by_name=None):
+        """Bir sezonun yarış kayıtlarını (UI'daki race_history biçiminde) diskten okur."""
+        circuits_by_name = circuits_by_name or {n: Circuit(n, f) for n, f in self.conn.execute("SELECT name, focus_factor FROM circuits")}
+        history = []
+        races = self.conn.execute("SELECT race_idx, circuit, winner, logs FROM races WHERE year = ? ORDER BY race_idx", (year,)).fetchall()
+        for race_idx, circuit_name, winner, logs in races:
+            results = self.conn.execute("SELECT position, driver, team, points, status FROM race_results WHERE year = ? AND race_idx = ? ORDER BY seq",
+                                        (year, race_idx)).fetchall()
+            qual = self.conn.execute("SELECT position, driver, score FROM qualifying WHERE year = ? AND race_idx = ? ORDER BY position",
+                                     (year, race_idx)).fetchall()
+            history.append({"circuit": circuits_by_name[circuit_name], "logs": json.loads(logs),
+                            "race_data": _race_data_from_rows(results),
+                            "qual_data": [{"Sıra": p, "Pilot": n, "Skor": s} for p, n, s in qual],
+                            "winner_name": winner})
+        return history
+
+    def seasons(self):
+        return [y for (y,) in self.conn.execute("SELECT DISTINCT year FROM races ORDER BY year")]
+
+    def load(self):
+        meta = {k: json.loads(v) for k, v in self.conn.execute("SELECT key, value FROM meta")}
+        if meta.get("schema_version") != SCHEMA_VERSION:
+            raise ValueError(f"Kayıt dosyasının şema sürümü {meta.get('schema_version')}; bu sürüm sadece {SCHEMA_VERSION} okuyabilir")
+        circuits_by_name = {n: Circuit(n, f) for n, f in self.conn.execute("SELECT name, focus_factor FROM circuits")}
+
+        store = DriverStore()
+        active, retired = {}, {}
+        cols = ", ".join(("row", "name", "team", "category") + DRIVER_COLUMNS + ("achievements", "specific_race_wins", "status", "position"))
+        placeholder_rng = random.Random(0)
+        for values in self.conn.execute(f"SELECT {cols} FROM drivers ORDER BY row"):
+            row, name, team, category = values[:4]
+            d = Driver(name, team, 0, 0, 0, 0, rng=placeholder_rng, store=store)
+            if d.row != row: raise ValueError(f"Kayıt dosyası bozuk: sürücü satırları kesintisiz değil (satır {d.row} beklenirken {row} bulundu)")
+            d.category = category
+            for c, v in zip(DRIVER_COLUMNS, values[4:4 + len(DRIVER_COLUMNS)]):
+                setattr(d, c, v)
+            achievements, race_wins, status, position = values[4 + len(DRIVER_COLUMNS):]
+            if achievements: store.achievement_codes[row] = json.loads(achievements)
+            if race_wins: store.specific_race_wins[row] = json.loads(race_wins)
+            (active if status == "active" else retired)[position] = d
+        # Aynı isimle geri dönen pilotlarda isim araması aktif kaydı göstermeli
+        for d in active.values(): store.by_name[d.name] = d.row
+
+        teams = []
+        for name, _, season_points, driver_rows in self.conn.execute("SELECT * FROM teams ORDER BY position"):
+            t = Team(name)
+            t.season_points = season_points
+            t.drivers = [store.views[r] for r in json.loads(driver_rows)]
+            teams.append(t)
+
+        league = League([active[i] for i in sorted(active)], teams, [circuits_by_name[n] for n in meta["calendar"]],
+                        current_year=meta["current_year"], rookie_pool=[tuple(r) for r in meta["rookie_pool"]],
+                        seed=meta["seed"], store=store)
+        league.retired_drivers = RetiredArchive(RetiredDriver.freeze(retired[i]) for i in sorted(retired))
+        for d in retired.values(): store.release(d.row)
+        store.compact()
+        league.current_race_idx = meta["current_race_idx"]
+        league.power_rank_map = meta["power_rank_map"]
+        league.track_winners = meta["track_winners"]
+        league.transfer_log = meta["transfer_log"]
+        league.development_history = meta["development_history"]
+        league.all_winners = [tuple(w) for w in meta["all_winners"]]
+        league.all_poles = [tuple(p) for p in meta["all_poles"]]
+        self._load_points(league)
+        league.hall_of_fame = HistoryLog({"Yıl": y, "Şampiyon": c, "Takım": t, "Puan": p}
+                                         for y, c, t, p in self.conn.execute("SELECT * FROM hall_of_fame ORDER BY year"))
+        # Geçmiş sezonlar belleğe alınmaz; sadece güncel sezonun yarışları yüklenir
+        league.race_history = self.race_history(league.current_year, circuits_by_name)
+        league.rebuild_standings()
+        league.rebuild_leaderboards()
+        self._load_events(league)
+        # Piyasa tohumundan yeniden üretilir; sadece alınan adaylar saklıdır
+        if meta.get("market") is not None: TransferMarket.from_state(meta["market"]).attach(league)
+        if meta.get("lap_model_laps") is not None: LapModel(meta["lap_model_laps"]).attach(league)
+        return league
+
+    def _load_points(self, league):
+        archive = PointsArchive()
+        current = None
+        for year, names, rows, n_races, filled, typecode, blob in self.conn.execute("SELECT * FROM points_history ORDER BY year"):
+            table = SeasonPoints.unpack(year, json.loads(names), json.loads(rows), n_races, filled, typecode, blob)
+            if year == league.current_year: current = table
+            else: archive.add(table)
+        if current is not None: league.points_table = current
+        league.points_archive = archive
+
+    def _load_events(self, league):
+        symbols = [text for (text,) in self.conn.execute("SELECT text FROM event_symbols ORDER BY id")]
+        rows = self.conn.execute("SELECT kind, year, race, driver, a, b FROM events ORDER BY seq")
+        log = EventLog.restore(symbols, rows)
+        # Günlük bağlı değilken kaydedilen evren günlüksüz yüklenir
+        if len(log): league.events = log
+
+def open_storage(path):
+    return SQLiteStorage(path)
+
+def storage_exists(path):
+    if not os.path.exists(path): return False
+    storage = SQLiteStorage(path)
+    try: return storage.exists()
+    finally: storage.close()
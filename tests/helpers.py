@@ -0,0 +1,17 @@
+from f1_engine import run_next_race, start_new_season_logic
+
+def advance(league, n_races):
+    """`n_races` yarış koşar; sezon bitince yeni sezona geçer (bkz. BranchManager.advance)."""
+    for _ in range(n_races):
+        if league.season_finished: start_new_season_logic(league)
+        run_next_race(league)
+    return league
+
+def history(league):
+    """Karşılaştırma için evrenin tarihçesi: şampiyonlar, sezon içi yarışlar ve tüm pilotların kariyerleri."""
+    careers = [(d.row, d.name, d.team, d.career_races, d.career_wins, d.career_poles, d.career_podiums, d.career_dnfs,
+                d.career_titles, round(d.overall_power, 9), list(d.achievements), dict(d.specific_race_wins))
+               for d in league.all_drivers()]
+    races = [(r["circuit"].name, r["winner_name"], r["race_data"], r["qual_data"]) for r in league.race_history]
+    return (list(league.hall_of_fame), league.current_year, league.current_race_idx, races, careers,
+            [(d.name, d.season_points) for d in league.standings.ordered()], league.points_history, list(league.rookie_pool))
@@ -0,0 +1,27 @@
+from f1_engine import new_league
+
+from helpers import advance, history
+
+def test_memory_stays_flat_with_spill(tmp_path):
+    league = new_league(seed=16)
+    league.retired_drivers.enable_spill(str(tmp_path / "retired.db"), spill_at=16)
+    sizes = []
+    for _ in range(60):
+        advance(league, len(league.circuits))
+        sizes.append(len(league.store))
+        assert league.retired_drivers.in_memory < 16
+    assert len(league.retired_drivers) > 40
+    # Mağaza sadece en eski aktif pilottan bu yana açılan satırları tutar
+    assert max(sizes[20:]) <= max(sizes[:20])
+    assert league.store.base == min(d.row for d in league.drivers)
+
+def test_compacted_store_keeps_history():
+    spilled, plain = new_league(seed=16), new_league(seed=16)
+    spilled.retired_drivers.enable_spill(":memory:", spill_at=4)
+    plain.store.compact = lambda: 0  # karşılaştırma için sıkıştırılmayan mağaza
+    for _ in range(15):
+        advance(spilled, len(spilled.circuits))
+        advance(plain, len(plain.circuits))
+    assert spilled.store.base > 0
+    assert history(spilled) == history(plain)
+    assert [d.row for d in spilled.drivers] == [d.row for d in plain.drivers]
@@ -0,0 +1,32 @@
+import numpy as np
+
+from f1_batch import simulate_races_batch
+from f1_engine import SeedStream, new_league, simulate_race_outcome
+
+N_SCALAR = 3000
+N_BATCH = 20000
+
+def test_batch_rates_match_scalar_path():
+    league = new_league(seed=3)
+    drivers, circuit = league.drivers, league.circuits[0]
+    index = {d.row: i for i, d in enumerate(drivers)}
+    batch = simulate_races_batch(drivers, circuit, N_BATCH, rng=np.random.default_rng(5))
+
+    wins, poles = np.zeros(len(drivers)), np.zeros(len(drivers))
+    for i in range(N_SCALAR):
+        outcome = simulate_race_outcome(drivers, circuit, rng=SeedStream(11, ("race", i)))
+        poles[index[outcome.pole_sitter.row]] += 1
+        if outcome.winner is not None: wins[index[outcome.winner.row]] += 1
+
+    batch_wins = np.bincount(batch.order[batch.n_finishers > 0, 0], minlength=len(drivers)) / N_BATCH
+    batch_poles = np.bincount(batch.pole, minlength=len(drivers)) / N_BATCH
+    for scalar, vector in ((wins / N_SCALAR, batch_wins), (poles / N_SCALAR, batch_poles)):
+        # İki örneklemin farkı için ~5 standart sapma
+        sigma = np.sqrt(vector * (1 - vector) * (1 / N_SCALAR + 1 / N_BATCH))
+        assert np.all(np.abs(scalar - vector) <= 5 * sigma + 1e-3)
+
+def test_batch_does_not_touch_counters():
+    league = new_league(seed=3)
+    before = [(d.career_races, d.wins, d.poles) for d in league.drivers]
+    simulate_races_batch(league.drivers, league.circuits[0], 100, rng=np.random.default_rng(0))
+    assert [(d.career_races, d.wins, d.poles) for d in league.drivers] == before
@@ -0,0 +1,9 @@
+from f1_dynasty import run_universe
+
+def test_title_only_prunes_only_the_final_season():
+    for seed in (1, 2, 3):
+        full, pruned = run_universe(seed, 8), run_universe(seed, 8, title_only=True)
+        assert [(h["Şampiyon"], h["Takım"]) for h in pruned.hall_of_fame] == [(h["Şampiyon"], h["Takım"]) for h in full.hall_of_fame]
+        # Son sezondan önceki sezonlar tam koşulur; puanları birebir aynıdır
+        years = full.points_archive.years()[:-1]
+        assert [pruned.points_archive.finals[y] for y in years] == [full.points_archive.finals[y] for y in years]
@@ -0,0 +1,32 @@
+from f1_engine import new_league
+from f1_events import CAREER_COUNTERS, EventLog, replay
+
+from helpers import advance
+
+def career(driver): return {c: getattr(driver, c) for c in CAREER_COUNTERS}
+
+def test_replay_matches_live_counters():
+    league = new_league(seed=8)
+    EventLog().attach(league)
+    advance(league, 70)
+    state = replay(league.events)
+    for d in league.all_drivers():
+        assert state.career_stats(d.row) == career(d), d.name
+    assert state.standings() == [(d.name, d.season_points) for d in league.standings.ordered()]
+
+def test_replay_after_attaching_midway():
+    league = new_league(seed=8)
+    advance(league, 30)
+    EventLog().attach(league)  # sonradan bağlanan günlük: sayaçlar taban olayı olarak yazılır
+    advance(league, 40)
+    state = replay(league.events)
+    assert all(state.career_stats(d.row) == career(d) for d in league.all_drivers())
+
+def test_replay_until_stops_before_race():
+    league = new_league(seed=8)
+    EventLog().attach(league)
+    advance(league, 25)
+    year, race = league.current_year, league.current_race_idx
+    standings = [(d.name, d.season_points) for d in league.standings.ordered()]
+    advance(league, 5)
+    assert replay(league.events, until=(year, race)).standings() == standings
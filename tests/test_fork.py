@@ -0,0 +1,40 @@
+from f1_engine import new_league
+from f1_events import CAREER_COUNTERS, CHUNK_SIZE, EventLog, replay
+
+from helpers import advance, history
+
+def make_league(seed):
+    league = new_league(seed=seed)
+    EventLog().attach(league)
+    return advance(league, 30)
+
+def test_fork_leaves_parent_unchanged():
+    parent = make_league(13)
+    before = history(parent), list(parent.events), list(parent.retired_drivers)
+    fork = parent.fork(seed=99)
+    advance(fork, 60)
+    assert history(fork) != before[0]
+    assert (history(parent), list(parent.events), list(parent.retired_drivers)) == before
+
+def test_same_seed_fork_replays_parent():
+    parent = make_league(13)
+    fork = parent.fork()
+    advance(parent, 40)
+    advance(fork, 40)
+    assert history(fork) == history(parent)
+    assert list(fork.events) == list(parent.events)
+
+def test_replay_on_fork():
+    fork = make_league(8).fork()
+    advance(fork, 40)
+    state = replay(fork.events)
+    for d in fork.all_drivers():
+        assert state.career_stats(d.row) == {c: getattr(d, c) for c in CAREER_COUNTERS}, d.name
+
+def test_fork_does_not_split_parent_chunks():
+    league = new_league(seed=8)
+    EventLog().attach(league)
+    for _ in range(40):
+        league.fork()  # UI her yarıştan önce kontrol noktası alır
+        advance(league, 1)
+    assert len(league.events.chunks) == -(-len(league.events) // CHUNK_SIZE)
@@ -0,0 +1,25 @@
+from f1_engine import CareerLeaderboards, new_league
+
+from helpers import advance
+
+def full_sort(league, metric, k):
+    drivers = list(league.all_drivers())
+    if metric == "career_dnfs":
+        eligible = [d for d in drivers if d.career_races >= CareerLeaderboards.MIN_RACES_FOR_DNF]
+        ranked = sorted(eligible, key=lambda d: d.career_dnfs)
+    else: ranked = sorted(drivers, key=lambda d: getattr(d, metric), reverse=True)
+    return [(d.row, getattr(d, metric)) for d in ranked[:k]]
+
+def test_top_k_matches_full_sort():
+    league = new_league(seed=14)
+    for _ in range(12):
+        advance(league, len(league.circuits))
+        for metric in CareerLeaderboards.METRICS + ("career_dnfs",):
+            for k in (1, 10, 40):
+                assert [(e.row, e.value) for e in league.leaderboards.top(metric, k)] == full_sort(league, metric, k), metric
+
+def test_rebuilt_leaderboards_match_incremental():
+    league = advance(new_league(seed=14), 150)
+    incremental = {m: league.leaderboards.top(m, 20) for m in CareerLeaderboards.METRICS}
+    league.rebuild_leaderboards()
+    assert {m: league.leaderboards.top(m, 20) for m in CareerLeaderboards.METRICS} == incremental
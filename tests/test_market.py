@@ -0,0 +1,54 @@
+from f1_engine import new_league
+from f1_market import ATTRIBUTES, TransferMarket, player_value
+
+from helpers import advance
+
+def make_league(seed):
+    league = new_league(seed=seed)
+    TransferMarket.for_league(league, size=20_000).attach(league)
+    return advance(league, 200)
+
+def available(market, max_value=None):
+    taken = set(market.state()["taken"])
+    rows = [market.prospect(i) for i in range(market.size) if i not in taken]
+    if max_value is not None: rows = [r for r in rows if player_value(r["overall_power"]) <= max_value * (1 + 1e-9)]
+    return rows
+
+def test_top_by_matches_full_scan():
+    market = make_league(6).market
+    taken = set(market.state()["taken"])
+    assert taken and len(market) == market.size - len(taken)
+    for max_value in (None, 5.0, 12.0):
+        rows = available(market, max_value)
+        for attribute in ATTRIBUTES + ("overall_power",):
+            expected = sorted((r[attribute] for r in rows), reverse=True)
+            for k in (1, 20, 300):
+                found = market.top_by(attribute, k, max_value)
+                # Eşit değerli adayların sırası indekse bağlıdır; değerler ve kısıtlar karşılaştırılır
+                assert [r[attribute] for r in found] == expected[:k], (attribute, k, max_value)
+                assert len({r["id"] for r in found}) == len(found) and not taken & {r["id"] for r in found}
+                if max_value is not None: assert all(r["value"] <= max_value + 0.05 for r in found)
+
+def test_best_is_top_overall_within_budget():
+    market = make_league(6).market
+    for max_value in (None, 6.0, 10.0, 24.0):
+        assert market.best(max_value) == market.top_by("overall_power", 1, max_value)[0]
+    assert market.best(max_value=0.1) is None
+
+def test_state_round_trip_and_fork():
+    league = make_league(9)
+    market = league.market
+    restored = TransferMarket.from_state(market.state())
+    assert len(restored) == len(market)
+    assert restored.top_by("braking", 50, 12.0) == market.top_by("braking", 50, 12.0)
+    fork = league.fork()
+    advance(fork, 100)
+    assert len(fork.market) < len(market)
+    assert market.state() == restored.state()
+
+def test_active_names_stay_unique():
+    league = make_league(17)
+    for _ in range(15):
+        advance(league, len(league.circuits))
+        names = [d.name for d in league.drivers]
+        assert len(set(names)) == len(names)
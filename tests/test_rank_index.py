@@ -0,0 +1,44 @@
+import random
+
+from f1_engine import RankIndex, new_league
+
+from helpers import advance
+
+def stable_order(entries):
+    # Büyük değer önde, eşitlikte önce eklenen önde: sorted(..., reverse=True) ile aynı
+    return [key for key, _ in sorted(entries.items(), key=lambda kv: -kv[1])]
+
+def test_order_matches_stable_sort():
+    rng = random.Random(1)
+    index, entries = RankIndex(capacity=4), {}
+    for key in range(40):
+        value = rng.randint(0, 30)
+        index.insert(key, value, key)
+        entries[key] = value
+    for _ in range(500):
+        key = rng.randrange(40)
+        value = max(0, entries[key] + rng.choice((0, 1, 7, 25, -3)))
+        index.update(key, value)
+        entries[key] = value
+        order = stable_order(entries)
+        assert index.top(len(index)) == order
+        assert index.rank(key) == order.index(key) + 1
+        assert index.at(5) == order[4]
+        assert index.bottom(3) == order[-3:]
+
+def test_remove_and_reinsert():
+    index = RankIndex()
+    for key, value in enumerate((5, 9, 5, 0, 9)): index.insert(key, value, key)
+    index.remove(1)
+    assert index.top(len(index)) == [4, 0, 2, 3]
+    index.insert(1, 5, 1)
+    assert index.top(len(index)) == [4, 0, 1, 2, 3]
+    assert 3 in index and len(index) == 5
+
+def test_standings_follow_points():
+    league = new_league(seed=12)
+    for _ in range(30):
+        advance(league, 1)
+        expected = sorted(league.drivers, key=lambda d: d.season_points, reverse=True)
+        assert [d.row for d in league.standings.ordered()] == [d.row for d in expected]
+        assert league.standings.leader().row == expected[0].row
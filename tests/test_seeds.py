@@ -0,0 +1,19 @@
+from f1_engine import SeedStream, new_league
+
+from helpers import advance, history
+
+def test_same_seed_same_history():
+    a, b = new_league(seed=5), new_league(seed=5)
+    advance(a, 60)
+    advance(b, 60)
+    assert history(a) == history(b)
+    assert history(advance(new_league(seed=6), 60)) != history(a)
+
+def test_streams_are_keyed_not_ordered():
+    # Bir akış, kardeş akışlardan ne kadar çekildiğinden bağımsızdır
+    root = SeedStream(7)
+    first = root.spawn("season", 2030).random().random()
+    root.spawn("season", 2029).random().random()
+    assert root.spawn("season", 2030).random().random() == first
+    assert root.spawn("season", 2031).random().random() != first
+    assert SeedStream(7, ("x",)).numpy().random() == SeedStream(7).spawn("x").numpy().random()
@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+from f1_engine import new_league
+from f1_events import EventLog
+from f1_laps import LapModel
+from f1_market import TransferMarket
+from f1_storage import SCHEMA_VERSION, open_storage
+
+from helpers import advance, history
+
+def make_league(seed):
+    league = new_league(seed=seed)
+    EventLog().attach(league)
+    TransferMarket.for_league(league, size=20_000).attach(league)
+    return league
+
+def test_save_load_continue_matches_uninterrupted(tmp_path):
+    path = str(tmp_path / "universe.db")
+    live = advance(make_league(21), 30)
+    storage = open_storage(path)
+    storage.save(live)
+    loaded = storage.load()
+    assert history(loaded) == history(live)
+    advance(live, 40)
+    advance(loaded, 40)
+    assert history(loaded) == history(live)
+    assert list(loaded.events) == list(live.events)
+
+def test_incremental_records_round_trip(tmp_path):
+    storage = open_storage(str(tmp_path / "universe.db"))
+    league = make_league(4)
+    storage.save(league)
+    for _ in range(30):
+        advance(league, 1)
+        # Sezon geçişi advance içinde olur; yarış kaydı her ikisinin sonrasını da yazar
+        if league.current_race_idx == 1: storage.record_season(league)
+        storage.record_race(league)
+    assert history(storage.load()) == history(league)
+
+def test_resave_drops_other_timeline(tmp_path):
+    storage = open_storage(str(tmp_path / "universe.db"))
+    storage.save(advance(make_league(9), 40))
+    # Aynı tohum, farklı (tur tur) ve daha kısa bir zaman çizgisi
+    other = make_league(9)
+    LapModel().attach(other)
+    advance(other, 5)
+    storage.save(other)
+    loaded = storage.load()
+    assert history(loaded) == history(other)
+    assert loaded.lap_model is not None and storage.seasons() == [other.current_year]
+
+def test_corrupt_rows_raise(tmp_path):
+    storage = open_storage(str(tmp_path / "universe.db"))
+    storage.save(make_league(2))
+    with storage.conn: storage.conn.execute("DELETE FROM drivers WHERE row = 3")
+    with pytest.raises(ValueError):
+        storage.load()
+
+def test_schema_version_mismatch_raises(tmp_path):
+    storage = open_storage(str(tmp_path / "universe.db"))
+    storage.save(make_league(2))
+    with storage.conn: storage.conn.execute("UPDATE meta SET value = ? WHERE key = 'schema_version'", (json.dumps(SCHEMA_VERSION - 1),))
+    with pytest.raises(ValueError):
+        storage.load()
+    # Eski biçimli dosyaya artımlı kayıt yapılmaz; tam kayıt dosyayı yeni biçimle yazar
+    league = advance(make_league(2), 1)
+    storage.record_race(league)
+    assert storage.stored_version() == SCHEMA_VERSION
+    assert history(storage.load()) == history(league)
+
+def test_league_without_event_log_loads_without_one(tmp_path):
+    storage = open_storage(str(tmp_path / "universe.db"))
+    league = advance(new_league(seed=3), 5)
+    storage.save(league)
+    loaded = storage.load()
+    assert loaded.events is None and history(loaded) == history(league)